@@ -1,8 +1,14 @@
+import numpy as np
 import pandas as pd
 from rich.console import Console
 
+from alpha_platform.backtest.rebalance import RebalancePolicy, _sparse_loop, rebalance_schedule
+from alpha_platform.profiling import span
+
 console = Console()
 
+ENGINES = ("numpy", "pandas")
+
 
 def prepare_wide_matrices(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
@@ -12,21 +18,48 @@ def prepare_wide_matrices(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]
     if 'target_weight' not in df.columns:
         raise ValueError("DataFrame must contain a 'target_weight' column. Run a signal generator first.")
 
-    prices = df.pivot(index='Date', columns='Ticker', values='Close').ffill()
-    target_weights = df.pivot(index='Date', columns='Ticker', values='target_weight').fillna(0.0)
+    with span("engine.pivot_prices"):
+        prices = prepare_prices(df)
+    with span("engine.pivot_weights"):
+        target_weights = pivot_target_weights(df, prices)
+
+    return prices, target_weights
+
+
+def pivot_target_weights(df: pd.DataFrame, prices: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pivots the 'target_weight' column into a (Dates x Tickers) matrix aligned with `prices`.
+    """
+    target_weights = df.pivot(index='Date', columns='Ticker', values='target_weight')
+    return align_weights(target_weights, prices)
+
 
+def align_weights(target_weights: pd.DataFrame, prices: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aligns a (Dates x Tickers) weight matrix from the wide signal API with the price matrix.
+    Missing weights mean 'hold nothing' (0.0).
+    """
     # Align the indices perfectly to prevent any matrix shape mismatches
-    target_weights = target_weights.reindex(index=prices.index, columns=prices.columns).fillna(0.0)
+    return target_weights.reindex(index=prices.index, columns=prices.columns).fillna(0.0)
 
-    return prices, target_weights
+
+def prepare_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pivots Close into the forward-filled (Dates x Tickers) price matrix used by the engine.
+    """
+    return df.pivot(index='Date', columns='Ticker', values='Close').ffill()
 
 
-def run_iterative_backtest(df: pd.DataFrame, initial_capital: float = 100_000.0, cost_bps: float = 5.0) -> pd.DataFrame:
+def _pandas_loop(
+        prices: pd.DataFrame,
+        target_weights: pd.DataFrame,
+        initial_capital: float,
+        cost_rate: float
+) -> tuple[list[float], list[float]]:
     """
-    Runs a Wide-Matrix Iterative backtest.
-    Strictly steps through time to accurately model compounding and transaction costs.
+    Reference implementation of the daily loop using pandas Series state.
+    Kept for readability and as the ground truth the NumPy kernel is tested against.
     """
-    prices, target_weights = prepare_wide_matrices(df)
     dates = prices.index
     tickers = prices.columns
 
@@ -38,10 +71,6 @@ def run_iterative_backtest(df: pd.DataFrame, initial_capital: float = 100_000.0,
     history_portfolio_value = []
     history_turnover_pct = []
 
-    cost_rate = cost_bps / 10000.0
-
-    console.print(f"Starting iteration over {len(dates)} trading days...")
-
     # --- The Core Iterative Loop ---
     for t in range(len(dates)):
         current_prices = prices.iloc[t].fillna(0.0)
@@ -87,15 +116,165 @@ def run_iterative_backtest(df: pd.DataFrame, initial_capital: float = 100_000.0,
         history_portfolio_value.append(end_of_day_value)
         history_turnover_pct.append(turnover_pct)
 
-    # --- Post-Processing Results ---
+    return history_portfolio_value, history_turnover_pct
+
+
+def _numpy_loop(
+        prices: np.ndarray,
+        target_weights: np.ndarray,
+        initial_capital: float,
+        cost_rate: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array-backed kernel of the daily loop.
+    Performs exactly the same floating point operations, in the same order, as `_pandas_loop`
+    but keeps all state in preallocated NumPy buffers so no pandas objects are touched per day.
+
+    Args:
+        prices: (Dates x Tickers) float64 matrix with missing prices already filled with 0.0.
+        target_weights: (Dates x Tickers) float64 matrix aligned with `prices`.
+    """
+    n_dates, n_assets = prices.shape
+
+    # --- Initialize State Variables ---
+    cash = initial_capital
+    shares_held = np.zeros(n_assets)
+
+    # --- Preallocated Buffers (reused every day) ---
+    target_capital = np.empty(n_assets)
+    target_shares = np.empty(n_assets)
+    trades_capital = np.empty(n_assets)
+    scratch = np.empty(n_assets)
+    valid_prices = np.empty(n_assets, dtype=bool)
+
+    # --- Tracking Arrays ---
+    history_portfolio_value = np.empty(n_dates)
+    history_turnover_pct = np.empty(n_dates)
+
+    for t in range(n_dates):
+        current_prices = prices[t]
+
+        # 1. Mark-to-Market
+        np.multiply(shares_held, current_prices, out=scratch)
+        portfolio_value = cash + scratch.sum()
+
+        # 2-4. Target capital and target shares (0.0 where the price is missing)
+        np.multiply(target_weights[t], portfolio_value, out=target_capital)
+        np.greater(current_prices, 0, out=valid_prices)
+        target_shares.fill(0.0)
+        np.divide(target_capital, current_prices, out=target_shares, where=valid_prices)
+
+        # 5. Trades (Delta Shares) valued at today's prices
+        np.subtract(target_shares, shares_held, out=trades_capital)
+        np.multiply(trades_capital, current_prices, out=trades_capital)
+
+        # 6. Turnover and Costs
+        np.abs(trades_capital, out=scratch)
+        traded_value = scratch.sum()
+        costs = traded_value * cost_rate
+        turnover_pct = (traded_value / portfolio_value) if portfolio_value > 0 else 0.0
+
+        # 7. Update State for Tomorrow (swap buffers instead of allocating)
+        cash = cash - trades_capital.sum() - costs
+        shares_held, target_shares = target_shares, shares_held
+
+        # 8. Record end-of-day stats
+        np.multiply(shares_held, current_prices, out=scratch)
+        history_portfolio_value[t] = cash + scratch.sum()
+        history_turnover_pct[t] = turnover_pct
+
+    return history_portfolio_value, history_turnover_pct
+
+
+def run_wide_backtest(
+        prices: pd.DataFrame,
+        target_weights: pd.DataFrame,
+        initial_capital: float = 100_000.0,
+        cost_bps: float = 5.0,
+        engine: str = "numpy",
+        rebalance: RebalancePolicy | None = None
+) -> pd.DataFrame:
+    """
+    Runs the iterative simulation on already-pivoted (Dates x Tickers) price and weight matrices.
+    Weight matrices from the wide signal API are accepted as-is and aligned to the prices.
+
+    Args:
+        engine: 'numpy' for the array-backed kernel or 'pandas' for the reference loop.
+            Both produce bit-identical results.
+        rebalance: Optional no-trade band / calendar policy. When given, the sparse NumPy
+            kernel only trades assets outside their band on scheduled days, and the results
+            gain a 'rebalanced' column. None trades every asset to target every day.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of {ENGINES}.")
+    if rebalance is not None and engine != "numpy":
+        raise ValueError("Rebalance policies are only supported by the 'numpy' engine.")
+
+    with span("engine.align_weights"):
+        target_weights = align_weights(target_weights, prices)
+    dates = prices.index
+    cost_rate = cost_bps / 10000.0
+
+    console.print(f"Starting iteration over {len(dates)} trading days...")
+
+    if rebalance is not None:
+        with span("engine.to_numpy"):
+            price_matrix = prices.fillna(0.0).to_numpy(dtype=np.float64)
+            weight_matrix = target_weights.to_numpy(dtype=np.float64)
+        with span("engine.sparse_loop", days=len(dates)):
+            schedule = rebalance_schedule(dates, rebalance.frequency)
+            equity, turnover, rebalanced = _sparse_loop(
+                price_matrix, weight_matrix, initial_capital, cost_rate, rebalance, schedule
+            )
+        with span("engine.build_results"):
+            return build_results(dates, equity, turnover, initial_capital, rebalanced)
+    elif engine == "pandas":
+        with span("engine.loop", engine=engine, days=len(dates)):
+            equity, turnover = _pandas_loop(prices, target_weights, initial_capital, cost_rate)
+    else:
+        with span("engine.to_numpy"):
+            price_matrix = prices.fillna(0.0).to_numpy(dtype=np.float64)
+            weight_matrix = target_weights.to_numpy(dtype=np.float64)
+        with span("engine.loop", engine=engine, days=len(dates)):
+            equity, turnover = _numpy_loop(price_matrix, weight_matrix, initial_capital, cost_rate)
+
+    with span("engine.build_results"):
+        return build_results(dates, equity, turnover, initial_capital)
+
+
+def build_results(dates, equity, turnover, initial_capital: float, rebalanced=None) -> pd.DataFrame:
+    """
+    Assembles the per-day results frame (equity, turnover, net_ret, cumulative_net) indexed by Date.
+    `rebalanced` (per-day trade flags from a rebalance policy) is added as a column when given.
+    """
     results = pd.DataFrame({
         'Date': dates,
-        'equity': history_portfolio_value,
-        'turnover': history_turnover_pct
+        'equity': equity,
+        'turnover': turnover
     }).set_index('Date')
 
     # Calculate daily net returns from the equity curve
     results['net_ret'] = results['equity'].pct_change().fillna(0.0)
     results['cumulative_net'] = results['equity'] / initial_capital
+    if rebalanced is not None:
+        results['rebalanced'] = rebalanced
+
+    return results
 
-    return results
\ No newline at end of file
+
+def run_iterative_backtest(
+        df: pd.DataFrame,
+        initial_capital: float = 100_000.0,
+        cost_bps: float = 5.0,
+        engine: str = "numpy",
+        rebalance: RebalancePolicy | None = None
+) -> pd.DataFrame:
+    """
+    Runs a Wide-Matrix Iterative backtest.
+    Strictly steps through time to accurately model compounding and transaction costs.
+    """
+    prices, target_weights = prepare_wide_matrices(df)
+    return run_wide_backtest(
+        prices, target_weights, initial_capital=initial_capital, cost_bps=cost_bps, engine=engine,
+        rebalance=rebalance
+    )
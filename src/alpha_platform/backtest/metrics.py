@@ -0,0 +1,304 @@
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+DEFAULT_WINDOW = 63
+
+# Tidy multi-run tables (sweep / grid) and the column identifying each run in them
+RUN_KEYS = ('scenario_id', 'run_id')
+RUN_METADATA = ['strategy', 'cost_bps', 'initial_capital', 'start_date', 'end_date']
+
+
+@dataclass
+class ResultsPanel:
+    """
+    Many backtest runs side by side: every metric is one vectorized pass over all columns.
+
+    Attributes:
+        equity: (Dates x Runs) end-of-day equity. Runs over a shorter window are NaN outside it.
+        turnover: (Dates x Runs) traded value as a fraction of the pre-trade portfolio value.
+        runs: One row per run (same order as the columns) with at least 'initial_capital' and
+            'cost_bps' (NaN when unknown, which leaves the cost attribution empty).
+    """
+    equity: pd.DataFrame
+    turnover: pd.DataFrame
+    runs: pd.DataFrame
+
+    @cached_property
+    def returns(self) -> pd.DataFrame:
+        """
+        Daily net returns. The first day of each run is measured against its initial capital,
+        so day-one trading costs count and compounding the returns gives the total return.
+        """
+        previous = self.equity.shift(1).fillna(self.runs['initial_capital'])
+        return self.equity / previous - 1
+
+    @cached_property
+    def costs(self) -> pd.DataFrame:
+        """
+        Transaction costs paid each day, in currency.
+
+        The engine charges `traded_value * cost_rate` and records `traded_value / V` with V the
+        pre-trade value, so V = equity / (1 - turnover * cost_rate) recovers the costs exactly.
+        """
+        charged = self.turnover * (self.runs['cost_bps'] / 10_000.0)
+        return self.equity * charged / (1 - charged)
+
+    @cached_property
+    def cost_returns(self) -> pd.DataFrame:
+        """Return given up to costs each day (gross return minus net return)."""
+        previous = self.equity.shift(1).fillna(self.runs['initial_capital'])
+        return self.costs / previous
+
+    @property
+    def gross_returns(self) -> pd.DataFrame:
+        return self.returns + self.cost_returns
+
+    @cached_property
+    def drawdown(self) -> pd.DataFrame:
+        """Fractional distance below the running equity peak (0 at a new high, negative below)."""
+        return self.equity / self.equity.cummax() - 1
+
+    @cached_property
+    def underwater_days(self) -> pd.DataFrame:
+        """Trading days since the last equity peak (0 on a new high)."""
+        equity = self.equity.to_numpy()
+        at_peak = ~(self.drawdown.to_numpy() < 0)  # NaN days count as peaks, masked below
+        steps = np.arange(len(equity))[:, None]
+        last_peak = np.maximum.accumulate(np.where(at_peak, steps, 0), axis=0)
+        days = np.where(np.isnan(equity), np.nan, steps - last_peak)
+        return pd.DataFrame(days, index=self.equity.index, columns=self.equity.columns)
+
+    def rolling_volatility(self, window: int = DEFAULT_WINDOW) -> pd.DataFrame:
+        """Annualized volatility of net returns over a trailing window of trading days."""
+        return self.returns.rolling(window).std() * np.sqrt(TRADING_DAYS)
+
+    def rolling_sharpe(self, window: int = DEFAULT_WINDOW) -> pd.DataFrame:
+        """Annualized Sharpe ratio (zero risk-free rate) over a trailing window."""
+        rolling = self.returns.rolling(window)
+        sharpe = rolling.mean() / rolling.std() * np.sqrt(TRADING_DAYS)
+        return sharpe.replace([np.inf, -np.inf], np.nan)
+
+
+# --- Building Panels ---
+def panel_from_frames(
+        frames: dict[str, pd.DataFrame],
+        cost_bps: float | dict[str, float] | None = None
+) -> ResultsPanel:
+    """
+    Builds a panel from single-run results frames (as returned by `run_wide_backtest`), keyed
+    by run name. The initial capital is read back from `equity / cumulative_net`.
+    """
+    if not frames:
+        raise ValueError("No results to analyze.")
+    equity = pd.DataFrame({name: frame['equity'] for name, frame in frames.items()})
+    turnover = pd.DataFrame({name: frame['turnover'] for name, frame in frames.items()})
+
+    names = list(frames)
+    if not isinstance(cost_bps, dict):
+        cost_bps = dict.fromkeys(names, np.nan if cost_bps is None else cost_bps)
+    runs = pd.DataFrame({
+        'initial_capital': [
+            (frame['equity'] / frame['cumulative_net']).iloc[0] for frame in frames.values()
+        ],
+        'cost_bps': [cost_bps.get(name, np.nan) for name in names],
+    }, index=pd.Index(names, name='run'))
+    return ResultsPanel(equity.rename_axis('Date'), turnover.rename_axis('Date'), runs)
+
+
+def panel_from_long(
+        results: pd.DataFrame,
+        key: str | None = None,
+        prefix: str = ""
+) -> ResultsPanel:
+    """
+    Builds a panel from a tidy multi-run table (`run_sweep` / `run_specs` output): one column
+    per value of `key` (auto-detected from 'scenario_id' / 'run_id'), named `<prefix><id>`.
+    The run metadata columns (strategy, costs, capital, window) are kept in `runs`.
+    """
+    key = key or next((col for col in RUN_KEYS if col in results.columns), None)
+    if key is None:
+        raise ValueError(f"Results table has none of the run key columns {list(RUN_KEYS)}.")
+
+    equity = results.pivot(index='Date', columns=key, values='equity')
+    turnover = results.pivot(index='Date', columns=key, values='turnover')
+
+    metadata = [col for col in RUN_METADATA if col in results.columns]
+    runs = results.groupby(key, sort=True)[metadata].first()
+    if 'initial_capital' not in runs.columns:
+        first = results.groupby(key, sort=True)[['equity', 'cumulative_net']].first()
+        runs['initial_capital'] = first['equity'] / first['cumulative_net']
+    if 'cost_bps' not in runs.columns:
+        runs['cost_bps'] = np.nan
+
+    names = [f"{prefix}{run_id}" for run_id in runs.index]
+    equity.columns = turnover.columns = names
+    runs.index = pd.Index(names, name='run')
+    return ResultsPanel(equity, turnover, runs.reindex(equity.columns))
+
+
+def load_panel(paths: list[Path], cost_bps: float | None = None) -> ResultsPanel:
+    """
+    Loads saved results Parquet files into one panel.
+
+    Single-run files (`backtest_results_<name>.parquet`) become a run named `<name>`; tidy
+    sweep / grid tables contribute one run per scenario, named `<file stem>#<id>`.
+    `cost_bps` fills in the costs of runs whose table does not record them.
+    """
+    panels, single = [], {}
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f"Results file not found: {path}")
+        df = pd.read_parquet(path)
+        if any(col in df.columns for col in RUN_KEYS):
+            stem = path.stem.removesuffix('_results')
+            panels.append(panel_from_long(df, prefix=f"{stem}#"))
+        else:
+            single[path.stem.removeprefix('backtest_results_')] = df
+    if single:
+        panels.append(panel_from_frames(single))
+    if not panels:
+        raise ValueError("No results to analyze.")
+
+    panel = ResultsPanel(
+        equity=pd.concat([p.equity for p in panels], axis=1).sort_index(),
+        turnover=pd.concat([p.turnover for p in panels], axis=1).sort_index(),
+        runs=pd.concat([p.runs for p in panels]),
+    )
+    if cost_bps is not None:
+        panel.runs['cost_bps'] = panel.runs['cost_bps'].fillna(cost_bps)
+    return panel
+
+
+def find_results(reports_dir: Path) -> list[Path]:
+    """Every saved backtest, sweep and grid results file in the reports directory."""
+    found = {*reports_dir.glob("backtest_results*.parquet"), *reports_dir.glob("*_results.parquet")}
+    return sorted(found)
+
+
+# --- Summary Statistics ---
+def _benchmark_stats(returns: pd.DataFrame, benchmark: pd.Series) -> pd.DataFrame:
+    """Beta, annualized alpha, tracking error and information ratio over shared valid days."""
+    R = returns.to_numpy()
+    B = np.broadcast_to(benchmark.reindex(returns.index).to_numpy()[:, None], R.shape)
+    shared = ~(np.isnan(R) | np.isnan(B))
+    R, B = np.where(shared, R, np.nan), np.where(shared, B, np.nan)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        n = shared.sum(axis=0)
+        r_mean, b_mean = np.nanmean(R, axis=0), np.nanmean(B, axis=0)
+        cov = np.nansum((R - r_mean) * (B - b_mean), axis=0) / (n - 1)
+        beta = cov / np.nanvar(B, axis=0, ddof=1)
+        excess = R - B
+        tracking = np.nanstd(excess, axis=0, ddof=1)
+        information = np.where(tracking > 1e-12, np.nanmean(excess, axis=0) / tracking, np.nan)
+
+    return pd.DataFrame({
+        'beta': beta,
+        'alpha': (r_mean - beta * b_mean) * TRADING_DAYS,
+        'tracking_error': tracking * np.sqrt(TRADING_DAYS),
+        'information_ratio': information * np.sqrt(TRADING_DAYS),
+        'correlation': returns.corrwith(benchmark).to_numpy(),
+    }, index=returns.columns)
+
+
+def summarize(panel: ResultsPanel, benchmark: str | pd.Series | None = None) -> pd.DataFrame:
+    """
+    One row of headline metrics per run, all computed column-wise over the whole panel.
+
+    Args:
+        benchmark: A run name of the panel or a daily return series. Adds beta, alpha,
+            tracking error, information ratio and correlation against it.
+
+    Returns:
+        The run metadata followed by days, total_return, cagr, annualized_vol, sharpe, sortino,
+        max_drawdown, max_underwater_days, calmar, avg_turnover, annual_turnover, total_costs
+        (fraction of initial capital), cost_drag (annualized return lost to costs) and
+        gross_sharpe.
+    """
+    returns = panel.returns
+    sqrt_year = np.sqrt(TRADING_DAYS)
+    days = returns.count()
+
+    total_return = panel.equity.ffill().iloc[-1] / panel.runs['initial_capital'] - 1
+    mean, std = returns.mean(), returns.std()
+    downside = np.sqrt((returns.clip(upper=0) ** 2).mean())
+    gross = panel.gross_returns
+    max_drawdown = panel.drawdown.min()
+    cagr = (1 + total_return) ** (TRADING_DAYS / days) - 1
+
+    def ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+        return (numerator / denominator).where(denominator > 0, 0.0)
+
+    summary = pd.DataFrame({
+        'days': days,
+        'total_return': total_return,
+        'cagr': cagr,
+        'annualized_vol': std * sqrt_year,
+        'sharpe': ratio(mean, std) * sqrt_year,
+        'sortino': ratio(mean, downside) * sqrt_year,
+        'max_drawdown': max_drawdown,
+        'max_underwater_days': panel.underwater_days.max(),
+        'calmar': ratio(cagr, -max_drawdown),
+        'avg_turnover': panel.turnover.mean(),
+        'annual_turnover': panel.turnover.mean() * TRADING_DAYS,
+        'total_costs': panel.costs.sum(min_count=1) / panel.runs['initial_capital'],
+        'cost_drag': panel.cost_returns.mean() * TRADING_DAYS,
+        'gross_sharpe': ratio(gross.mean(), gross.std()) * sqrt_year,
+    })
+
+    if benchmark is not None:
+        if isinstance(benchmark, str):
+            if benchmark not in returns.columns:
+                raise ValueError(f"Unknown benchmark run '{benchmark}'.")
+            benchmark = returns[benchmark]
+        summary = summary.join(_benchmark_stats(returns, benchmark))
+
+    return panel.runs.join(summary).rename_axis('run')
+
+
+def timeseries(panel: ResultsPanel, window: int = DEFAULT_WINDOW) -> pd.DataFrame:
+    """
+    The per-day analytics of every run in long format (Date, run, ...): net and gross returns,
+    drawdown, underwater days and the rolling Sharpe / volatility over `window` days.
+    """
+    series = {
+        'net_ret': panel.returns,
+        'gross_ret': panel.gross_returns,
+        'drawdown': panel.drawdown,
+        'underwater_days': panel.underwater_days,
+        f'rolling_sharpe_{window}d': panel.rolling_sharpe(window),
+        f'rolling_vol_{window}d': panel.rolling_volatility(window),
+    }
+    long = pd.DataFrame({
+        name: frame.rename_axis(columns='run').stack()
+        for name, frame in series.items()
+    })
+    valid = panel.equity.rename_axis(columns='run').stack().notna()
+    return long[valid].reset_index()
+
+
+def rank_summary(
+        summary: pd.DataFrame,
+        sort: str = "sharpe",
+        top: int = 20,
+        benchmark: str | None = None
+) -> pd.DataFrame:
+    """
+    The `alpha report` view of a summary: runs ranked by `sort` (best first), the top `top`
+    (0 = all), with the headline columns plus the benchmark ones when a benchmark was used.
+    """
+    if sort not in summary.columns:
+        raise ValueError(f"Unknown summary column '{sort}'.")
+    ranked = summary.sort_values(sort, ascending=sort in ('max_underwater_days', 'total_costs'))
+    shown = ranked.head(top) if top > 0 else ranked
+    columns = ['total_return', 'cagr', 'annualized_vol', 'sharpe', 'sortino', 'max_drawdown',
+               'max_underwater_days', 'avg_turnover', 'cost_drag']
+    if benchmark is not None:
+        columns += ['beta', 'tracking_error', 'information_ratio']
+    metadata = [col for col in ('strategy', 'cost_bps', 'start_date') if col in shown.columns]
+    return shown[metadata + columns]
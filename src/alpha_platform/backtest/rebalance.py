@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+BAND_TYPES = ("absolute", "relative")
+FREQUENCIES = ("daily", "weekly", "monthly")
+
+
+@dataclass(frozen=True)
+class RebalancePolicy:
+    """
+    When the engine trades back to the target weights.
+
+    Attributes:
+        band: No-trade band. A held asset is only resized when its drifted weight is further
+            than `band` from its target. Opening or closing a position always trades, so a band
+            wider than a small target weight never leaves it uninvested. 0.0 trades every
+            asset that moved at all.
+        band_type: 'absolute' (|w_target - w_current| > band) or
+            'relative' (|w_target - w_current| > band * |w_target|).
+        frequency: Days on which rebalancing is considered: 'daily', 'weekly' (first trading
+            day of each week) or 'monthly' (first trading day of each month).
+    """
+    band: float = 0.0
+    band_type: str = "absolute"
+    frequency: str = "daily"
+
+    def __post_init__(self):
+        if self.band < 0:
+            raise ValueError(f"band must be non-negative, got {self.band}.")
+        if self.band_type not in BAND_TYPES:
+            raise ValueError(f"Unknown band type '{self.band_type}'. Expected one of {BAND_TYPES}.")
+        if self.frequency not in FREQUENCIES:
+            raise ValueError(
+                f"Unknown frequency '{self.frequency}'. Expected one of {FREQUENCIES}."
+            )
+
+
+def rebalance_schedule(dates: pd.DatetimeIndex, frequency: str = "daily") -> np.ndarray:
+    """Boolean mask of the trading days on which rebalancing is considered."""
+    if frequency not in FREQUENCIES:
+        raise ValueError(f"Unknown frequency '{frequency}'. Expected one of {FREQUENCIES}.")
+    if frequency == "daily" or len(dates) == 0:
+        return np.ones(len(dates), dtype=bool)
+
+    periods = dates.to_period("W" if frequency == "weekly" else "M").asi8
+    return np.r_[True, periods[1:] != periods[:-1]]
+
+
+def _sparse_loop(
+        prices: np.ndarray,
+        target_weights: np.ndarray,
+        initial_capital: float,
+        cost_rate: float,
+        policy: RebalancePolicy,
+        schedule: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Daily loop with no-trade bands and a calendar schedule.
+
+    Only scheduled days are visited one by one. Between them, the drifted holdings are marked
+    to market for the whole block with a single matrix-vector product. On a scheduled day
+    only the assets outside their band are traded back to target; the rest keep drifting.
+    When nothing breaches its band, the trade step is skipped entirely.
+
+    Args:
+        prices: (Dates x Tickers) float64 matrix with missing prices already filled with 0.0.
+        target_weights: (Dates x Tickers) float64 matrix aligned with `prices`.
+
+    Returns:
+        (equity, turnover, rebalanced): per-day end-of-day equity, turnover as a fraction of
+        the pre-trade portfolio value, and whether any trade happened that day.
+    """
+    n_dates, n_assets = prices.shape
+    cash = initial_capital
+    shares_held = np.zeros(n_assets)
+
+    equity = np.empty(n_dates)
+    turnover = np.zeros(n_dates)
+    rebalanced = np.zeros(n_dates, dtype=bool)
+
+    next_unmarked = 0
+    for t in np.flatnonzero(schedule):
+        # 1. Drift days since the last visit: mark-to-market in one pass
+        if t > next_unmarked:
+            equity[next_unmarked:t] = cash + prices[next_unmarked:t] @ shares_held
+
+        current_prices = prices[t]
+        holdings_value = shares_held * current_prices
+        portfolio_value = cash + holdings_value.sum()
+
+        # 2. Which assets drifted out of their band?
+        w_target = target_weights[t]
+        if portfolio_value > 0:
+            drift = np.abs(w_target - holdings_value / portfolio_value)
+        else:
+            drift = np.abs(w_target)
+        threshold = policy.band
+        if policy.band_type == "relative":
+            threshold = policy.band * np.abs(w_target)
+        opens_or_closes = (w_target != 0) != (shares_held != 0)
+        breached = np.flatnonzero((drift > threshold) | opens_or_closes)
+
+        # 3. Trade only the breached assets back to target (fast path: nothing to trade)
+        if len(breached):
+            price = current_prices[breached]
+            target_shares = np.zeros(len(breached))
+            np.divide(
+                w_target[breached] * portfolio_value, price, out=target_shares, where=price > 0
+            )
+
+            trades_capital = (target_shares - shares_held[breached]) * price
+            traded_value = np.abs(trades_capital).sum()
+            cash = cash - trades_capital.sum() - traded_value * cost_rate
+            shares_held[breached] = target_shares
+
+            turnover[t] = (traded_value / portfolio_value) if portfolio_value > 0 else 0.0
+            rebalanced[t] = traded_value > 0
+
+        equity[t] = cash + shares_held @ current_prices
+        next_unmarked = t + 1
+
+    equity[next_unmarked:] = cash + prices[next_unmarked:] @ shares_held
+    return equity, turnover, rebalanced
+
+
+def rebalance_report(results: pd.DataFrame, reference: pd.DataFrame) -> dict:
+    """
+    Compares a banded/scheduled run with the always-rebalance reference run on the same inputs.
+
+    Returns:
+        rebalance_days, total_days, turnover (summed daily turnover), reference_turnover,
+        turnover_saved (fraction of the reference turnover avoided) and final equity of both runs.
+    """
+    turnover = results['turnover'].sum()
+    reference_turnover = reference['turnover'].sum()
+    return {
+        'rebalance_days': int(results['rebalanced'].sum()),
+        'total_days': len(results),
+        'turnover': turnover,
+        'reference_turnover': reference_turnover,
+        'turnover_saved': 1 - turnover / reference_turnover if reference_turnover > 0 else 0.0,
+        'final_equity': results['equity'].iloc[-1],
+        'reference_final_equity': reference['equity'].iloc[-1],
+    }
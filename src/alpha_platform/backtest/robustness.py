@@ -0,0 +1,271 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from alpha_platform.backtest.metrics import TRADING_DAYS
+from alpha_platform.profiling import span
+
+BOOTSTRAP_METHODS = ("stationary", "block")
+METRICS = ('annualized_return', 'annualized_vol', 'sharpe', 'max_drawdown')
+
+# Samples drawn from one RNG stream (see `_stream_chunks`)
+STREAM_SIZE = 100
+
+
+# Differences this small are float noise (e.g. the same strategy at two capital levels)
+TIE_TOLERANCE = 1e-12
+
+
+def _stream_chunks(seed: int, n_samples: int, chunk_size: int):
+    """
+    Yields, per chunk of about `chunk_size` samples, the (generator, n_samples) pairs to draw.
+
+    Every group of STREAM_SIZE samples has its own generator spawned from `seed`, and chunks
+    only ever hold whole groups, so the draws never depend on the chunking.
+    """
+    n_streams = -(-n_samples // STREAM_SIZE)
+    children = np.random.SeedSequence(seed).spawn(n_streams)
+    streams = [np.random.default_rng(child) for child in children]
+    sizes = [min(STREAM_SIZE, n_samples - i * STREAM_SIZE) for i in range(n_streams)]
+    per_chunk = max(1, chunk_size // STREAM_SIZE)
+    for first in range(0, n_streams, per_chunk):
+        yield list(zip(streams[first:first + per_chunk], sizes[first:first + per_chunk]))
+
+
+def resample_indices(
+        n_dates: int,
+        n_samples: int,
+        block_length: float,
+        method: str,
+        rng: np.random.Generator
+) -> np.ndarray:
+    """
+    (n_samples x n_dates) row indices of bootstrap paths that keep short-range dependence.
+
+    'stationary' (Politis-Romano) starts a new block with probability 1 / block_length each day,
+    so block lengths are geometric with mean `block_length`. 'block' uses fixed-length circular
+    blocks. Both wrap around the end of the history.
+    """
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError(
+            f"Unknown bootstrap method '{method}'. Expected one of {BOOTSTRAP_METHODS}."
+        )
+    if block_length < 1:
+        raise ValueError("block_length must be at least 1.")
+    steps = np.arange(n_dates)
+
+    if method == "block":
+        length = round(block_length)
+        starts = rng.integers(0, n_dates, size=(n_samples, -(-n_dates // length)))
+        return (starts[:, steps // length] + steps % length) % n_dates
+
+    # Each day continues the current block unless a new one starts; find each day's block start
+    new_block = rng.random((n_samples, n_dates)) < 1.0 / block_length
+    new_block[:, 0] = True
+    starts = rng.integers(0, n_dates, size=(n_samples, n_dates))
+    block_begin = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+    first = np.take_along_axis(starts, block_begin, axis=1)
+    return (first + steps - block_begin) % n_dates
+
+
+def path_metrics(returns: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Headline metrics of a stack of daily return paths, along the date axis (axis -2).
+
+    Args:
+        returns: (..., Dates, Strategies) daily returns.
+
+    Returns:
+        Arrays of shape (..., Strategies) for each of METRICS.
+    """
+    n_dates = returns.shape[-2]
+    log_growth = np.log1p(returns)
+    wealth = np.exp(np.cumsum(log_growth, axis=-2))
+    peak = np.maximum(np.maximum.accumulate(wealth, axis=-2), 1.0)  # start from a peak of 1
+
+    mean = returns.mean(axis=-2)
+    std = returns.std(axis=-2, ddof=1)
+    sharpe = np.divide(mean, std, out=np.zeros_like(mean), where=std > 0)
+    return {
+        'annualized_return': np.expm1(log_growth.sum(axis=-2) * TRADING_DAYS / n_dates),
+        'annualized_vol': std * np.sqrt(TRADING_DAYS),
+        'sharpe': sharpe * np.sqrt(TRADING_DAYS),
+        'max_drawdown': (wealth / peak - 1).min(axis=-2),
+    }
+
+
+@dataclass
+class BootstrapResult:
+    """
+    Attributes:
+        observed: (Strategies x METRICS) metrics of the actual return history.
+        samples: Long frame (sample, strategy, *METRICS): one row per resampled path and
+            strategy. Every strategy is resampled on the same dates, so rows with the same
+            `sample` are paired draws.
+    """
+    observed: pd.DataFrame
+    samples: pd.DataFrame
+
+    def intervals(self, level: float = 0.95) -> pd.DataFrame:
+        """Percentile confidence intervals: one row per (strategy, metric)."""
+        tail = (1 - level) / 2
+        grouped = self.samples.groupby('strategy', sort=False)[list(METRICS)]
+        bounds = grouped.quantile([tail, 1 - tail]).unstack()
+        rows = []
+        for strategy in self.observed.index:
+            for metric in METRICS:
+                rows.append({
+                    'strategy': strategy,
+                    'metric': metric,
+                    'observed': self.observed.loc[strategy, metric],
+                    'lower': bounds.loc[strategy, (metric, tail)],
+                    'upper': bounds.loc[strategy, (metric, 1 - tail)],
+                })
+        return pd.DataFrame(rows)
+
+    def compare(self, baseline: str = "equal_weight") -> pd.DataFrame:
+        """
+        Paired bootstrap test of each strategy against `baseline`, per metric.
+
+        H0: the strategy is no better than the baseline (higher is better for every metric but
+        volatility). The p-value counts how often the bootstrap difference, re-centered on the
+        observed one, is at least as large as the observed difference.
+        """
+        if baseline not in self.observed.index:
+            raise ValueError(f"Unknown baseline strategy '{baseline}'.")
+        wide = self.samples.pivot(index='sample', columns='strategy')
+        rows = []
+        for strategy in self.observed.index.drop(baseline):
+            for metric in METRICS:
+                sign = -1.0 if metric == 'annualized_vol' else 1.0
+                observed = sign * (
+                    self.observed.loc[strategy, metric] - self.observed.loc[baseline, metric]
+                )
+                boot = sign * (wide[(metric, strategy)] - wide[(metric, baseline)]).to_numpy()
+                exceed = np.sum(boot - observed >= observed - TIE_TOLERANCE)
+                rows.append({
+                    'strategy': strategy,
+                    'baseline': baseline,
+                    'metric': metric,
+                    'difference': sign * observed,
+                    'p_value': (1 + exceed) / (1 + len(boot)),
+                })
+        return pd.DataFrame(rows)
+
+
+def _clean_returns(returns: pd.DataFrame | pd.Series) -> pd.DataFrame:
+    returns = returns.to_frame() if isinstance(returns, pd.Series) else returns
+    returns = returns.dropna()  # runs over different windows are compared on shared dates
+    if len(returns) < 2:
+        raise ValueError("Need at least two dates with returns for every strategy.")
+    return returns
+
+
+def bootstrap(
+        returns: pd.DataFrame | pd.Series,
+        n_samples: int = 2000,
+        block_length: float = 20.0,
+        method: str = "stationary",
+        seed: int = 0,
+        chunk_size: int = 500
+) -> BootstrapResult:
+    """
+    Block-bootstraps daily strategy returns and measures every resampled path at once.
+
+    All strategies share the resampled dates of a path, which keeps their cross-correlation
+    for paired comparisons. Paths are evaluated `chunk_size` at a time as one
+    (chunk x Dates x Strategies) array, which caps memory at roughly
+    chunk_size * dates * strategies * 8 bytes times a few temporaries.
+
+    Args:
+        returns: (Dates x Strategies) daily net returns, e.g. `ResultsPanel.returns`.
+        seed: Seed of the RNG streams; the same seed gives the same samples for any chunk_size.
+    """
+    returns = _clean_returns(returns)
+    values = returns.to_numpy(dtype=np.float64)
+    n_dates = len(values)
+
+    metrics = {metric: [] for metric in METRICS}
+    with span("robustness.bootstrap", samples=n_samples, method=method):
+        for chunk in _stream_chunks(seed, n_samples, chunk_size):
+            indices = np.concatenate([
+                resample_indices(n_dates, size, block_length, method, rng) for rng, size in chunk
+            ])
+            for metric, value in path_metrics(values[indices]).items():
+                metrics[metric].append(value)
+
+    strategies = list(returns.columns)
+    samples = pd.DataFrame({
+        'sample': np.repeat(np.arange(n_samples), len(strategies)),
+        'strategy': np.tile(strategies, n_samples),
+        **{metric: np.concatenate(chunks).ravel() for metric, chunks in metrics.items()},
+    })
+    observed = pd.DataFrame(path_metrics(values), index=pd.Index(strategies, name='strategy'))
+    return BootstrapResult(observed=observed, samples=samples)
+
+
+def permutation_test(
+        returns: pd.DataFrame,
+        baseline: str = "equal_weight",
+        n_permutations: int = 2000,
+        block_length: int = 20,
+        seed: int = 0,
+        chunk_size: int = 500
+) -> pd.DataFrame:
+    """
+    Paired permutation test of each strategy's Sharpe ratio against `baseline`.
+
+    Under H0 (no difference) the two return streams are exchangeable on any day, so each
+    permutation swaps the strategy and baseline returns over random blocks of `block_length`
+    days (blocks keep volatility clustering intact). The p-value is the share of permutations
+    whose Sharpe difference is at least the observed one.
+    """
+    returns = _clean_returns(returns)
+    if baseline not in returns.columns:
+        raise ValueError(f"Unknown baseline strategy '{baseline}'.")
+    others = returns.drop(columns=baseline)
+    values = others.to_numpy(dtype=np.float64)
+    base = returns[baseline].to_numpy(dtype=np.float64)[:, None]
+    n_dates = len(values)
+
+    observed = path_metrics(values)['sharpe'] - path_metrics(base)['sharpe']
+    exceed = np.zeros(values.shape[1])
+    block_of_day = np.arange(n_dates) // block_length
+    n_blocks = block_of_day[-1] + 1
+
+    with span("robustness.permutation", permutations=n_permutations):
+        for chunk in _stream_chunks(seed, n_permutations, chunk_size):
+            coin_flips = np.concatenate([rng.random((size, n_blocks)) for rng, size in chunk])
+            swap = (coin_flips < 0.5)[:, block_of_day, None]
+            strategy = np.where(swap, base, values)
+            reference = np.where(swap, values, base)
+            difference = path_metrics(strategy)['sharpe'] - path_metrics(reference)['sharpe']
+            exceed += (difference >= observed - TIE_TOLERANCE).sum(axis=0)
+
+    return pd.DataFrame({
+        'strategy': others.columns,
+        'baseline': baseline,
+        'sharpe_difference': observed,
+        'p_value': (1 + exceed) / (1 + n_permutations),
+    })
+
+
+def portfolio_returns(
+        asset_returns: pd.DataFrame,
+        weights: pd.DataFrame,
+        cost_bps: float = 0.0
+) -> pd.Series:
+    """
+    Daily returns of a weight matrix on per-asset returns, for bootstrapping without the engine.
+
+    Weights set on day t earn day t+1's asset returns (the engine's timing). Costs are charged
+    as cost_bps on the day's change in weights; intraday drift between rebalances is ignored,
+    so this approximates the engine's net returns rather than replicating them.
+    """
+    weights = weights.reindex(index=asset_returns.index, columns=asset_returns.columns).fillna(0.0)
+    held = weights.shift(1).fillna(0.0)
+    gross = (held * asset_returns.fillna(0.0)).sum(axis=1)
+    traded = weights.diff().fillna(weights).abs().sum(axis=1)
+    costs = traded * cost_bps / 10_000.0
+    return (gross - costs).rename('net_ret')
@@ -0,0 +1,183 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+
+from alpha_platform.backtest.engine import _numpy_loop, align_weights, build_results
+from alpha_platform.signals.baselines import STRATEGIES, STRATEGY_FEATURES, WIDE_STRATEGIES
+from alpha_platform.signals.wide import pivot_features
+
+console = Console()
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    """
+    One independent backtest: a strategy, its cost/capital parameters and an optional date window.
+    A window of (None, None) runs over the full history.
+    """
+    strategy: str
+    cost_bps: float = 5.0
+    initial_capital: float = 100_000.0
+    start_date: str | None = None
+    end_date: str | None = None
+
+
+def rolling_windows(
+        dates: pd.DatetimeIndex,
+        window_days: int,
+        step_days: int | None = None
+) -> list[tuple[str, str]]:
+    """
+    Splits a trading calendar into consecutive (start_date, end_date) walk-forward windows.
+    Windows are `window_days` trading days long and start every `step_days`
+    (defaults to non-overlapping windows).
+    """
+    step_days = step_days or window_days
+    windows = []
+    for start in range(0, len(dates) - window_days + 1, step_days):
+        end = start + window_days - 1
+        windows.append((str(dates[start].date()), str(dates[end].date())))
+    return windows
+
+
+# --- Shared Memory Plumbing ---
+# The parent pivots once and publishes the dense matrices; workers attach by name (zero-copy).
+_WORKER_STATE: dict = {}
+
+
+def _publish(array: np.ndarray) -> tuple[shared_memory.SharedMemory, tuple]:
+    """Copies an array into a new shared memory block and returns it with a picklable descriptor."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[:] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach(descriptor: tuple) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Maps an existing shared memory block as a read-only array without copying it."""
+    name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    array.flags.writeable = False
+    return shm, array
+
+
+def _init_worker(prices_desc: tuple, weights_desc: tuple, dates: np.ndarray, strategy_names: list[str]):
+    """Process pool initializer: attach the shared matrices once per worker."""
+    prices_shm, prices = _attach(prices_desc)
+    weights_shm, weights = _attach(weights_desc)
+    _WORKER_STATE.update(
+        handles=(prices_shm, weights_shm),  # keep the mappings alive for the worker's lifetime
+        prices=prices,
+        weights=weights,
+        dates=dates,
+        strategy_names=strategy_names,
+    )
+
+
+def _window_bounds(dates: np.ndarray, spec: RunSpec) -> tuple[int, int]:
+    """Translates a spec's date window into [start, end) row positions."""
+    start, end = 0, len(dates)
+    if spec.start_date is not None:
+        start = int(np.searchsorted(dates, np.datetime64(spec.start_date)))
+    if spec.end_date is not None:
+        end = int(np.searchsorted(dates, np.datetime64(spec.end_date), side='right'))
+    return start, end
+
+
+def _execute(
+        spec: RunSpec,
+        prices: np.ndarray,
+        weights: np.ndarray,
+        dates: np.ndarray,
+        strategy_names: list[str]
+) -> tuple[int, int, np.ndarray, np.ndarray]:
+    """Runs one spec against the (Dates x Tickers) prices and (Strategies x Dates x Tickers) weights."""
+    start, end = _window_bounds(dates, spec)
+    equity, turnover = _numpy_loop(
+        prices[start:end],
+        weights[strategy_names.index(spec.strategy), start:end],
+        spec.initial_capital,
+        spec.cost_bps / 10000.0
+    )
+    return start, end, equity, turnover
+
+
+def _execute_in_worker(spec: RunSpec) -> tuple[int, int, np.ndarray, np.ndarray]:
+    state = _WORKER_STATE
+    return _execute(spec, state['prices'], state['weights'], state['dates'], state['strategy_names'])
+
+
+def run_specs(df: pd.DataFrame, specs: list[RunSpec], workers: int | None = None) -> pd.DataFrame:
+    """
+    Runs independent backtests, fanning them out over a process pool.
+
+    The features frame is pivoted once in the parent; the price matrix and every strategy's weight
+    matrix are published in shared memory so workers never re-read or re-pivot the Parquet data.
+    Results are returned in the order of `specs`, regardless of which worker finished first.
+
+    Args:
+        df: Long-format features frame (as written by `alpha features`).
+        specs: The runs to execute.
+        workers: Number of worker processes. Defaults to the CPU count; 1 runs in-process.
+
+    Returns:
+        A tidy long-format DataFrame with one row per (run_id, Date) plus the spec's fields.
+    """
+    if not specs:
+        raise ValueError("No run specs given.")
+
+    unknown = sorted({spec.strategy for spec in specs} - set(STRATEGIES))
+    if unknown:
+        raise ValueError(f"Unknown strategies {unknown}. Expected any of {list(STRATEGIES)}.")
+
+    workers = workers or os.cpu_count() or 1
+
+    # 1. Pivot once in the parent process (prices + the features the strategies read)
+    strategy_names = list(dict.fromkeys(spec.strategy for spec in specs))
+    needed = [col for name in strategy_names for col in STRATEGY_FEATURES[name]]
+    features = pivot_features(df, ['Close', *needed])
+    prices_df = features['Close'].ffill()
+    weights = np.stack([
+        align_weights(WIDE_STRATEGIES[name](features), prices_df).to_numpy(dtype=np.float64)
+        for name in strategy_names
+    ])
+    prices = prices_df.fillna(0.0).to_numpy(dtype=np.float64)
+    dates = prices_df.index.to_numpy()
+
+    # 2. Execute (in-process for a single worker, otherwise over the shared-memory pool)
+    console.print(f"Running {len(specs)} backtests on {workers} worker(s)...")
+    if workers == 1:
+        outputs = [_execute(spec, prices, weights, dates, strategy_names) for spec in specs]
+    else:
+        prices_shm, prices_desc = _publish(prices)
+        weights_shm, weights_desc = _publish(weights)
+        try:
+            with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(prices_desc, weights_desc, dates, strategy_names)
+            ) as executor:
+                # executor.map yields results in submission order -> deterministic output
+                chunksize = max(1, len(specs) // (workers * 4))
+                outputs = list(executor.map(_execute_in_worker, specs, chunksize=chunksize))
+        finally:
+            for shm in (prices_shm, weights_shm):
+                shm.close()
+                shm.unlink()
+
+    # 3. Assemble one tidy table keyed by run_id
+    frames = []
+    for run_id, (spec, (start, end, equity, turnover)) in enumerate(zip(specs, outputs)):
+        results = build_results(prices_df.index[start:end], equity, turnover, spec.initial_capital)
+        results = results.reset_index()
+        frames.append(results.assign(run_id=run_id, **asdict(spec)))
+
+    tidy = pd.concat(frames, ignore_index=True)
+    key_cols = ['run_id', *asdict(specs[0]).keys()]
+    return tidy[[*key_cols, *[col for col in tidy.columns if col not in key_cols]]]
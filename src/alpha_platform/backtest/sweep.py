@@ -0,0 +1,200 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+
+from alpha_platform.backtest.engine import align_weights
+from alpha_platform.signals.baselines import STRATEGIES, STRATEGY_FEATURES, WIDE_STRATEGIES
+from alpha_platform.signals.wide import WideFeatures, pivot_features
+
+console = Console()
+
+SCENARIO_KEYS = ['strategy', 'cost_bps', 'initial_capital']
+DEFAULT_CAPITAL = 100_000.0
+
+
+def build_scenarios(
+        strategies: list[str],
+        cost_bps_values: list[float],
+        capital_levels: list[float]
+) -> pd.DataFrame:
+    """
+    Expands the parameter grid into one row per scenario (strategies x costs x capital levels).
+    """
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown strategies {unknown}. Expected any of {list(STRATEGIES)}.")
+
+    grid = itertools.product(strategies, cost_bps_values, capital_levels)
+    scenarios = pd.DataFrame(grid, columns=SCENARIO_KEYS)
+    scenarios.index.name = 'scenario_id'
+    return scenarios
+
+
+def _batched_numpy_loop(
+        prices: np.ndarray,
+        weights: np.ndarray,
+        strategy_index: np.ndarray,
+        initial_capital: np.ndarray,
+        cost_rate: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulates K scenarios side by side in a single pass over time.
+    Identical per-scenario arithmetic to `engine._numpy_loop`, with state stacked along a scenario axis.
+
+    Args:
+        prices: (Dates x Tickers) matrix with missing prices filled with 0.0.
+        weights: (Dates x Strategies x Tickers) stack of target weight matrices.
+        strategy_index: (K,) index into the strategy axis of `weights` for every scenario.
+        initial_capital: (K,) starting capital per scenario.
+        cost_rate: (K,) cost rate (bps / 10,000) per scenario.
+    """
+    n_dates, n_assets = prices.shape
+    n_scenarios = len(strategy_index)
+
+    # --- Initialize State Variables (one row per scenario) ---
+    cash = initial_capital.astype(np.float64).copy()
+    shares_held = np.zeros((n_scenarios, n_assets))
+
+    # --- Preallocated Buffers ---
+    target_capital = np.empty((n_scenarios, n_assets))
+    target_shares = np.empty((n_scenarios, n_assets))
+    trades_capital = np.empty((n_scenarios, n_assets))
+    scratch = np.empty((n_scenarios, n_assets))
+    valid_prices = np.empty((n_scenarios, n_assets), dtype=bool)
+    turnover_pct = np.empty(n_scenarios)
+
+    # --- Tracking Arrays ---
+    history_portfolio_value = np.empty((n_dates, n_scenarios))
+    history_turnover_pct = np.empty((n_dates, n_scenarios))
+
+    for t in range(n_dates):
+        current_prices = prices[t]
+
+        # 1. Mark-to-Market
+        np.multiply(shares_held, current_prices, out=scratch)
+        portfolio_value = cash + scratch.sum(axis=1)
+
+        # 2-4. Target capital and target shares (0.0 where the price is missing)
+        np.multiply(weights[t][strategy_index], portfolio_value[:, None], out=target_capital)
+        np.greater(current_prices, 0, out=valid_prices)
+        target_shares.fill(0.0)
+        np.divide(target_capital, current_prices, out=target_shares, where=valid_prices)
+
+        # 5. Trades (Delta Shares) valued at today's prices
+        np.subtract(target_shares, shares_held, out=trades_capital)
+        np.multiply(trades_capital, current_prices, out=trades_capital)
+
+        # 6. Turnover and Costs
+        np.abs(trades_capital, out=scratch)
+        traded_value = scratch.sum(axis=1)
+        costs = traded_value * cost_rate
+        turnover_pct.fill(0.0)
+        np.divide(traded_value, portfolio_value, out=turnover_pct, where=portfolio_value > 0)
+
+        # 7. Update State for Tomorrow
+        cash = cash - trades_capital.sum(axis=1) - costs
+        shares_held, target_shares = target_shares, shares_held
+
+        # 8. Record end-of-day stats
+        np.multiply(shares_held, current_prices, out=scratch)
+        history_portfolio_value[t] = cash + scratch.sum(axis=1)
+        history_turnover_pct[t] = turnover_pct
+
+    return history_portfolio_value, history_turnover_pct
+
+
+def run_sweep(
+        df: pd.DataFrame,
+        strategies: list[str],
+        cost_bps_values: list[float],
+        capital_levels: list[float] | None = None
+) -> pd.DataFrame:
+    """
+    Runs every (strategy, cost, capital) scenario in one batched pass over the features frame.
+    Prices are pivoted once and each strategy's weights once, no matter how many cost or capital levels.
+
+    Returns:
+        A tidy long-format DataFrame with one row per (scenario, Date), keyed by
+        'scenario_id', 'strategy', 'cost_bps' and 'initial_capital'.
+    """
+    # 1. Pivot once: prices and every feature any strategy reads, shared by every scenario
+    needed = [col for name in dict.fromkeys(strategies) for col in STRATEGY_FEATURES[name]]
+    features = pivot_features(df, ['Close', *needed])
+    return run_sweep_matrices(features, strategies, cost_bps_values, capital_levels)
+
+
+def run_sweep_matrices(
+        features: WideFeatures,
+        strategies: list[str],
+        cost_bps_values: list[float],
+        capital_levels: list[float] | None = None
+) -> pd.DataFrame:
+    """
+    `run_sweep` on already-pivoted (Dates x Tickers) matrices holding 'Close' and the
+    strategies' features (e.g. a matrix store or the resident matrices of `alpha serve`).
+    """
+    if capital_levels is None:
+        capital_levels = [DEFAULT_CAPITAL]
+    scenarios = build_scenarios(strategies, cost_bps_values, capital_levels)
+    unique_strategies = list(dict.fromkeys(strategies))
+    prices = features['Close'].ffill()
+
+    # 2. One weight matrix per unique strategy (wide signal API), stacked along a strategy axis
+    weight_stack = np.stack(
+        [
+            align_weights(WIDE_STRATEGIES[name](features), prices).to_numpy(dtype=np.float64)
+            for name in unique_strategies
+        ],
+        axis=1
+    )
+
+    # 3. Simulate all scenarios together
+    console.print(
+        f"Starting batched iteration over {len(prices.index)} trading days "
+        f"for {len(scenarios)} scenarios..."
+    )
+    equity, turnover = _batched_numpy_loop(
+        prices.fillna(0.0).to_numpy(dtype=np.float64),
+        weight_stack,
+        scenarios['strategy'].map(unique_strategies.index).to_numpy(),
+        scenarios['initial_capital'].to_numpy(dtype=np.float64),
+        scenarios['cost_bps'].to_numpy(dtype=np.float64) / 10000.0
+    )
+
+    # --- Post-Processing Results (Dates x Scenarios -> tidy long format) ---
+    equity = pd.DataFrame(equity, index=prices.index, columns=scenarios.index)
+    turnover = pd.DataFrame(turnover, index=prices.index, columns=scenarios.index)
+    net_ret = equity.pct_change().fillna(0.0)
+    cumulative_net = equity / scenarios['initial_capital'].to_numpy()
+
+    results = pd.DataFrame({
+        'equity': equity.unstack(),
+        'turnover': turnover.unstack(),
+        'net_ret': net_ret.unstack(),
+        'cumulative_net': cumulative_net.unstack(),
+    }).reset_index()
+
+    return scenarios.reset_index().merge(results, on='scenario_id')
+
+
+def summarize_sweep(results: pd.DataFrame, keys: list[str] | None = None) -> pd.DataFrame:
+    """
+    Collapses a tidy sweep table into one row of headline metrics per scenario.
+
+    Args:
+        keys: Columns identifying a scenario. Defaults to the sweep's scenario keys.
+    """
+    keys = keys or ['scenario_id', *SCENARIO_KEYS]
+    grouped = results.groupby(keys, sort=True, dropna=False)
+
+    summary = pd.DataFrame({
+        'total_return': grouped['cumulative_net'].last() - 1,
+        'annualized_vol': grouped['net_ret'].std() * np.sqrt(252),
+        'sharpe': grouped['net_ret'].mean() / grouped['net_ret'].std() * np.sqrt(252),
+        'avg_turnover': grouped['turnover'].mean(),
+    })
+    summary['sharpe'] = summary['sharpe'].replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return summary.reset_index()
@@ -0,0 +1,169 @@
+import json
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+
+from alpha_platform.backtest.engine import prepare_wide_matrices, run_iterative_backtest
+from alpha_platform.bench.synthetic import make_synthetic_universe
+from alpha_platform.features.builder import build_features
+from alpha_platform.signals.baselines import STRATEGIES
+
+console = Console()
+
+DEFAULT_SCALES = [10, 500, 5000]
+DEFAULT_RESULTS_DIR = Path("data/benchmarks")
+
+# Strategy whose weights feed the prepare_wide_matrices / run_iterative_backtest stages
+BACKTEST_STRATEGY = "trend"
+
+
+@dataclass
+class StageResult:
+    """
+    Timing and memory of one pipeline stage at one scale.
+
+    Attributes:
+        stage: Stage name ('build_features', 'strategy:<name>', ...).
+        n_tickers, n_days, missing_frac: The synthetic universe the stage ran on.
+        rows: Rows of long-format input the stage received.
+        seconds: Best wall time over the repeats.
+        peak_mb: Peak Python-heap allocation during one run (tracemalloc, includes NumPy buffers).
+    """
+    stage: str
+    n_tickers: int
+    n_days: int
+    missing_frac: float
+    rows: int
+    seconds: float
+    peak_mb: float
+
+
+def measure(func: Callable, *args, repeats: int = 3, **kwargs) -> tuple[object, float, float]:
+    """
+    Runs `func` once under tracemalloc for its peak memory, then `repeats` times untraced
+    (tracing slows allocation-heavy code) and keeps the fastest wall time.
+
+    Returns:
+        (result, best_seconds, peak_mb)
+    """
+    tracemalloc.start()
+    result = func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+
+    return result, min(timings), peak / 1024 ** 2
+
+
+def run_benchmarks(
+        scales: list[int] = DEFAULT_SCALES,
+        n_days: int = 1260,
+        missing_frac: float = 0.05,
+        repeats: int = 3,
+        seed: int = 0
+) -> dict:
+    """
+    Times every pipeline stage on deterministic synthetic universes of `scales` tickers.
+
+    Stages, in pipeline order: build_features, each registered strategy, then
+    prepare_wide_matrices and run_iterative_backtest on the BACKTEST_STRATEGY weights.
+
+    Returns:
+        A JSON-serializable report: {'meta': {...environment...}, 'results': [StageResult, ...]}.
+    """
+    results: list[StageResult] = []
+    for n_tickers in scales:
+        console.print(
+            f"Benchmarking {n_tickers} tickers x {n_days} days ({missing_frac:.0%} missing)..."
+        )
+        raw = make_synthetic_universe(n_tickers, n_days, missing_frac=missing_frac, seed=seed)
+
+        def record(stage: str, func: Callable, df: pd.DataFrame, n_tickers=n_tickers, **kwargs):
+            output, seconds, peak_mb = measure(func, df, repeats=repeats, **kwargs)
+            results.append(StageResult(
+                stage, n_tickers, n_days, missing_frac, len(df),
+                seconds=round(seconds, 6), peak_mb=round(peak_mb, 3)
+            ))
+            console.print(f"  {stage:<24} {seconds:9.4f}s  {peak_mb:9.1f} MB")
+            return output
+
+        features = record('build_features', build_features, raw)
+        del raw
+
+        weighted = {}
+        for name, strategy in STRATEGIES.items():
+            weighted[name] = record(f'strategy:{name}', strategy, features)
+        del features
+
+        record('prepare_wide_matrices', prepare_wide_matrices, weighted[BACKTEST_STRATEGY])
+        record('run_iterative_backtest', run_iterative_backtest, weighted[BACKTEST_STRATEGY])
+        del weighted
+
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': seed,
+            'repeats': repeats,
+        },
+        'results': [asdict(result) for result in results],
+    }
+
+
+def save_report(report: dict, path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+    return path
+
+
+def load_report(path: str | Path) -> dict:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def _result_key(result: dict) -> tuple:
+    return result['stage'], result['n_tickers'], result['n_days'], result['missing_frac']
+
+
+def compare_reports(
+        baseline: dict,
+        current: dict,
+        threshold: float = 0.25,
+        min_seconds: float = 0.02
+) -> list[dict]:
+    """
+    Lists the stages that got slower than `baseline` by more than `threshold` (0.25 = +25%).
+
+    Stages are matched on (stage, tickers, days, missingness); stages missing from either report
+    are skipped. Timings where both runs are under `min_seconds` are treated as noise.
+    """
+    baseline_seconds = {_result_key(result): result['seconds'] for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        before = baseline_seconds.get(_result_key(result))
+        if before is None or max(before, result['seconds']) < min_seconds:
+            continue
+        ratio = result['seconds'] / before if before > 0 else float('inf')
+        if ratio > 1 + threshold:
+            regressions.append({**result, 'baseline_seconds': before, 'ratio': round(ratio, 3)})
+    return regressions
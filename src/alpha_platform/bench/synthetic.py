@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+
+def make_synthetic_universe(
+        n_tickers: int,
+        n_days: int,
+        missing_frac: float = 0.0,
+        seed: int = 0,
+        start_date: str = "2015-01-02"
+) -> pd.DataFrame:
+    """
+    Generates a deterministic long-format OHLCV universe in the raw schema
+    (Date, Ticker, Open, High, Low, Close, Adj Close, Volume), sorted by Ticker and Date.
+
+    Prices follow independent geometric random walks. `missing_frac` drops that share of
+    (Date, Ticker) rows at random, like trading halts or late listings, so tickers end up
+    with ragged calendars. The same arguments always produce the same frame.
+    """
+    if not 0.0 <= missing_frac < 1.0:
+        raise ValueError(f"missing_frac must be in [0, 1), got {missing_frac}.")
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start=start_date, periods=n_days)
+    tickers = [f"T{i:05d}" for i in range(n_tickers)]
+    shape = (n_tickers, n_days)
+
+    # 1. Close: a geometric random walk per ticker with its own drift and volatility
+    drift = rng.normal(0.0003, 0.0002, size=(n_tickers, 1))
+    vol = rng.uniform(0.01, 0.03, size=(n_tickers, 1))
+    start_price = rng.uniform(10.0, 200.0, size=(n_tickers, 1))
+    log_returns = drift + vol * rng.standard_normal(shape)
+    close = start_price * np.exp(np.cumsum(log_returns, axis=1))
+
+    # 2. Intraday bars around the close
+    open_ = close * np.exp(vol * 0.3 * rng.standard_normal(shape))
+    high = np.maximum(open_, close) * (1 + np.abs(vol * 0.5 * rng.standard_normal(shape)))
+    low = np.minimum(open_, close) * (1 - np.abs(vol * 0.5 * rng.standard_normal(shape)))
+    volume = rng.lognormal(mean=13.0, sigma=1.0, size=shape).round()
+
+    df = pd.DataFrame({
+        'Date': np.tile(dates.to_numpy(), n_tickers),
+        'Ticker': np.repeat(tickers, n_days),
+        'Open': open_.ravel(),
+        'High': high.ravel(),
+        'Low': low.ravel(),
+        'Close': close.ravel(),
+        'Adj Close': close.ravel(),
+        'Volume': volume.ravel(),
+    })
+
+    # 3. Missingness: drop random rows (the cleaner's output has gaps, not NaN padding)
+    if missing_frac > 0:
+        keep = rng.random(len(df)) >= missing_frac
+        df = df[keep].reset_index(drop=True)
+
+    return df
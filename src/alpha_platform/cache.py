@@ -0,0 +1,191 @@
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections.abc import Callable
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_CACHE_DIR = Path("data/cache")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+STATS_FILE = "_stats.json"
+LOCK_FILE = "_stats.lock"
+
+try:
+    import fcntl
+except ImportError:  # Windows: the statistics are then only serialized within one process
+    fcntl = None
+
+_STATS_LOCK = threading.Lock()
+
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """
+    Content hash of a DataFrame: values, index, column names and dtypes.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(col) for col in df.columns]).encode())
+    digest.update(json.dumps([str(dtype) for dtype in df.dtypes]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _code_version(func: Callable) -> str:
+    """
+    Hash of the source files `func` depends on, so editing the code invalidates its entries.
+
+    For a function inside a package that is every module of the package (e.g. all of
+    `alpha_platform.features` for `build_features`, whose math lives in registry.py and
+    kernels.py), not only the file defining it.
+    """
+    try:
+        path = Path(inspect.getfile(func))
+    except TypeError:
+        return hashlib.sha256(b"").hexdigest()
+    files = sorted(path.parent.glob("*.py")) if '.' in func.__module__ else [path]
+
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(file.name.encode())
+        try:
+            digest.update(file.read_bytes())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def make_key(func: Callable, data_hash: str, params: dict) -> str:
+    """
+    Cache key for `func(df, **params)`: the function's identity and code version,
+    its parameters and the input data hash.
+    """
+    payload = json.dumps({
+        'function': f"{func.__module__}.{func.__qualname__}",
+        'code': _code_version(func),
+        'params': params,
+        'data': data_hash,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ArtifactCache:
+    """
+    Content-addressed on-disk cache of DataFrame artifacts with size-bounded LRU eviction.
+
+    Entries are Parquet files named by their key. A hit refreshes the file's modification time,
+    so eviction (oldest first) approximates least-recently-used across processes.
+    Hit/miss/eviction counts are persisted next to the entries.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # --- Entry Storage ---
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.parquet"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        path = self._path(key)
+        try:
+            df = pd.read_parquet(path)
+        except (FileNotFoundError, OSError):
+            self._record(misses=1)
+            return None
+        os.utime(path)  # Mark as recently used
+        self._record(hits=1)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def call(self, func: Callable[..., pd.DataFrame], df: pd.DataFrame, **params) -> pd.DataFrame:
+        """
+        Returns `func(df, **params)`, served from the cache when the same function, code,
+        parameters and input data were seen before.
+        """
+        key = make_key(func, hash_frame(df), params)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result = func(df, **params)
+        self.put(key, result)
+        return result
+
+    # --- Eviction & Statistics ---
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.root.glob("*/*.parquet"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:  # Evicted by another process meanwhile
+                continue
+        return entries
+
+    def evict(self):
+        """Deletes least-recently-used entries until the cache fits in `max_bytes`."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        evicted = 0
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            evicted += 1
+        if evicted:
+            self._record(evictions=evicted)
+
+    def _read_stats(self) -> dict:
+        path = self.root / STATS_FILE
+        if not path.exists():
+            return {'hits': 0, 'misses': 0, 'evictions': 0}
+        with open(path, "r") as file:
+            return json.load(file)
+
+    @contextmanager
+    def _stats_lock(self):
+        """Serializes statistics updates across threads and `alpha` processes sharing the cache."""
+        with _STATS_LOCK, open(self.root / LOCK_FILE, "a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)  # Released when the handle closes
+            yield
+
+    def _record(self, **counts: int):
+        with self._stats_lock():
+            stats = self._read_stats()
+            for name, value in counts.items():
+                stats[name] = stats.get(name, 0) + value
+            tmp_path = self.root / f"{STATS_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as file:
+                json.dump(stats, file)
+            os.replace(tmp_path, self.root / STATS_FILE)
+
+    def stats(self) -> dict:
+        """Cumulative hit/miss/eviction counts plus the current number and size of entries."""
+        stats = self._read_stats()
+        entries = self._entries()
+        lookups = stats['hits'] + stats['misses']
+        stats.update(
+            entries=len(entries),
+            bytes=sum(stat.st_size for _, stat in entries),
+            hit_rate=stats['hits'] / lookups if lookups else 0.0,
+        )
+        return stats
+
+    def clear(self):
+        """Removes every entry and resets the statistics."""
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
+        with self._stats_lock():
+            (self.root / STATS_FILE).unlink(missing_ok=True)
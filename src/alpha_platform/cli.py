@@ -1,14 +1,65 @@
-﻿import typer
+﻿import shutil
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-import pandas as pd
-import numpy as np
-from alpha_platform.data.ingestion import run_ingestion
-from alpha_platform.features.builder import build_features
-from alpha_platform.backtest.engine import run_iterative_backtest
-from alpha_platform.signals.baselines import equal_weight_strategy, trend_following_strategy
+from typing import TYPE_CHECKING
+
+import typer
+
+from alpha_platform.client import DEFAULT_HOST, DEFAULT_PORT, SERVER_ENV_VAR, request, server_url
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from alpha_platform.cache import ArtifactCache
+
+# Heavy modules (pandas, pyarrow, yfinance, sklearn, the engine...) are imported inside the
+# commands that use them, so light commands and the thin client (--server) start instantly.
 
 app = typer.Typer(help="Alpha Platform CLI")
 
+
+@contextmanager
+def _profiled(command: str, profile: bool, profile_memory: bool):
+    """
+    Profiles the enclosed command when requested: prints a per-stage summary table and saves
+    a Chrome trace to data/reports/profile_<command>.json. A no-op otherwise.
+    """
+    if not (profile or profile_memory):
+        yield
+        return
+
+    from alpha_platform.profiling import Profiler, span
+
+    profiler = Profiler(trace_memory=profile_memory)
+    try:
+        with profiler, span(f"cli.{command}"):
+            yield
+    finally:
+        profiler.print_summary(title=f"Profile: alpha {command}")
+        trace_path = profiler.save_trace(Path(f"data/reports/profile_{command}.json"))
+        print(f"Trace saved to {trace_path} (open in chrome://tracing or ui.perfetto.dev)")
+
+
+def _server_request(url: str, command: str, payload: dict) -> dict:
+    """Thin-client mode: forwards a command to `alpha serve` and returns its reply."""
+    print(f"Sending {command} to {url}...")
+    try:
+        reply = request(url, command, payload)
+    except (ConnectionError, ValueError) as exc:
+        print(f"[red]Error: {exc}[/red]")
+        raise typer.Exit(1)
+    print(f"Server answered in {reply['seconds']:.2f}s")
+    return reply
+
+
+def _server_option():
+    return typer.Option(
+        None, "--server", envvar=SERVER_ENV_VAR,
+        help=f"Run on a warm 'alpha serve' process instead (e.g. {server_url()})"
+    )
+
+
 @app.command()
 def hello():
     """Sanity command to verify the CLI is working."""
@@ -18,96 +69,814 @@ def hello():
 def download(
     config: Path = typer.Option(
         ..., "--config", "-c", help="Path to the universe YAML config file"
+    ),
+    full_refresh: bool = typer.Option(
+        False, "--full-refresh", help="Ignore the manifest and re-download the full date range"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Time each stage, print a summary and save a Chrome trace"
+    ),
+    profile_memory: bool = typer.Option(
+        False, "--profile-memory", help="Like --profile, plus peak memory per stage (slower)"
     )
 ):
     """
     Download and cache daily OHLCV data based on a YAML configuration.
+    Only the missing tail per ticker is fetched and appended to the partitioned raw dataset.
+    """
+    from alpha_platform.data.ingestion import run_ingestion
+
+    with _profiled("download", profile, profile_memory):
+        run_ingestion(config, full_refresh=full_refresh)
+
+
+@app.command("run")
+def run_command(
+        config: Path = typer.Option(
+            "configs/pipeline.yaml", "--config", "-c", help="Path to the pipeline YAML config file"
+        ),
+        force: bool = typer.Option(False, "--force", help="Rerun every stage, even if up to date"),
+        dry_run: bool = typer.Option(
+            False, "--dry-run", help="Only list the stages that are out of date"
+        ),
+        workers: int = typer.Option(0, "--workers", "-w", help="Concurrent stages (0 = all CPUs)"),
+        profile: bool = typer.Option(
+            False, "--profile", help="Time each stage, print a summary and save a Chrome trace"
+        ),
+        profile_memory: bool = typer.Option(
+            False, "--profile-memory", help="Like --profile, plus peak memory per stage (slower)"
+        )
+):
+    """
+    Run the download -> features -> backtests -> report pipeline, skipping up-to-date stages.
     """
-    run_ingestion(config)
+    from alpha_platform.data.ingestion import load_config
+    from alpha_platform.pipeline import build_plan, run_pipeline
+
+    with _profiled("run", profile, profile_memory):
+        try:
+            stages = build_plan(load_config(config))
+            status = run_pipeline(stages, workers=workers or None, force=force, dry_run=dry_run)
+        except (FileNotFoundError, ValueError) as exc:
+            print(f"[red]Error: {exc}[/red]")
+            raise typer.Exit(1)
+
+        counts = {state: list(status.values()).count(state) for state in ('ran', 'skipped', 'stale')}
+        label = "would run" if dry_run else "ran"
+        print(
+            f"\n[bold green]Pipeline Complete ✅[/bold green] "
+            f"{counts['stale'] if dry_run else counts['ran']} {label}, {counts['skipped']} up to date"
+        )
+
+
+def _print_cache_stats(cache: "ArtifactCache"):
+    stats = cache.stats()
+    print(
+        f"Cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%}), "
+        f"{stats['entries']} entries, {stats['bytes'] / 1024 ** 2:.1f} MB"
+    )
 
 
 @app.command()
-def features():
+def features(
+        incremental: bool = typer.Option(
+            False, "--incremental", help="Only compute rows newer than the existing features file"
+        ),
+        use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached feature builds"),
+        config: Path = typer.Option(
+            None, "--config", "-c", help="Optional features YAML listing the features to build"
+        ),
+        streaming: bool = typer.Option(
+            False, "--streaming", help="Build out-of-core in ticker batches into a Parquet dataset"
+        ),
+        memory_mb: float = typer.Option(512.0, "--memory-mb", help="Peak memory budget for --streaming"),
+        matrices: bool = typer.Option(
+            True, "--matrices/--no-matrices", help="Also write the memory-mapped matrix store"
+        ),
+        matrix_dtype: str = typer.Option(
+            "float64", "--matrix-dtype", help="Matrix store precision: 'float64' or 'float32'"
+        ),
+        profile: bool = typer.Option(
+            False, "--profile", help="Time each stage, print a summary and save a Chrome trace"
+        ),
+        profile_memory: bool = typer.Option(
+            False, "--profile-memory", help="Like --profile, plus peak memory per stage (slower)"
+        )
+):
     """
     Load raw parquet data, build strictly-timed features, and save to a new parquet.
     """
-    raw_path = Path("data/raw/universe_daily.parquet")
-    out_path = Path("data/features/universe_features.parquet")
+    import pandas as pd
 
-    if not raw_path.exists():
-        print(f"Error: Raw data not found at {raw_path}. Run 'alpha download' first.")
-        raise typer.Exit(1)
+    from alpha_platform.cache import ArtifactCache
+    from alpha_platform.data.ingestion import load_config
+    from alpha_platform.data.matrix_store import (
+        MATRIX_DTYPES,
+        matrix_store_path,
+        write_matrix_store,
+    )
+    from alpha_platform.data.store import load_raw_data
+    from alpha_platform.features.builder import build_features
+    from alpha_platform.features.incremental import context_start_date, update_features
+    from alpha_platform.features.streaming import build_features_streaming
+    from alpha_platform.profiling import span
 
-    print("Loading raw dataset...")
-    df = pd.read_parquet(raw_path)
+    with _profiled("features", profile, profile_memory):
+        if matrix_dtype not in MATRIX_DTYPES:
+            print(f"[red]Error: Unknown matrix dtype '{matrix_dtype}'[/red]")
+            raise typer.Exit(1)
+        raw_dir = Path("data/raw")
+        out_path = Path("data/features/universe_features.parquet")
+        feature_config = load_config(config) if config is not None else {}
+        feature_list = feature_config.get("features")
+        groups = feature_config.get("groups")
 
-    print("Computing features and enforcing timing shifts...")
-    features_df = build_features(df)
+        if streaming:
+            print(f"Streaming feature build with a {memory_mb:g} MB budget...")
+            try:
+                with span("features.streaming_build"):
+                    n_rows = build_features_streaming(
+                        raw_dir, out_path, feature_list, memory_budget_mb=memory_mb
+                    )
+            except FileNotFoundError:
+                print(f"Error: Raw data not found in {raw_dir}. Run 'alpha download' first.")
+                raise typer.Exit(1)
+            except ValueError as exc:
+                print(f"[red]Error: {exc}[/red]")
+                raise typer.Exit(1)
+            print(f"✅ Features streamed to {out_path} ({n_rows} rows)")
+            if matrices:
+                # Built column by column from the dataset, so memory stays at about one matrix
+                with span("features.write_matrices"):
+                    store_dir = write_matrix_store(
+                        out_path, matrix_store_path(out_path), dtype=matrix_dtype
+                    )
+                print(f"✅ Matrix store ({matrix_dtype}) written to {store_dir}")
+            return
 
-    # Ensure output directory exists
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    features_df.to_parquet(out_path, index=False)
+        existing = None
+        if incremental and out_path.exists():
+            with span("features.load_existing"):
+                existing = pd.read_parquet(out_path)
 
-    print(f"✅ Features built and saved to {out_path}")
-    print(f"Dataset shape: {features_df.shape}")
+        print("Loading raw dataset...")
+        try:
+            with span("features.load_raw"):
+                if existing is not None:
+                    start = context_start_date(existing, feature_list)
+                    df = load_raw_data(raw_dir, start_date=None if start is None else str(start.date()))
+                else:
+                    df = load_raw_data(raw_dir)
+        except FileNotFoundError:
+            print(f"Error: Raw data not found in {raw_dir}. Run 'alpha download' first.")
+            raise typer.Exit(1)
+
+        if existing is not None:
+            print("Updating features for new rows only...")
+            try:
+                with span("features.update"):
+                    features_df = update_features(df, existing, feature_list, groups)
+            except ValueError:
+                # Some ticker has sparse history: fall back to reading the full raw history
+                with span("features.update_full_history"):
+                    features_df = update_features(
+                        load_raw_data(raw_dir), existing, feature_list, groups
+                    )
+            print(f"Added {len(features_df) - len(existing)} new rows")
+        else:
+            print("Computing features and enforcing timing shifts...")
+            with span("features.build"):
+                if use_cache:
+                    cache = ArtifactCache()
+                    features_df = cache.call(
+                        build_features, df, features=feature_list, groups=groups
+                    )
+                    _print_cache_stats(cache)
+                else:
+                    features_df = build_features(df, feature_list, groups=groups)
+
+        # Ensure output directory exists (and replace a dataset left by a streaming build)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        if out_path.is_dir():
+            shutil.rmtree(out_path)
+        with span("features.write_parquet"):
+            features_df.to_parquet(out_path, index=False)
+
+        print(f"✅ Features built and saved to {out_path}")
+        print(f"Dataset shape: {features_df.shape}")
+
+        if matrices:
+            with span("features.write_matrices"):
+                store_dir = write_matrix_store(
+                    features_df, matrix_store_path(out_path), dtype=matrix_dtype, source_path=out_path
+                )
+            print(f"✅ Matrix store ({matrix_dtype}) written to {store_dir}")
+
+
+def _print_backtest_metrics(results: "pd.DataFrame", cost_bps: float):
+    from alpha_platform.backtest.metrics import panel_from_frames, summarize
+
+    # Compute metrics
+    _print_metric_lines(summarize(panel_from_frames({'run': results}, cost_bps=cost_bps)).iloc[0])
+
+
+def _print_metric_lines(metrics):
+    """Headline metrics of one run (a summary row, or its dict from the research server)."""
+    print("\n[bold green]Backtest Complete ✅[/bold green]")
+    print(f"Total Cumulative Return: {metrics['total_return'] * 100:.2f}%")
+    print(f"Annualized Volatility:   {metrics['annualized_vol'] * 100:.2f}%")
+    print(f"Annualized Sharpe Ratio: {metrics['sharpe']:.2f}")
+    print(f"Maximum Drawdown:        {metrics['max_drawdown'] * 100:.2f}%")
+    print(f"Average Daily Turnover:  {metrics['avg_turnover'] * 100:.2f}%")
+    print(f"Annual Cost Drag:        {metrics['cost_drag'] * 100:.2f}%")
 
 
 @app.command()
 def backtest(
         costs: float = typer.Option(5.0, "--costs", help="Transaction costs in basis points (bps)"),
         capital: float = typer.Option(100000.0, "--capital", help="Starting capital"),
-        strategy: str = typer.Option("trend", "--strategy", "-s", help="Strategy to run: 'equal_weight' or 'trend'")
+        strategy: str = typer.Option("trend", "--strategy", "-s", help="Strategy to run: 'equal_weight' or 'trend'"),
+        engine: str = typer.Option(
+            "numpy", "--engine", help="Simulation engine: 'numpy' (fast kernel) or 'pandas' (reference loop)"
+        ),
+        use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached strategy weights"),
+        band: float = typer.Option(0.0, "--band", help="No-trade band around target weights (0 = off)"),
+        band_type: str = typer.Option(
+            "absolute", "--band-type", help="Band measured in 'absolute' or 'relative' weight drift"
+        ),
+        rebalance: str = typer.Option(
+            "daily", "--rebalance", help="Rebalance calendar: 'daily', 'weekly' or 'monthly'"
+        ),
+        target_vol: float = typer.Option(
+            None, "--target-vol", help="Scale weights to this annualized volatility (e.g. 0.10)"
+        ),
+        max_leverage: float = typer.Option(2.0, "--max-leverage", help="Cap on the vol-targeting scale"),
+        cov_method: str = typer.Option(
+            "rolling", "--cov-method", help="Risk model covariance: 'rolling' or 'ewma'"
+        ),
+        cov_window: int = typer.Option(63, "--cov-window", help="Rolling covariance window in days"),
+        halflife: float = typer.Option(21.0, "--halflife", help="EWMA covariance half-life in days"),
+        min_periods: int = typer.Option(
+            20, "--min-periods", help="Days of history before vol targeting starts"
+        ),
+        max_weight: float = typer.Option(None, "--max-weight", help="Per-asset cap on |weight|"),
+        max_gross: float = typer.Option(None, "--max-gross", help="Cap on gross exposure (sum of |weight|)"),
+        profile: bool = typer.Option(
+            False, "--profile", help="Time each stage, print a summary and save a Chrome trace"
+        ),
+        profile_memory: bool = typer.Option(
+            False, "--profile-memory", help="Like --profile, plus peak memory per stage (slower)"
+        ),
+        server: str = _server_option()
 ):
     """
     Run a Wide-Matrix Iterative backtest using a specific strategy.
     """
+    options = {
+        'strategy': strategy, 'costs': costs, 'capital': capital, 'engine': engine,
+        'band': band, 'band_type': band_type, 'rebalance': rebalance,
+        'target_vol': target_vol, 'max_leverage': max_leverage, 'cov_method': cov_method,
+        'cov_window': cov_window, 'halflife': halflife, 'min_periods': min_periods,
+        'max_weight': max_weight, 'max_gross': max_gross,
+    }
+    if server:
+        reply = _server_request(server, "backtest", options)
+        if 'portfolio' in reply:
+            print(f"Predicted Vol (median):  {reply['portfolio']['predicted_vol']:.2%}")
+            print(f"Vol Scale (median):      {reply['portfolio']['scale']:.2f}")
+            print(f"Gross Exposure (max):    {reply['portfolio']['gross_exposure']:.2f}")
+        _print_metric_lines(reply['metrics'])
+        if 'rebalance' in reply:
+            report = reply['rebalance']
+            print(f"Rebalance Days:          {report['rebalance_days']} / {report['total_days']}")
+            print(f"Turnover Saved:          {report['turnover_saved']:.1%}")
+        print(f"\nResults saved to {reply['saved']} (by the server)")
+        return
+
+    import pandas as pd
+
+    from alpha_platform.backtest.engine import prepare_prices
+    from alpha_platform.backtest.rebalance import rebalance_report
+    from alpha_platform.cache import ArtifactCache
+    from alpha_platform.data.matrix_store import INDEX_FILE, MatrixStore, matrix_store_path
+    from alpha_platform.pipeline import backtest_spec, daily_reference, simulate
+    from alpha_platform.profiling import span
+    from alpha_platform.signals.baselines import STRATEGY_FEATURES, strategy_weights
+    from alpha_platform.signals.wide import pivot_features
+
+    with _profiled("backtest", profile, profile_memory):
+        features_path = Path("data/features/universe_features.parquet")
+
+        if not features_path.exists():
+            print("Error: Features not found. Run 'alpha features' first.")
+            raise typer.Exit(1)
+        # Same validation as the pipeline and `alpha serve`
+        try:
+            spec = backtest_spec(strategy, options)
+        except ValueError as exc:
+            print(f"[red]Error: {exc}[/red]")
+            raise typer.Exit(1)
+        needed = STRATEGY_FEATURES[strategy]
+
+        target_weights = None
+        store_dir = matrix_store_path(features_path)
+        store = MatrixStore(store_dir) if (store_dir / INDEX_FILE).exists() else None
+        if store is not None and store.is_current(features_path):
+            # Fast path: memory-map the pre-pivoted matrices, nothing to decode or pivot
+            print(f"Opening matrix store {store_dir} ({store.dtype})...")
+            features = store.features(needed)
+            with span("backtest.prepare_prices"):
+                prices = store.frame('Close').ffill()
+        else:
+            print(f"Loading features from {features_path}...")
+            with span("backtest.load_features"):
+                df = pd.read_parquet(features_path)
+            features = {}
+            if use_cache:
+                cache = ArtifactCache()
+                with span("backtest.signals"):
+                    target_weights = cache.call(strategy_weights, df, strategy=strategy)
+                _print_cache_stats(cache)
+            else:
+                features = pivot_features(df, needed)
+            with span("backtest.prepare_prices"):
+                prices = prepare_prices(df)
+
+        # --- Signals -> portfolio construction -> engine (shared with the pipeline and server) ---
+        print(f"Applying [cyan]{strategy}[/cyan] signal logic...")
+        print(f"Running Iterative backtest with {costs} bps costs ({engine} engine)...")
+        results, diagnostics = simulate(features, prices, spec, target_weights)
+        if diagnostics is not None:
+            print(f"Predicted Vol (median):  {diagnostics['predicted_vol'].median():.2%}")
+            print(f"Vol Scale (median):      {diagnostics['scale'].median():.2f}")
+            print(f"Gross Exposure (max):    {diagnostics['gross_exposure'].max():.2f}")
+
+        _print_backtest_metrics(results, costs)
+
+        if 'rebalanced' in results.columns:
+            # Compare with trading every asset back to target every day
+            with span("backtest.reference_run"):
+                reference, _ = simulate(features, prices, daily_reference(spec), target_weights)
+            report = rebalance_report(results, reference)
+            print(f"Rebalance Days:          {report['rebalance_days']} / {report['total_days']}")
+            print(
+                f"Turnover Saved:          {report['turnover_saved']:.1%} "
+                f"(vs daily full rebalancing, final equity {report['reference_final_equity']:,.0f})"
+            )
+
+        # Save the results
+        out_path = Path(f"data/reports/backtest_results_{strategy}.parquet")
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        results.to_parquet(out_path)
+        print(f"\nResults saved to {out_path}")
+
+
+@app.command("cache")
+def cache_command(
+        clear: bool = typer.Option(False, "--clear", help="Delete every cached artifact"),
+        max_mb: float = typer.Option(
+            0.0, "--max-mb", help="Evict least-recently-used entries down to this size"
+        )
+):
+    """
+    Show statistics for the local artifact cache, or clear / shrink it.
+    """
+    from alpha_platform.cache import ArtifactCache
+
+    cache = ArtifactCache()
+    if clear:
+        cache.clear()
+        print("Cache cleared ✅")
+    elif max_mb > 0:
+        cache.max_bytes = int(max_mb * 1024 ** 2)
+        cache.evict()
+    _print_cache_stats(cache)
+    print(f"Evictions so far: {cache.stats()['evictions']}")
+
+
+def _parse_list(raw: str, cast=str) -> list:
+    """Splits a comma-separated CLI value into a list of typed items."""
+    return [cast(item.strip()) for item in raw.split(",") if item.strip()]
+
+
+@app.command()
+def sweep(
+        strategies: str = typer.Option("equal_weight,trend", "--strategies", help="Comma-separated strategies"),
+        costs: str = typer.Option("0,5,10,20", "--costs", help="Comma-separated transaction costs in bps"),
+        capital: str = typer.Option(
+            "100000", "--capital", help="Comma-separated starting capital levels"
+        ),
+        server: str = _server_option()
+):
+    """
+    Run a batched parameter sweep (strategies x costs x capital) in a single pass.
+    """
+    try:
+        strategy_list = _parse_list(strategies)
+        cost_list = _parse_list(costs, float)
+        capital_list = _parse_list(capital, float)
+    except ValueError as exc:
+        print(f"[red]Error: Could not parse sweep parameters ({exc})[/red]")
+        raise typer.Exit(1)
+
+    if server:
+        reply = _server_request(server, "sweep", {
+            'strategies': strategy_list, 'costs': cost_list, 'capital': capital_list,
+        })
+        print("\n[bold green]Sweep Complete ✅[/bold green]")
+        print(reply['table'])
+        print(f"\nResults saved to {reply['saved']} (by the server)")
+        return
+
+    import pandas as pd
+
+    from alpha_platform.backtest.sweep import run_sweep, summarize_sweep
+    from alpha_platform.signals.baselines import STRATEGIES
+
     features_path = Path("data/features/universe_features.parquet")
 
     if not features_path.exists():
         print("Error: Features not found. Run 'alpha features' first.")
         raise typer.Exit(1)
 
+    unknown = [name for name in strategy_list if name not in STRATEGIES]
+    if unknown:
+        print(f"[red]Error: Unknown strategies {unknown}[/red]")
+        raise typer.Exit(1)
+
     print(f"Loading features from {features_path}...")
     df = pd.read_parquet(features_path)
 
-    # --- The Brain: Generate Target Weights ---
-    print(f"Applying [cyan]{strategy}[/cyan] signal logic...")
-    if strategy == "equal_weight":
-        df = equal_weight_strategy(df)
-    elif strategy == "trend":
-        df = trend_following_strategy(df)
-    else:
-        print(f"[red]Error: Unknown strategy '{strategy}'[/red]")
+    n_scenarios = len(strategy_list) * len(cost_list) * len(capital_list)
+    print(f"Running {n_scenarios} scenarios in one batched pass...")
+    results = run_sweep(df, strategy_list, cost_list, capital_list)
+    summary = summarize_sweep(results)
+
+    print("\n[bold green]Sweep Complete ✅[/bold green]")
+    print(summary.to_string(index=False))
+
+    out_path = Path("data/reports/sweep_results.parquet")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    results.to_parquet(out_path, index=False)
+    print(f"\nResults saved to {out_path}")
+
+
+@app.command()
+def grid(
+        strategies: str = typer.Option("equal_weight,trend", "--strategies", help="Comma-separated strategies"),
+        costs: str = typer.Option("5", "--costs", help="Comma-separated transaction costs in bps"),
+        capital: float = typer.Option(100000.0, "--capital", help="Starting capital"),
+        window_days: int = typer.Option(
+            0, "--window-days", help="Walk-forward window length in trading days (0 = full history)"
+        ),
+        step_days: int = typer.Option(0, "--step-days", help="Trading days between window starts"),
+        workers: int = typer.Option(0, "--workers", "-w", help="Worker processes (0 = all CPUs)")
+):
+    """
+    Run independent (strategy, cost, window) backtests in parallel over a process pool.
+    """
+    import pandas as pd
+
+    from alpha_platform.backtest.scheduler import RunSpec, rolling_windows, run_specs
+    from alpha_platform.backtest.sweep import summarize_sweep
+    from alpha_platform.signals.baselines import STRATEGIES
+
+    features_path = Path("data/features/universe_features.parquet")
+
+    if not features_path.exists():
+        print("Error: Features not found. Run 'alpha features' first.")
         raise typer.Exit(1)
 
-    # --- The Engine: Execute Trades ---
-    print(f"Running Iterative backtest with {costs} bps costs...")
-    results = run_iterative_backtest(df, initial_capital=capital, cost_bps=costs)
+    try:
+        strategy_list = _parse_list(strategies)
+        cost_list = _parse_list(costs, float)
+    except ValueError as exc:
+        print(f"[red]Error: Could not parse grid parameters ({exc})[/red]")
+        raise typer.Exit(1)
 
-    # Compute metrics
-    total_return = (results['cumulative_net'].iloc[-1] - 1) * 100
-    if len(results) > 1 and results['net_ret'].std() > 0:
-        annualized_vol = results['net_ret'].std() * np.sqrt(252) * 100
-        sharpe = (results['net_ret'].mean() / results['net_ret'].std()) * np.sqrt(252)
-    else:
-        annualized_vol = 0.0
-        sharpe = 0.0
+    unknown = [name for name in strategy_list if name not in STRATEGIES]
+    if unknown:
+        print(f"[red]Error: Unknown strategies {unknown}[/red]")
+        raise typer.Exit(1)
 
-    avg_daily_turnover = results['turnover'].mean() * 100
+    print(f"Loading features from {features_path}...")
+    df = pd.read_parquet(features_path)
 
-    print("\n[bold green]Backtest Complete ✅[/bold green]")
-    print(f"Total Cumulative Return: {total_return:.2f}%")
-    print(f"Annualized Volatility:   {annualized_vol:.2f}%")
-    print(f"Annualized Sharpe Ratio: {sharpe:.2f}")
-    print(f"Average Daily Turnover:  {avg_daily_turnover:.2f}%")
+    windows = [(None, None)]
+    if window_days > 0:
+        dates = pd.DatetimeIndex(sorted(df['Date'].unique()))
+        windows = rolling_windows(dates, window_days, step_days or None)
 
-    # Save the results
-    out_path = Path(f"data/reports/backtest_results_{strategy}.parquet")
+    specs = [
+        RunSpec(strategy=name, cost_bps=cost, initial_capital=capital, start_date=start, end_date=end)
+        for name in strategy_list
+        for cost in cost_list
+        for start, end in windows
+    ]
+    results = run_specs(df, specs, workers=workers or None)
+
+    summary = summarize_sweep(results, keys=['run_id', 'strategy', 'cost_bps', 'start_date', 'end_date'])
+    print("\n[bold green]Grid Complete ✅[/bold green]")
+    print(summary.to_string(index=False))
+
+    out_path = Path("data/reports/grid_results.parquet")
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    results.to_parquet(out_path)
+    results.to_parquet(out_path, index=False)
     print(f"\nResults saved to {out_path}")
 
 
+@app.command()
+def walkforward(
+        model: str = typer.Option("ridge", "--model", "-m", help="Model: 'ridge' (incremental) or 'tree'"),
+        horizon: int = typer.Option(1, "--horizon", help="Forward-return horizon in trading days"),
+        train_days: int = typer.Option(504, "--train-days", help="Training window in trading days"),
+        test_days: int = typer.Option(63, "--test-days", help="Out-of-sample block per fold"),
+        rolling: bool = typer.Option(False, "--rolling", help="Rolling instead of expanding windows"),
+        alpha: float = typer.Option(1.0, "--alpha", help="Ridge penalty (on standardized features)"),
+        config: Path = typer.Option(
+            None, "--config", "-c", help="Optional features YAML listing the model inputs"
+        ),
+        costs: float = typer.Option(5.0, "--costs", help="Transaction costs in basis points (bps)"),
+        capital: float = typer.Option(100000.0, "--capital", help="Starting capital"),
+        workers: int = typer.Option(0, "--workers", "-w", help="Parallel fold workers (0 = all CPUs)")
+):
+    """
+    Train walk-forward models on the features, predict out of sample and backtest the signal.
+    """
+    import pandas as pd
+
+    from alpha_platform.backtest.engine import prepare_prices, run_wide_backtest
+    from alpha_platform.data.ingestion import load_config
+    from alpha_platform.models.walkforward import MODELS, predictions_to_weights, run_walk_forward
+
+    features_path = Path("data/features/universe_features.parquet")
+
+    if not features_path.exists():
+        print("Error: Features not found. Run 'alpha features' first.")
+        raise typer.Exit(1)
+    if model not in MODELS:
+        print(f"[red]Error: Unknown model '{model}'[/red]")
+        raise typer.Exit(1)
+
+    print(f"Loading features from {features_path}...")
+    df = pd.read_parquet(features_path)
+    feature_list = load_config(config).get("features") if config is not None else None
+
+    try:
+        result = run_walk_forward(
+            df, feature_list, model=model, horizon=horizon, train_days=train_days,
+            test_days=test_days, expanding=not rolling, alpha=alpha, workers=workers or None
+        )
+    except ValueError as exc:
+        print(f"[red]Error: {exc}[/red]")
+        raise typer.Exit(1)
+
+    print(f"Running Iterative backtest with {costs} bps costs...")
+    results = run_wide_backtest(
+        prepare_prices(df), predictions_to_weights(result.predictions),
+        initial_capital=capital, cost_bps=costs
+    )
+    _print_backtest_metrics(results, costs)
+
+    out_dir = Path("data/reports")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    result.predictions.to_parquet(out_dir / f"walkforward_predictions_{model}.parquet", index=False)
+    results.to_parquet(out_dir / f"backtest_results_walkforward_{model}.parquet")
+    print(f"\nPredictions and results saved to {out_dir}")
+
+
+@app.command()
+def report(
+        paths: list[Path] = typer.Argument(
+            None, help="Results Parquet files (default: every results file in data/reports)"
+        ),
+        benchmark: str = typer.Option(
+            None, "--benchmark", "-b", help="Run to measure beta / tracking error against"
+        ),
+        costs: float = typer.Option(
+            5.0, "--costs", help="Costs in bps for results files that do not record them"
+        ),
+        window: int = typer.Option(
+            None, "--window", help="Rolling window in trading days (default: 63)"
+        ),
+        sort: str = typer.Option("sharpe", "--sort", help="Summary column to rank runs by"),
+        top: int = typer.Option(20, "--top", help="Runs to print (0 = all)"),
+        server: str = _server_option()
+):
+    """
+    Compute the full performance analytics of saved backtest, sweep and grid results side by side.
+    """
+    if server:
+        reply = _server_request(server, "report", {
+            'paths': [str(path) for path in paths or []], 'benchmark': benchmark, 'costs': costs,
+            'window': window, 'sort': sort, 'top': top,
+        })
+        print(
+            f"\n[bold green]Report Complete ✅[/bold green] {reply['runs']} runs, ranked by {sort}"
+        )
+        print(reply['table'])
+        print(f"\nSummary and per-day analytics saved to {reply['saved']} (by the server)")
+        return
+
+    from alpha_platform.backtest.metrics import (
+        DEFAULT_WINDOW,
+        find_results,
+        load_panel,
+        rank_summary,
+        summarize,
+        timeseries,
+    )
+
+    reports_dir = Path("data/reports")
+    paths = paths or find_results(reports_dir)
+    if not paths:
+        print("Error: No results found. Run 'alpha backtest' or 'alpha sweep' first.")
+        raise typer.Exit(1)
+
+    print(f"Loading {len(paths)} results file(s)...")
+    try:
+        panel = load_panel(paths, cost_bps=costs)
+        summary = summarize(panel, benchmark=benchmark)
+        shown = rank_summary(summary, sort, top, benchmark)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"[red]Error: {exc}[/red]")
+        raise typer.Exit(1)
+
+    print(f"\n[bold green]Report Complete ✅[/bold green] {len(summary)} runs, ranked by {sort}")
+    print(shown.to_string(float_format=lambda value: f"{value:.4f}"))
+
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    summary.reset_index().to_parquet(reports_dir / "report_summary.parquet", index=False)
+    timeseries(panel, window or DEFAULT_WINDOW).to_parquet(
+        reports_dir / "report_timeseries.parquet", index=False
+    )
+    print(f"\nSummary and per-day analytics saved to {reports_dir}")
+
+
+@app.command()
+def robustness(
+        paths: list[Path] = typer.Argument(
+            None, help="Results Parquet files (default: data/reports/backtest_results_*.parquet)"
+        ),
+        baseline: str = typer.Option(
+            "equal_weight", "--baseline", "-b", help="Run to test against"
+        ),
+        samples: int = typer.Option(2000, "--samples", help="Bootstrap resamples"),
+        permutations: int = typer.Option(2000, "--permutations", help="Permutation test draws"),
+        method: str = typer.Option(
+            "stationary", "--method", help="Bootstrap: 'stationary' (random blocks) or 'block'"
+        ),
+        block_length: float = typer.Option(
+            20.0, "--block-length", help="(Mean) block length in days"
+        ),
+        level: float = typer.Option(0.95, "--level", help="Confidence level of the intervals"),
+        seed: int = typer.Option(0, "--seed", help="Seed of the resampling RNG streams"),
+        chunk_size: int = typer.Option(500, "--chunk-size", help="Resamples evaluated per batch")
+):
+    """
+    Bootstrap confidence intervals and p-values of each strategy vs. the baseline.
+    """
+    from alpha_platform.backtest.metrics import load_panel
+    from alpha_platform.backtest.robustness import BOOTSTRAP_METHODS, bootstrap, permutation_test
+
+    reports_dir = Path("data/reports")
+    paths = paths or sorted(reports_dir.glob("backtest_results_*.parquet"))
+    if not paths:
+        print("Error: No results found. Run 'alpha backtest' first.")
+        raise typer.Exit(1)
+    if method not in BOOTSTRAP_METHODS:
+        print(f"[red]Error: Unknown bootstrap method '{method}'[/red]")
+        raise typer.Exit(1)
+
+    print(f"Loading {len(paths)} results file(s)...")
+    try:
+        returns = load_panel(paths).returns
+        print(f"Resampling {returns.shape[1]} runs {samples} times ({method} bootstrap)...")
+        result = bootstrap(
+            returns, n_samples=samples, block_length=block_length, method=method, seed=seed,
+            chunk_size=chunk_size
+        )
+        comparison = result.compare(baseline)
+        permuted = permutation_test(
+            returns, baseline, n_permutations=permutations, block_length=int(block_length),
+            seed=seed, chunk_size=chunk_size
+        )
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"[red]Error: {exc}[/red]")
+        raise typer.Exit(1)
+
+    intervals = result.intervals(level)
+    print(f"\n[bold green]Robustness Complete ✅[/bold green] {level:.0%} intervals")
+    print(intervals.to_string(index=False, float_format=lambda value: f"{value:.4f}"))
+    print(f"\nBootstrap p-values vs {baseline} (H0: no better than the baseline)")
+    print(comparison.to_string(index=False, float_format=lambda value: f"{value:.4f}"))
+    print(f"\nBlock permutation test of the Sharpe difference vs {baseline}")
+    print(permuted.to_string(index=False, float_format=lambda value: f"{value:.4f}"))
+
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    intervals.to_parquet(reports_dir / "robustness_intervals.parquet", index=False)
+    comparison.merge(
+        permuted[['strategy', 'p_value']].rename(columns={'p_value': 'permutation_p_value'}),
+        on='strategy'
+    ).to_parquet(reports_dir / "robustness_pvalues.parquet", index=False)
+    result.samples.to_parquet(reports_dir / "robustness_samples.parquet", index=False)
+    print(f"\nIntervals, p-values and metric distributions saved to {reports_dir}")
+
+
+@app.command()
+def bench(
+        tickers: str = typer.Option("10,500,5000", "--tickers", help="Comma-separated universe sizes"),
+        days: int = typer.Option(1260, "--days", help="Trading days per synthetic ticker"),
+        missing: float = typer.Option(0.05, "--missing", help="Share of (Date, Ticker) rows dropped"),
+        repeats: int = typer.Option(3, "--repeats", help="Timed runs per stage (the fastest is kept)"),
+        seed: int = typer.Option(0, "--seed", help="Seed of the synthetic data generator"),
+        out: Path = typer.Option(
+            None, "--out", help="Results JSON (default: data/benchmarks/bench_<timestamp>.json)"
+        ),
+        baseline: Path = typer.Option(None, "--baseline", help="Earlier results JSON to check against"),
+        threshold: float = typer.Option(
+            0.25, "--threshold", help="Allowed slowdown vs the baseline before failing (0.25 = +25%)"
+        )
+):
+    """
+    Time and memory-profile every pipeline stage on synthetic universes, offline.
+    """
+    from alpha_platform.bench.suite import (
+        DEFAULT_RESULTS_DIR,
+        compare_reports,
+        load_report,
+        run_benchmarks,
+        save_report,
+    )
+
+    try:
+        scales = _parse_list(tickers, int)
+    except ValueError as exc:
+        print(f"[red]Error: Could not parse benchmark scales ({exc})[/red]")
+        raise typer.Exit(1)
+    if baseline is not None and not baseline.exists():
+        print(f"[red]Error: Baseline {baseline} not found[/red]")
+        raise typer.Exit(1)
+
+    report = run_benchmarks(scales, n_days=days, missing_frac=missing, repeats=repeats, seed=seed)
+    if out is None:
+        out = DEFAULT_RESULTS_DIR / f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    save_report(report, out)
+    print(f"\n[bold green]Benchmarks Complete ✅[/bold green] Results saved to {out}")
+
+    if baseline is not None:
+        regressions = compare_reports(load_report(baseline), report, threshold=threshold)
+        if regressions:
+            print(
+                f"[red]{len(regressions)} stage(s) slower than {baseline} "
+                f"by more than {threshold:.0%}:[/red]"
+            )
+            for r in regressions:
+                print(
+                    f"  {r['stage']} @ {r['n_tickers']} tickers: "
+                    f"{r['baseline_seconds']:.4f}s -> {r['seconds']:.4f}s (x{r['ratio']:.2f})"
+                )
+            raise typer.Exit(1)
+        print(f"No regressions beyond {threshold:.0%} vs {baseline} ✅")
+
+
+@app.command()
+def serve(
+        host: str = typer.Option(DEFAULT_HOST, "--host", help="Interface to listen on"),
+        port: int = typer.Option(DEFAULT_PORT, "--port", "-p", help="Port to listen on"),
+        features_path: Path = typer.Option(
+            Path("data/features/universe_features.parquet"), "--features",
+            help="Features to keep loaded"
+        ),
+        preload: bool = typer.Option(
+            True, "--preload/--lazy", help="Load the matrices at startup instead of on first use"
+        ),
+        status: bool = typer.Option(False, "--status", help="Query a running server and exit"),
+        stop: bool = typer.Option(False, "--stop", help="Stop a running server and exit")
+):
+    """
+    Keep the feature matrices resident and answer backtest / sweep / report requests over HTTP.
+    Point the CLI at it with --server (or ALPHA_SERVER) to skip every load and pivot.
+    """
+    url = server_url(host, port)
+    if status or stop:
+        try:
+            reply = request(url, "shutdown" if stop else "health")
+        except (ConnectionError, ValueError) as exc:
+            print(f"[red]Error: {exc}[/red]")
+            raise typer.Exit(1)
+        print(reply)
+        return
+
+    from alpha_platform.server import serve as run_server
+
+    try:
+        run_server(features_path, host=host, port=port, preload=preload)
+    except (FileNotFoundError, OSError) as exc:
+        print(f"[red]Error: {exc}[/red]")
+        raise typer.Exit(1)
+
+
 def main():
     app()
 
@@ -0,0 +1,41 @@
+import json
+import urllib.error
+import urllib.request
+
+# Standard library only: the thin client must not pay for pandas / numpy imports
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+SERVER_ENV_VAR = "ALPHA_SERVER"
+
+
+def server_url(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> str:
+    return f"http://{host}:{port}"
+
+
+def request(url: str, command: str, payload: dict | None = None, timeout: float = 600.0) -> dict:
+    """
+    Sends one request to an `alpha serve` process and returns its JSON reply.
+    GET for 'health', POST with a JSON body otherwise.
+
+    Raises:
+        ConnectionError: Nothing is listening at `url`.
+        ValueError: The server rejected the request (its error message is passed on).
+    """
+    data = None if command == "health" else json.dumps(payload or {}).encode()
+    req = urllib.request.Request(
+        f"{url.rstrip('/')}/{command}", data=data, headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        try:
+            message = json.loads(exc.read()).get('error', exc.reason)
+        except ValueError:
+            message = exc.reason
+        raise ValueError(message) from None
+    except urllib.error.URLError as exc:
+        raise ConnectionError(
+            f"No alpha server at {url} ({exc.reason}). Start one with 'alpha serve'."
+        ) from None
@@ -1,10 +1,27 @@
-import yaml
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
 import pandas as pd
-import yfinance as yf
+import yaml
 from rich.console import Console
+
+from alpha_platform.data.providers import DataProvider, YahooProvider, make_provider
+from alpha_platform.data.store import (
+    LEGACY_FILE,
+    append_raw_data,
+    dataset_root,
+    read_manifest,
+    replace_raw_data,
+)
+from alpha_platform.profiling import span
+
 console = Console()
 
+# Failures worth retrying (network, timeouts, I/O); anything else is a bug and propagates
+TRANSIENT_ERRORS = (ConnectionError, TimeoutError, OSError)
+
 
 def load_config(config_path: str | Path) -> dict:
     """
@@ -27,47 +44,126 @@ def load_config(config_path: str | Path) -> dict:
     return config
 
 
-def download_and_clean_data(tickers: list[str], start_date: str, end_date: str) -> pd.DataFrame:
+class RateLimiter:
     """
-    Downloads OHLCV data, cleans it, and returns a long-format DataFrame.
+    Thread-safe limiter that spaces out calls to at most `rate` per second.
+    A rate of None (or <= 0) disables limiting.
     """
-    dfs = []
-    for ticker in tickers:
-        console.print(f"Downloading [cyan]{ticker}[/cyan]...")
 
-        # Download data from Yahoo Finance
-        df = yf.download(ticker, start=start_date, end=end_date, progress=False)
+    def __init__(self, rate: float | None = None):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
 
-        if df.empty:
-            console.print(f"[yellow]Warning: No data found for {ticker}[/yellow]")
-            continue
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def fetch_with_retry(
+        provider: DataProvider,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        retries: int = 3,
+        backoff: float = 1.0,
+        rate_limiter: RateLimiter | None = None
+) -> pd.DataFrame:
+    """
+    Fetches one ticker, retrying failed requests (TRANSIENT_ERRORS) with exponential backoff.
+    Returns an empty DataFrame (and logs a warning) once all attempts are exhausted.
+    Other exceptions are programming errors and propagate on the first attempt.
+    """
+    for attempt in range(retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        try:
+            return provider.fetch(ticker, start_date, end_date)
+        except TRANSIENT_ERRORS as exc:
+            if attempt == retries:
+                console.print(
+                    f"[yellow]Warning: Giving up on {ticker} after {retries + 1} attempts ({exc})[/yellow]"
+                )
+                return pd.DataFrame()
+            delay = backoff * 2 ** attempt
+            console.print(f"[yellow]Retrying {ticker} in {delay:.1f}s ({exc})[/yellow]")
+            time.sleep(delay)
+
+
+def clean_ticker_frame(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    """
+    Cleans one ticker's raw bars into the long-format schema (Date column, Ticker, OHLCV).
+    """
+    # 1. Flatten MultiIndex columns (Grabs 'Close', 'Open', etc., drops 'SPY')
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+
+    # 2. Move Date from the index to a column
+    df = df.reset_index()
+
+    # 3. Standardize the 'Date' column name just in case yfinance lowercased it
+    df.rename(columns={'index': 'Date', 'date': 'Date'}, inplace=True)
+
+    # 4. Strip timezones so all assets share the exact same calendar
+    df['Date'] = pd.to_datetime(df['Date']).dt.tz_localize(None)
+    df['Ticker'] = ticker
+
+    # 5. Sort chronologically
+    df = df.sort_values('Date')
 
-        # 1. Flatten MultiIndex columns (Grabs 'Close', 'Open', etc., drops 'SPY')
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
+    # 6. DEFENSIVE PROGRAMMING: Only forward-fill columns that actually exist!
+    possible_price_cols = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+    cols_to_ffill = [col for col in possible_price_cols if col in df.columns]
 
-        # 2. Move Date from the index to a column
-        df = df.reset_index()
+    # Forward fill up to 5 days of missing prices to prevent data leakage.
+    if cols_to_ffill:
+        df[cols_to_ffill] = df[cols_to_ffill].ffill(limit=5)
 
-        # 3. Standardize the 'Date' column name just in case yfinance lowercased it
-        df.rename(columns={'index': 'Date', 'date': 'Date'}, inplace=True)
+    return df
 
-        # 4. Strip timezones so all assets share the exact same calendar
-        df['Date'] = pd.to_datetime(df['Date']).dt.tz_localize(None)
-        df['Ticker'] = ticker
 
-        # 5. Sort chronologically
-        df = df.sort_values('Date')
+def download_and_clean_data(
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+        provider: DataProvider | None = None,
+        max_workers: int = 8,
+        retries: int = 3,
+        backoff: float = 1.0,
+        rate_limit: float | None = None
+) -> pd.DataFrame:
+    """
+    Downloads OHLCV data, cleans it, and returns a long-format DataFrame.
+
+    Tickers are fetched and cleaned concurrently on a bounded thread pool (downloads are
+    network-bound), with per-ticker retries and an optional global rate limit in requests/second.
+    The output is stacked in the order of `tickers`, so it does not depend on completion order.
+    """
+    provider = provider or YahooProvider()
+    rate_limiter = RateLimiter(rate_limit)
+
+    def fetch_and_clean(ticker: str) -> pd.DataFrame | None:
+        console.print(f"Downloading [cyan]{ticker}[/cyan]...")
+        with span("ingest.fetch", ticker=ticker):
+            df = fetch_with_retry(
+                provider, ticker, start_date, end_date, retries, backoff, rate_limiter
+            )
 
-        # 6. DEFENSIVE PROGRAMMING: Only forward-fill columns that actually exist!
-        possible_price_cols = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-        cols_to_ffill = [col for col in possible_price_cols if col in df.columns]
+        if df.empty:
+            console.print(f"[yellow]Warning: No data found for {ticker}[/yellow]")
+            return None
 
-        # Forward fill up to 5 days of missing prices to prevent data leakage.
-        if cols_to_ffill:
-            df[cols_to_ffill] = df[cols_to_ffill].ffill(limit=5)
+        with span("ingest.clean", ticker=ticker):
+            return clean_ticker_frame(df, ticker)
 
-        dfs.append(df)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        dfs = [df for df in executor.map(fetch_and_clean, tickers) if df is not None]
 
     if not dfs:
         raise ValueError("No data downloaded. Check your internet or universe.yaml.")
@@ -92,22 +188,99 @@ def print_summary(df: pd.DataFrame):
     console.print(f"Missing Values: {missing_data}")
 
 
-def run_ingestion(config_path: Path):
-    """Orchestrates the loading, downloading, summarizing, and saving."""
-    config = load_config(config_path)
+def _missing_ranges(
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+        manifest: dict
+) -> dict[str, list[str]]:
+    """
+    Groups tickers by the first date they still need, based on the manifest's last-ingested dates.
+    Tickers already up to date are dropped. Moving `start_date` earlier does not backfill
+    stored tickers; use a full refresh for that.
+    """
+    groups: dict[str, list[str]] = {}
+    for ticker in tickers:
+        entry = manifest.get(ticker)
+        fetch_from = pd.Timestamp(start_date)
+        if entry is not None:
+            fetch_from = max(fetch_from, pd.Timestamp(entry['last_date']) + pd.Timedelta(days=1))
+        if fetch_from < pd.Timestamp(end_date):
+            groups.setdefault(str(fetch_from.date()), []).append(ticker)
+    return groups
+
+
+def run_ingestion(config_path: Path, full_refresh: bool = False):
+    """
+    Orchestrates the loading, downloading, summarizing, and saving.
+
+    Raw data is kept as a partitioned Parquet dataset (one file per ticker and year) with a manifest
+    of last-ingested dates, so a refresh only fetches and appends each ticker's missing tail.
+    """
+    ingest_universe(load_config(config_path), full_refresh=full_refresh)
+
+
+def ingest_universe(config: dict, full_refresh: bool = False):
+    """`run_ingestion` for an already-loaded universe config (e.g. a pipeline config section)."""
     tickers = config.get("tickers", [])
     start_date = config.get("start_date")
-    end_date = config.get("end_date")
+    # yfinance treats end dates as exclusive; no end date means "up to and including today"
+    end_date = config.get("end_date") or str((pd.Timestamp.today() + pd.Timedelta(days=1)).date())
     output_dir = Path(config.get("output_dir", "data/raw"))
+    root = dataset_root(output_dir)
 
     # Ensure the data/raw folder exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Run the pipeline
-    df = download_and_clean_data(tickers, start_date, end_date)
+    # One-time migration of a legacy monolithic file into the partitioned dataset
+    legacy_path = output_dir / LEGACY_FILE
+    if not full_refresh and not read_manifest(root) and legacy_path.exists():
+        console.print(f"Importing legacy {legacy_path} into the partitioned dataset...")
+        with span("ingest.legacy_import"):
+            append_raw_data(pd.read_parquet(legacy_path), root)
+
+    # A full refresh leaves the stored data in place until its replacement has downloaded
+    manifest = {} if full_refresh else read_manifest(root)
+
+    groups = _missing_ranges(tickers, start_date, end_date, manifest)
+    if not groups:
+        console.print("[bold green]Raw dataset already up to date ✅[/bold green]\n")
+        return
+
+    # Run the pipeline (one concurrent download per group of tickers sharing a start date)
+    new_frames = []
+    for fetch_from, group in groups.items():
+        console.print(f"Fetching {len(group)} ticker(s) from {fetch_from} to {end_date}...")
+        try:
+            with span("ingest.download", tickers=len(group)):
+                new_frames.append(download_and_clean_data(
+                    group,
+                    fetch_from,
+                    end_date,
+                    provider=make_provider(config),
+                    max_workers=config.get("max_workers", 8),
+                    retries=config.get("retries", 3),
+                    rate_limit=config.get("rate_limit")
+                ))
+        except ValueError:
+            console.print(f"[yellow]No new rows for {group}[/yellow]")
+
+    if not new_frames:
+        console.print("[bold green]No new data available; raw dataset unchanged ✅[/bold green]\n")
+        return
+
+    df = pd.concat(new_frames, ignore_index=True)
     print_summary(df)
 
-    # Save to Parquet
-    out_file = output_dir / "universe_daily.parquet"
-    df.to_parquet(out_file, index=False)
-    console.print(f"[bold blue]Data successfully saved to {out_file}[/bold blue]\n")
\ No newline at end of file
+    # Append to the partitioned Parquet dataset (or swap in the refreshed one)
+    if full_refresh:
+        with span("store.replace", rows=len(df)):
+            manifest = replace_raw_data(df, root)
+        kept = sorted(set(manifest) - set(df['Ticker']))
+        if kept:
+            console.print(f"[yellow]Warning: Kept the previous data for {kept}[/yellow]")
+    else:
+        with span("store.append", rows=len(df)):
+            manifest = append_raw_data(df, root)
+    total_rows = sum(entry['rows'] for entry in manifest.values())
+    console.print(f"[bold blue]Appended {len(df)} rows to {root} ({total_rows} rows stored)[/bold blue]\n")
@@ -0,0 +1,180 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+MATRIX_DIR = "universe_matrices"
+INDEX_FILE = "_index.json"
+DATES_FILE = "_dates.npy"
+MATRIX_DTYPES = ("float64", "float32")
+
+# Layout: <dir>/<column>.npy (one Dates x Tickers matrix per column), plus the sidecar
+# <dir>/_index.json (tickers, columns, dtype, source fingerprint) and <dir>/_dates.npy.
+
+
+def matrix_store_path(features_path: str | Path) -> Path:
+    """Location of the matrix store written next to a features Parquet file (or dataset)."""
+    return Path(features_path).with_name(MATRIX_DIR)
+
+
+def source_signature(path: str | Path) -> list[list]:
+    """
+    Fingerprint of a Parquet file or directory of part files: (name, size, mtime) per file.
+    Used to detect a matrix store that is older than the features it was built from.
+    """
+    path = Path(path)
+    files = sorted(path.glob("*.parquet")) if path.is_dir() else [path]
+    return [[file.name, file.stat().st_size, file.stat().st_mtime_ns] for file in files]
+
+
+def _numeric_columns(source: pd.DataFrame | Path) -> list[str]:
+    if isinstance(source, pd.DataFrame):
+        return [
+            col for col in source.columns
+            if col not in ('Date', 'Ticker') and pd.api.types.is_numeric_dtype(source[col])
+        ]
+    schema = ds.dataset(source, format="parquet").schema
+    return [
+        field.name for field in schema
+        if field.name not in ('Date', 'Ticker')
+        and (pa.types.is_floating(field.type) or pa.types.is_integer(field.type))
+    ]
+
+
+def write_matrix_store(
+        source: pd.DataFrame | str | Path,
+        out_dir: str | Path,
+        dtype: str = "float64",
+        source_path: str | Path | None = None
+) -> Path:
+    """
+    Pivots every numeric column of a long (Date, Ticker) frame into its own dense
+    (Dates x Tickers) `.npy` matrix that readers can memory-map.
+
+    Args:
+        source: The long features frame, or the path of a features Parquet file / dataset.
+            From a path, one column is read at a time, so peak memory is about one matrix.
+        out_dir: Directory of the store. It is replaced atomically.
+        dtype: 'float64' (exact) or 'float32' (half the footprint).
+        source_path: The Parquet output an in-memory `source` was saved to, fingerprinted so
+            readers can detect a stale store. Defaults to `source` itself when it is a path.
+
+    Returns:
+        The store directory.
+    """
+    if dtype not in MATRIX_DTYPES:
+        raise ValueError(f"Unknown matrix dtype '{dtype}'. Expected one of {MATRIX_DTYPES}.")
+    if not isinstance(source, pd.DataFrame):
+        source = Path(source)
+        source_path = source
+    columns = _numeric_columns(source)
+
+    def read(cols: list[str]) -> pd.DataFrame:
+        if isinstance(source, pd.DataFrame):
+            return source[cols]
+        return pd.read_parquet(source, columns=cols)
+
+    # 1. The shared axes: sorted unique dates and tickers (the same order `pivot` produces)
+    keys = read(['Date', 'Ticker'])
+    dates = pd.Index(keys['Date'].unique()).sort_values()
+    tickers = pd.Index(keys['Ticker'].unique()).sort_values()
+    n_dates, n_tickers = len(dates), len(tickers)
+
+    def cell_positions(keys: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        return dates.get_indexer(keys['Date']), tickers.get_indexer(keys['Ticker'])
+
+    rows, cols = cell_positions(keys)
+    if len(np.unique(rows * n_tickers + cols)) != len(rows):
+        raise ValueError("Duplicate (Date, Ticker) rows cannot be stored as a matrix.")
+    del keys
+
+    # 2. Write into a staging directory and swap it in at the end: readers never see a partial store
+    out_dir = Path(out_dir)
+    staging = out_dir.with_name(f".{out_dir.name}.staging")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    np.save(staging / DATES_FILE, dates.to_numpy())
+    for col in columns:
+        if isinstance(source, pd.DataFrame):
+            values = source[col].to_numpy(dtype=np.float64)
+        else:
+            # Re-derive the cell positions: a fresh read is not guaranteed to keep the row order
+            frame = read(['Date', 'Ticker', col])
+            rows, cols = cell_positions(frame)
+            values = frame[col].to_numpy(dtype=np.float64)
+            del frame
+
+        # Scatter straight into the file; missing (Date, Ticker) cells are NaN like in `pivot`
+        matrix = np.lib.format.open_memmap(
+            staging / f"{col}.npy", mode="w+", dtype=dtype, shape=(n_dates, n_tickers)
+        )
+        matrix[:] = np.nan
+        matrix[rows, cols] = values
+        matrix.flush()
+        del matrix, values
+
+    index = {
+        'dtype': dtype,
+        'columns': columns,
+        'tickers': tickers.tolist(),
+        'source': None if source_path is None else source_signature(source_path),
+    }
+    with open(staging / INDEX_FILE, "w") as file:
+        json.dump(index, file)
+
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    os.replace(staging, out_dir)
+    return out_dir
+
+
+class MatrixStore:
+    """
+    Read-only, zero-copy access to a store written by `write_matrix_store`.
+
+    Matrices are opened with `mmap`: nothing is decoded or pivoted at startup, and processes
+    reading the same store share the OS page cache instead of holding private copies.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        index_path = self.path / INDEX_FILE
+        if not index_path.exists():
+            raise FileNotFoundError(
+                f"No matrix store found in {self.path}. Run 'alpha features' first."
+            )
+        with open(index_path, "r") as file:
+            index = json.load(file)
+
+        self.columns: list[str] = index['columns']
+        self.dtype = np.dtype(index['dtype'])
+        self.source = index['source']
+        self.dates = pd.DatetimeIndex(np.load(self.path / DATES_FILE), name='Date')
+        self.tickers = pd.Index(index['tickers'], name='Ticker')
+
+    def is_current(self, source_path: str | Path) -> bool:
+        """True if the store was built from `source_path` as it is on disk now."""
+        return Path(source_path).exists() and self.source == source_signature(source_path)
+
+    def array(self, column: str) -> np.ndarray:
+        """The read-only memory-mapped (Dates x Tickers) matrix of one column."""
+        if column not in self.columns:
+            raise ValueError(
+                f"Column '{column}' is not in the matrix store. Available: {self.columns}"
+            )
+        return np.load(self.path / f"{column}.npy", mmap_mode="r")
+
+    def frame(self, column: str) -> pd.DataFrame:
+        """One column as a (Dates x Tickers) DataFrame backed by the memory map (no copy)."""
+        return pd.DataFrame(self.array(column), index=self.dates, columns=self.tickers, copy=False)
+
+    def features(self, columns: list[str]) -> dict[str, pd.DataFrame]:
+        """Matrices for the wide signal API (see `alpha_platform.signals.wide`)."""
+        return {col: self.frame(col) for col in dict.fromkeys(columns)}
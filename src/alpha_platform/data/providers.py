@@ -0,0 +1,128 @@
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pandas as pd
+import yfinance as yf
+
+# yfinance messages meaning "no data for this ticker / range" rather than a failed request
+NO_DATA_ERRORS = ("possibly delisted", "no price data found", "no data found", "no timezone found")
+
+
+class DataProvider(ABC):
+    """
+    Interface for a source of raw daily OHLCV bars.
+    Implementations return one ticker's bars as a DataFrame indexed by date (raw, uncleaned);
+    an empty DataFrame means the source has no data for that ticker and range.
+    Failed requests raise, so `fetch_with_retry` can retry them.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def fetch(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        ...
+
+
+class _ErrorCapture(logging.Handler):
+    """Collects the errors yfinance logs for one ticker (it logs failures instead of raising)."""
+
+    def __init__(self, ticker: str):
+        super().__init__(level=logging.ERROR)
+        self.symbol = f"'{ticker.upper()}'"
+        self.errors: list[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        message = record.getMessage()
+        if self.symbol in message:
+            self.errors.append(message)
+
+
+class YahooProvider(DataProvider):
+    """Downloads bars from Yahoo Finance via `yfinance`."""
+
+    name = "yahoo"
+
+    def fetch(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        `yf.download` swallows network and HTTP failures: it logs them and returns an empty
+        frame. Those are raised here as ConnectionError; "no data in range" stays an empty frame.
+        """
+        capture = _ErrorCapture(ticker)
+        logger = logging.getLogger("yfinance")
+        logger.addHandler(capture)
+        try:
+            df = yf.download(ticker, start=start_date, end=end_date, progress=False)
+        finally:
+            logger.removeHandler(capture)
+
+        # Older yfinance versions record per-ticker errors in yf.shared._ERRORS instead
+        recorded = getattr(getattr(yf, "shared", None), "_ERRORS", None) or {}
+        errors = list(capture.errors)
+        if ticker.upper() in recorded:
+            errors.append(str(recorded[ticker.upper()]))
+        failures = [
+            error for error in errors
+            if not any(marker in error.lower() for marker in NO_DATA_ERRORS)
+        ]
+        if failures:
+            raise ConnectionError(f"Yahoo Finance download failed for {ticker}: {failures[0]}")
+        return df if df is not None else pd.DataFrame()
+
+
+class LocalDirectoryProvider(DataProvider):
+    """
+    Reads bars from a local directory holding one `<TICKER>.parquet` or `<TICKER>.csv` file per ticker.
+    Useful for offline tests, throughput benchmarks and vendor dumps.
+    Files need a 'Date' column (or a date index) plus any of the OHLCV columns.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        if not self.root.is_dir():
+            raise FileNotFoundError(f"Local data directory not found at: {self.root}")
+
+    def fetch(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        parquet_path = self.root / f"{ticker}.parquet"
+        csv_path = self.root / f"{ticker}.csv"
+
+        if parquet_path.exists():
+            df = pd.read_parquet(parquet_path)
+        elif csv_path.exists():
+            df = pd.read_csv(csv_path)
+        else:
+            return pd.DataFrame()
+
+        if 'Date' in df.columns:
+            df = df.set_index('Date')
+        df.index = pd.to_datetime(df.index)
+        df.index.name = 'Date'
+
+        # Same half-open [start, end) convention as yfinance
+        mask = (df.index >= pd.Timestamp(start_date)) & (df.index < pd.Timestamp(end_date))
+        return df.loc[mask]
+
+
+def make_provider(config: dict) -> DataProvider:
+    """
+    Builds the provider described by the `provider` section of a universe config.
+    Defaults to Yahoo Finance when the section is missing.
+
+    Example:
+        provider:
+          type: local
+          path: data/vendor
+    """
+    spec = config.get("provider") or {"type": "yahoo"}
+    kind = spec.get("type", "yahoo")
+
+    if kind == "yahoo":
+        return YahooProvider()
+    if kind == "local":
+        if "path" not in spec:
+            raise ValueError("The 'local' provider requires a 'path' to a data directory.")
+        return LocalDirectoryProvider(spec["path"])
+
+    raise ValueError(f"Unknown data provider type '{kind}'. Expected 'yahoo' or 'local'.")
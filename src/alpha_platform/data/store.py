@@ -0,0 +1,226 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DATASET_DIR = "universe_daily"
+LEGACY_FILE = "universe_daily.parquet"
+MANIFEST_FILE = "_manifest.json"
+
+# Hive layout: <root>/Ticker=<ticker>/year=<yyyy>/data.parquet
+PARTITIONING = ds.partitioning(
+    pa.schema([("Ticker", pa.string()), ("year", pa.int32())]), flavor="hive"
+)
+
+PRICE_COLS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+
+
+def dataset_root(output_dir: str | Path) -> Path:
+    """Location of the partitioned raw dataset inside the configured output directory."""
+    return Path(output_dir) / DATASET_DIR
+
+
+def read_manifest(root: str | Path) -> dict:
+    """
+    Returns the per-ticker manifest ({ticker: {first_date, last_date, rows}}), or {} if none exists.
+    """
+    path = Path(root) / MANIFEST_FILE
+    if not path.exists():
+        return {}
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def _write_manifest(root: Path, manifest: dict):
+    tmp_path = root / f"{MANIFEST_FILE}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(dict(sorted(manifest.items())), file, indent=2)
+    os.replace(tmp_path, root / MANIFEST_FILE)
+
+
+def _partition_path(root: Path, ticker: str, year: int) -> Path:
+    return root / f"Ticker={ticker}" / f"year={year}" / "data.parquet"
+
+
+def _read_partition(path: Path) -> pd.DataFrame:
+    return pd.read_parquet(path) if path.exists() else pd.DataFrame()
+
+
+def _write_partition(path: Path, df: pd.DataFrame):
+    """Atomically (re)writes one ticker-year file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def append_raw_data(df: pd.DataFrame, root: str | Path) -> dict:
+    """
+    Merges long-format raw rows into the partitioned dataset and updates the manifest.
+
+    Only the ticker-year partitions touched by `df` are rewritten. Rows for dates that already
+    exist are replaced. Leading gaps in the new rows are forward-filled from the stored tail,
+    with the same 5-day limit the cleaner uses, so an appended tail matches a full download.
+
+    Returns:
+        The updated manifest.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(root)
+
+    for ticker, new_rows in df.groupby('Ticker', sort=False):
+        if "/" in ticker or "=" in ticker:
+            raise ValueError(f"Ticker '{ticker}' cannot be used as a partition name.")
+
+        new_rows = new_rows.drop(columns=['Ticker']).sort_values('Date')
+        value_cols = [col for col in new_rows.columns if col != 'Date']
+        new_rows[value_cols] = new_rows[value_cols].astype('float64')
+
+        # 1. Stitch the new rows onto the stored tail so forward-fills continue across the boundary
+        entry = manifest.get(ticker)
+        if entry is not None:
+            last_year = pd.Timestamp(entry['last_date']).year
+            stored_tail = _read_partition(_partition_path(root, ticker, last_year)).tail(5)
+            stored_tail = stored_tail[stored_tail['Date'] < new_rows['Date'].min()]
+            ffill_cols = [col for col in PRICE_COLS if col in new_rows.columns]
+            if len(stored_tail) and ffill_cols:
+                stitched = pd.concat([stored_tail, new_rows], ignore_index=True)
+                stitched[ffill_cols] = stitched[ffill_cols].ffill(limit=5)
+                new_rows = stitched.iloc[len(stored_tail):]
+
+        # 2. Merge into each affected ticker-year partition
+        for year, year_rows in new_rows.groupby(new_rows['Date'].dt.year):
+            path = _partition_path(root, ticker, int(year))
+            merged = pd.concat([_read_partition(path), year_rows], ignore_index=True)
+            merged = merged.drop_duplicates(subset='Date', keep='last').sort_values('Date')
+            _write_partition(path, merged)
+
+        # 3. Record what is now stored for this ticker
+        first_date = new_rows['Date'].min()
+        last_date = new_rows['Date'].max()
+        if entry is not None:
+            first_date = min(first_date, pd.Timestamp(entry['first_date']))
+            last_date = max(last_date, pd.Timestamp(entry['last_date']))
+        rows = sum(
+            pq.ParquetFile(path).metadata.num_rows
+            for path in (root / f"Ticker={ticker}").glob("year=*/data.parquet")
+        )
+        manifest[ticker] = {
+            'first_date': str(first_date.date()),
+            'last_date': str(last_date.date()),
+            'rows': rows,
+        }
+
+    _write_manifest(root, manifest)
+    return manifest
+
+
+def replace_raw_data(df: pd.DataFrame, root: str | Path) -> dict:
+    """
+    Replaces the dataset with `df` (a full refresh) without ever leaving it half-written.
+
+    The new dataset is built in a staging directory next to `root` and swapped in only once it
+    is complete. Stored tickers absent from `df` (e.g. their download failed) keep their
+    previous partitions rather than disappearing.
+
+    Returns:
+        The new manifest.
+    """
+    root = Path(root)
+    staging = root.with_name(f"{root.name}.staging")
+    backup = root.with_name(f"{root.name}.old")
+    for path in (staging, backup):
+        if path.exists():
+            shutil.rmtree(path)
+
+    manifest = append_raw_data(df, staging)
+    previous = read_manifest(root)
+    kept = {ticker: entry for ticker, entry in previous.items() if ticker not in manifest}
+    for ticker in kept:
+        shutil.copytree(root / f"Ticker={ticker}", staging / f"Ticker={ticker}")
+    if kept:
+        manifest = {**manifest, **kept}
+        _write_manifest(staging, manifest)
+
+    # Swap: two renames, so readers see either the old or the new dataset
+    if root.exists():
+        os.replace(root, backup)
+    os.replace(staging, root)
+    shutil.rmtree(backup, ignore_errors=True)
+    return manifest
+
+
+def read_raw_data(
+        root: str | Path,
+        tickers: list[str] | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        columns: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Loads a long-format slice of the partitioned raw dataset.
+    Ticker and year partitions outside the request are never opened.
+
+    Args:
+        tickers: Tickers to load (default: all).
+        start_date: First date to include (inclusive).
+        end_date: Last date to include (inclusive).
+        columns: Value columns to load (default: all). 'Date' and 'Ticker' are always included.
+    """
+    dataset = ds.dataset(Path(root), format="parquet", partitioning=PARTITIONING)
+
+    conditions = []
+    if tickers is not None:
+        conditions.append(ds.field("Ticker").isin(list(tickers)))
+    if start_date is not None:
+        start = pd.Timestamp(start_date)
+        conditions.append(ds.field("year") >= start.year)
+        conditions.append(ds.field("Date") >= pa.scalar(start, type=pa.timestamp("ns")))
+    if end_date is not None:
+        end = pd.Timestamp(end_date)
+        conditions.append(ds.field("year") <= end.year)
+        conditions.append(ds.field("Date") <= pa.scalar(end, type=pa.timestamp("ns")))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    if columns is not None:
+        columns = ['Date', *[col for col in columns if col not in ('Date', 'Ticker')], 'Ticker']
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    df = table.to_pandas()
+    df = df.drop(columns=['year'], errors='ignore')
+    return df.sort_values(['Ticker', 'Date']).reset_index(drop=True)
+
+
+def load_raw_data(output_dir: str | Path, **filters) -> pd.DataFrame:
+    """
+    Loads raw data from `output_dir`, preferring the partitioned dataset and falling back to the
+    legacy monolithic `universe_daily.parquet`.
+    """
+    root = dataset_root(output_dir)
+    if (root / MANIFEST_FILE).exists():
+        return read_raw_data(root, **filters)
+
+    legacy_path = Path(output_dir) / LEGACY_FILE
+    if legacy_path.exists():
+        df = pd.read_parquet(legacy_path)
+        if filters.get('tickers') is not None:
+            df = df[df['Ticker'].isin(filters['tickers'])]
+        if filters.get('start_date') is not None:
+            df = df[df['Date'] >= pd.Timestamp(filters['start_date'])]
+        if filters.get('end_date') is not None:
+            df = df[df['Date'] <= pd.Timestamp(filters['end_date'])]
+        if filters.get('columns') is not None:
+            value_cols = [col for col in filters['columns'] if col not in ('Date', 'Ticker')]
+            df = df[['Date', *value_cols, 'Ticker']]
+        return df.reset_index(drop=True)
+
+    raise FileNotFoundError(f"No raw data found in {output_dir}. Run 'alpha download' first.")
@@ -1,5 +1,10 @@
-import pandas as pd
 import numpy as np
+import pandas as pd
+
+from alpha_platform.features.registry import DEFAULT_FEATURES, compute_features
+from alpha_platform.profiling import span
+
+FEATURE_ENGINES = ("wide", "groupby")
 
 
 def compute_log_returns(df: pd.DataFrame, periods: list[int] = [1, 5, 20]) -> pd.DataFrame:
@@ -43,13 +48,10 @@ def compute_trend(df: pd.DataFrame, short_window: int = 20, long_window: int = 2
     return out
 
 
-def build_features(df: pd.DataFrame) -> pd.DataFrame:
+def _build_features_groupby(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Master function to compute all features and strictly enforce timing rules.
+    Reference implementation: per-ticker groupby transforms on the long frame.
     """
-    # 1. Sort chronologically per asset (Critical for accurate rolling windows)
-    df = df.sort_values(['Ticker', 'Date']).copy()
-
     # 2. Compute all raw features at time T
     df = compute_log_returns(df, periods=[1, 5, 20])
     df = compute_volatility(df, window=20)
@@ -64,4 +66,34 @@ def build_features(df: pd.DataFrame) -> pd.DataFrame:
     # What was calculated at the Close of Day T is now only available on Day T+1.
     df[feature_cols] = df.groupby('Ticker')[feature_cols].shift(1)
 
-    return df
\ No newline at end of file
+    return df
+
+
+def build_features(
+        df: pd.DataFrame,
+        features: list[str] | None = None,
+        engine: str = "wide",
+        groups: dict[str, str] | None = None
+) -> pd.DataFrame:
+    """
+    Master function to compute all features and strictly enforce timing rules.
+
+    Args:
+        features: Feature names to build (see `features.registry`). Defaults to DEFAULT_FEATURES.
+        engine: 'wide' plans the requested features as a DAG and computes them with the
+            vectorized matrix kernels; 'groupby' is the per-ticker reference implementation
+            of the default feature set. Both agree to floating point precision.
+        groups: Ticker -> group (e.g. sector) mapping for `cs_group_demean_*` features.
+    """
+    if engine not in FEATURE_ENGINES:
+        raise ValueError(f"Unknown feature engine '{engine}'. Expected one of {FEATURE_ENGINES}.")
+    if engine == "groupby" and features is not None and list(features) != DEFAULT_FEATURES:
+        raise ValueError("The 'groupby' reference engine only builds the default feature set.")
+
+    # 1. Sort chronologically per asset (Critical for accurate rolling windows)
+    with span("features.sort"):
+        df = df.sort_values(['Ticker', 'Date']).copy()
+
+    if engine == "groupby":
+        return _build_features_groupby(df)
+    return compute_features(df, features, groups)
@@ -0,0 +1,97 @@
+import numpy as np
+
+# Cross-sectional kernels: each one works row by row on a (Dates x Tickers) matrix, so a value
+# only ever depends on the other tickers' values on the same date. NaN marks an ineligible asset:
+# it is left out of every statistic and stays NaN in the output.
+
+
+def _row_moments(values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-row (count, mean, sample std) of the valid values, NaN where undefined."""
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=1)
+    filled = np.where(valid, values, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = filled.sum(axis=1) / count
+        deviation = np.where(valid, values - mean[:, None], 0.0)
+        variance = (deviation * deviation).sum(axis=1) / (count - 1)
+    return count, mean, np.sqrt(np.where(count > 1, variance, np.nan))
+
+
+def cs_rank(values: np.ndarray) -> np.ndarray:
+    """
+    Rank of each ticker within its date, 1 = smallest, ties sharing their average rank
+    (matches pandas `rank(axis=1)`).
+    """
+    n_rows, n_cols = values.shape
+    order = np.argsort(values, axis=1, kind='stable')  # NaNs sort last
+    ordered = np.take_along_axis(values, order, axis=1)
+
+    # Tie groups are runs of equal values; each member gets the mean of the group's positions
+    positions = np.broadcast_to(np.arange(n_cols), (n_rows, n_cols))
+    starts_group = np.ones((n_rows, n_cols), dtype=bool)
+    starts_group[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    ends_group = np.ones((n_rows, n_cols), dtype=bool)
+    ends_group[:, :-1] = starts_group[:, 1:]
+    first = np.maximum.accumulate(np.where(starts_group, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(ends_group, positions, n_cols)[:, ::-1], axis=1)[:, ::-1]
+
+    ranks = np.empty((n_rows, n_cols))
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=1)
+    ranks[np.isnan(values)] = np.nan
+    return ranks
+
+
+def cs_percentile(values: np.ndarray) -> np.ndarray:
+    """Rank divided by the number of eligible tickers that date, in (0, 1] (pandas `pct=True`)."""
+    count = (~np.isnan(values)).sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return cs_rank(values) / count
+
+
+def cs_zscore(values: np.ndarray) -> np.ndarray:
+    """(x - mean) / std across the date's eligible tickers; NaN when fewer than two or no spread."""
+    _, mean, std = _row_moments(values)
+    std = np.where(std > 0, std, np.nan)
+    return (values - mean[:, None]) / std[:, None]
+
+
+def cs_winsorize(values: np.ndarray, limit: float = 0.05) -> np.ndarray:
+    """Clips each date's values to its [limit, 1 - limit] quantiles (linear interpolation)."""
+    if not 0 <= limit < 0.5:
+        raise ValueError(f"Winsorize limit must be in [0, 0.5), got {limit}.")
+    out = np.full_like(values, np.nan)
+    has_values = (~np.isnan(values)).any(axis=1)
+    if has_values.any():
+        rows = values[has_values]
+        lower, upper = np.nanquantile(rows, [limit, 1 - limit], axis=1)
+        out[has_values] = np.clip(rows, lower[:, None], upper[:, None])
+    return out
+
+
+def cs_demean(values: np.ndarray) -> np.ndarray:
+    """Subtracts the date's mean over eligible tickers."""
+    _, mean, _ = _row_moments(values)
+    return values - mean[:, None]
+
+
+def cs_group_demean(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    Subtracts the mean of the ticker's group (e.g. sector) on the same date.
+
+    Args:
+        groups: Integer group code per ticker column; -1 (no group) leaves the ticker NaN.
+    """
+    n_groups = int(groups.max()) + 1 if len(groups) else 0
+    membership = np.zeros((len(groups), max(n_groups, 1)))
+    grouped = groups >= 0
+    membership[np.flatnonzero(grouped), groups[grouped]] = 1.0
+
+    # Per (date, group) sums and counts in two matrix products
+    valid = ~np.isnan(values)
+    sums = np.where(valid, values, 0.0) @ membership
+    counts = valid.astype(np.float64) @ membership
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+    out = values - means[:, np.where(grouped, groups, 0)]
+    out[:, ~grouped] = np.nan
+    return out
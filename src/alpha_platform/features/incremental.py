@@ -0,0 +1,99 @@
+import pandas as pd
+
+from alpha_platform.features.builder import build_features
+from alpha_platform.features.registry import plan_features
+
+
+def context_rows(features: list[str] | None = None) -> int:
+    """
+    Raw rows of history needed before a new row: the deepest feature lookback plus the T+1 shift.
+    For the default features this is the 200-day SMA in `sma_ratio_20_200`.
+    """
+    return plan_features(features).lookback + 1
+
+
+def context_start_date(
+        existing: pd.DataFrame,
+        features: list[str] | None = None
+) -> pd.Timestamp | None:
+    """
+    Earliest raw date an incremental update could need, assuming roughly 5 trading days per week.
+    Callers that load raw data from this date must still pass the result through
+    `update_features`, which verifies the context is complete.
+    """
+    if existing.empty:
+        return None
+    last_dates = existing.groupby('Ticker')['Date'].max()
+    calendar_days = int(context_rows(features) * 7 / 5) + 30  # Buffer for holidays
+    return last_dates.min() - pd.Timedelta(days=calendar_days)
+
+
+def update_features(
+        raw_df: pd.DataFrame,
+        existing: pd.DataFrame,
+        features: list[str] | None = None,
+        groups: dict[str, str] | None = None
+) -> pd.DataFrame:
+    """
+    Extends an existing features frame with the raw rows it does not cover yet.
+
+    For every ticker only the rows after its last featured date are computed, using the
+    previous `context_rows(features)` raw rows as warm-up context, with the same
+    `build_features` logic. Tickers absent from `existing` are computed from their full history.
+    With cross-sectional features, every ticker's recent rows join the window as well, so the
+    new rows are ranked against the full universe of their date.
+
+    Args:
+        raw_df: Long-format raw data. It may be a recent slice of history, as long as it holds
+            enough context rows before each ticker's first new row.
+        existing: The previously built features frame.
+        features: The feature set `existing` was built with (default: DEFAULT_FEATURES).
+        groups: Ticker -> group mapping for `cs_group_demean_*` features.
+
+    Returns:
+        The existing rows plus the new rows, sorted by Ticker and Date like `build_features`.
+    """
+    raw_df = raw_df.sort_values(['Ticker', 'Date']).reset_index(drop=True)
+    if existing.empty:
+        return build_features(raw_df, features, groups=groups)
+    n_context = context_rows(features)
+
+    # 1. Flag raw rows newer than each ticker's last featured date
+    last_featured = existing.groupby('Ticker')['Date'].max()
+    featured_rows = existing.groupby('Ticker').size()
+    cutoff = raw_df['Ticker'].map(last_featured)
+    is_new = cutoff.isna() | (raw_df['Date'] > cutoff)
+
+    if not is_new.any():
+        return existing
+
+    # 2. Keep the new rows plus the warm-up context history per ticker
+    position = raw_df.groupby('Ticker').cumcount()
+    if plan_features(features).cross_sectional:
+        # A new row carries the cross-section of its ticker's previous row (T+1 shift), so every
+        # ticker joins from the earliest such date on, to rebuild those cross-sections in full
+        previous_date = raw_df.groupby('Ticker')['Date'].shift(1).fillna(raw_df['Date'])
+        first_needed_date = previous_date[is_new].min()
+        first_new = position.where(raw_df['Date'] >= first_needed_date)
+    else:
+        first_new = position.where(is_new)
+    first_new = first_new.groupby(raw_df['Ticker']).transform('min')
+    needed = first_new.notna() & (position >= first_new - n_context)
+    window = raw_df[needed]
+
+    # 3. Refuse to produce features from a truncated history
+    available = (position < first_new)[needed].groupby(window['Ticker']).sum()
+    required = featured_rows.reindex(available.index).fillna(0).clip(upper=n_context)
+    short = available[available < required]
+    if len(short):
+        raise ValueError(
+            f"Raw data lacks {n_context} rows of context before the new rows "
+            f"for {list(short.index)}."
+        )
+
+    # 4. Recompute on the small window and keep only the new rows
+    fresh = build_features(window, features, groups=groups)
+    fresh = fresh[is_new.loc[fresh.index]]
+
+    combined = pd.concat([existing, fresh], ignore_index=True)
+    return combined.sort_values(['Ticker', 'Date']).reset_index(drop=True)
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Window values materialized at once by the two-pass kernels (32 MB of float64)
+WINDOW_BLOCK_CELLS = 2 ** 22
+
+
+def to_wide(df: pd.DataFrame, column: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Scatters one column of a long frame (sorted by Ticker, Date) into a dense (Rows x Tickers) matrix.
+
+    Row r of column j holds ticker j's r-th observation. On a common calendar this is exactly the
+    Dates x Tickers matrix; when a ticker has gaps it keeps the per-ticker row semantics of
+    `groupby('Ticker')` (a shift or window always looks at the ticker's previous rows), with
+    shorter histories padded with NaN at the bottom.
+
+    Returns:
+        (matrix, row_position, ticker_code): the matrix plus the coordinates of every long row,
+        used by `to_long` to gather results back without a pivot.
+    """
+    ticker_code, _ = pd.factorize(df['Ticker'], sort=False)
+
+    # Rows are grouped by ticker, so a row's position is its offset from the start of its block
+    block_starts = np.flatnonzero(np.r_[True, ticker_code[1:] != ticker_code[:-1]])
+    block_lengths = np.diff(np.r_[block_starts, len(ticker_code)])
+    row_position = np.arange(len(ticker_code)) - np.repeat(block_starts, block_lengths)
+
+    n_rows = int(block_lengths.max()) if len(df) else 0
+    n_tickers = int(ticker_code.max()) + 1 if len(df) else 0
+
+    matrix = np.full((n_rows, n_tickers), np.nan)
+    matrix[row_position, ticker_code] = df[column].to_numpy(dtype=np.float64)
+    return matrix, row_position, ticker_code
+
+
+def to_long(matrix: np.ndarray, row_position: np.ndarray, ticker_code: np.ndarray) -> np.ndarray:
+    """Gathers a (Rows x Tickers) matrix back into the long row order produced by `to_wide`."""
+    return matrix[row_position, ticker_code]
+
+
+def to_calendar(
+        matrix: np.ndarray,
+        row_position: np.ndarray,
+        ticker_code: np.ndarray,
+        date_code: np.ndarray,
+        n_dates: int
+) -> np.ndarray:
+    """
+    Re-aligns a (Rows x Tickers) matrix on the trading calendar: (Dates x Tickers), NaN on the
+    dates a ticker has no row. `date_code` is the calendar position of every long row.
+    """
+    out = np.full((n_dates, matrix.shape[1]), np.nan)
+    out[date_code, ticker_code] = matrix[row_position, ticker_code]
+    return out
+
+
+def from_calendar(
+        matrix: np.ndarray,
+        row_position: np.ndarray,
+        ticker_code: np.ndarray,
+        date_code: np.ndarray,
+        shape: tuple[int, int]
+) -> np.ndarray:
+    """Inverse of `to_calendar`: back to per-ticker rows, NaN padded like `to_wide`."""
+    out = np.full(shape, np.nan)
+    out[row_position, ticker_code] = matrix[date_code, ticker_code]
+    return out
+
+
+def shift_rows(matrix: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shifts every column down by `periods` rows, filling the top with NaN (per-ticker `shift`)."""
+    out = np.full_like(matrix, np.nan)
+    if periods < len(matrix):
+        out[periods:] = matrix[:len(matrix) - periods]
+    return out
+
+
+def _windows(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Every complete window of every column as a (Tickers x Windows x window) view, contiguous
+    along the window so reductions over it are fast (no copy beyond one transpose).
+    """
+    columns = np.ascontiguousarray(values.T)
+    return sliding_window_view(columns, window, axis=1)
+
+
+def _window_blocks(n_windows: int, n_columns: int, window: int):
+    """Slices of windows small enough to materialize (WINDOW_BLOCK_CELLS values at a time)."""
+    step = max(1, WINDOW_BLOCK_CELLS // max(1, n_columns * window))
+    for start in range(0, n_windows, step):
+        yield slice(start, min(start + step, n_windows))
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Column-wise rolling mean, NaN unless all `window` observations are present
+    (matches pandas `rolling(window).mean()`).
+
+    Each value is reduced from its own window only, so a non-finite value affects only the
+    windows containing it, and a row's value does not depend on how much history precedes it
+    (an incremental update reproduces a full rebuild exactly).
+    """
+    out = np.full(values.shape, np.nan)
+    if window <= len(values):
+        out[window - 1:] = _windows(values, window).mean(axis=-1).T
+    return out
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Column-wise rolling sample standard deviation (ddof=1), NaN unless the window is complete
+    (matches pandas `rolling(window).std()`). Two-pass per window, in bounded blocks.
+    """
+    out = np.full(values.shape, np.nan)
+    if window > len(values):
+        return out
+    windows = _windows(values, window)
+    for block in _window_blocks(windows.shape[1], windows.shape[0], window):
+        chunk = windows[:, block]
+        deviations = chunk - chunk.mean(axis=-1, keepdims=True)
+        variance = np.einsum('ijk,ijk->ij', deviations, deviations) / (window - 1)
+        out[window - 1 + block.start:window - 1 + block.stop] = np.sqrt(variance).T
+    return out
@@ -0,0 +1,290 @@
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from alpha_platform.features.cross_sectional import (
+    cs_demean,
+    cs_group_demean,
+    cs_percentile,
+    cs_rank,
+    cs_winsorize,
+    cs_zscore,
+)
+from alpha_platform.features.kernels import (
+    from_calendar,
+    rolling_mean,
+    rolling_std,
+    shift_rows,
+    to_calendar,
+    to_long,
+    to_wide,
+)
+from alpha_platform.profiling import span
+
+# The feature set built when no explicit list is requested
+DEFAULT_FEATURES = ['return_1d', 'return_5d', 'return_20d', 'volatility_20d', 'sma_ratio_20_200']
+
+
+@dataclass(frozen=True)
+class FeatureNode:
+    """
+    One node of the feature DAG: a (Rows x Tickers) matrix computed from its input nodes.
+
+    Attributes:
+        name: Column name of the node (e.g. 'volatility_20d').
+        inputs: Names of the nodes it is computed from.
+        func: Called as func(*input_matrices, **params).
+        params: Parameters passed to `func` (windows, periods, ...).
+        window: Rows of history the node reads beyond its inputs' own lookback (0 = same row).
+        cross_sectional: `func` works across tickers within each date. Its inputs are aligned on
+            the trading calendar first (Dates x Tickers), so a ticker with gaps is compared
+            with the other tickers' values on the same date, not on the same row.
+    """
+    name: str
+    inputs: tuple[str, ...]
+    func: Callable[..., np.ndarray]
+    params: dict = field(default_factory=dict)
+    window: int = 0
+    cross_sectional: bool = False
+
+
+# --- The Registry ---
+# Maps a name pattern to a factory that builds the node from the pattern's parameters.
+_REGISTRY: list[tuple[re.Pattern, Callable[..., FeatureNode]]] = []
+
+
+def register(pattern: str):
+    """Registers a node factory for every feature name fully matching `pattern`."""
+    def decorator(factory: Callable[..., FeatureNode]):
+        _REGISTRY.append((re.compile(pattern), factory))
+        return factory
+    return decorator
+
+
+@register(r"close")
+def _close() -> FeatureNode:
+    # Source node: loaded from the raw Close column by `compute_features`
+    return FeatureNode('close', (), func=lambda: None)
+
+
+@register(r"log_close")
+def _log_close() -> FeatureNode:
+    return FeatureNode('log_close', ('close',), func=np.log)
+
+
+@register(r"return_(\d+)d")
+def _log_return(periods: str) -> FeatureNode:
+    p = int(periods)
+
+    def log_return(log_close: np.ndarray, periods: int) -> np.ndarray:
+        return log_close - shift_rows(log_close, periods)
+
+    return FeatureNode(f'return_{p}d', ('log_close',), log_return, {'periods': p}, window=p)
+
+
+@register(r"sma_(\d+)")
+def _sma(window: str) -> FeatureNode:
+    w = int(window)
+    return FeatureNode(f'sma_{w}', ('close',), rolling_mean, {'window': w}, window=w - 1)
+
+
+@register(r"volatility_(\d+)d")
+def _volatility(window: str) -> FeatureNode:
+    w = int(window)
+    return FeatureNode(f'volatility_{w}d', ('return_1d',), rolling_std, {'window': w}, window=w - 1)
+
+
+@register(r"sma_ratio_(\d+)_(\d+)")
+def _sma_ratio(short_window: str, long_window: str) -> FeatureNode:
+    s, lw = int(short_window), int(long_window)
+    return FeatureNode(f'sma_ratio_{s}_{lw}', (f'sma_{s}', f'sma_{lw}'), np.divide)
+
+
+@register(r"voladj_return_(\d+)d")
+def _vol_adjusted_return(periods: str) -> FeatureNode:
+    p = int(periods)
+
+    def vol_adjusted(log_return: np.ndarray, volatility: np.ndarray, periods: int) -> np.ndarray:
+        # The N-day return in units of its own N-day volatility
+        return log_return / (volatility * np.sqrt(periods))
+
+    return FeatureNode(
+        f'voladj_return_{p}d', (f'return_{p}d', f'volatility_{p}d'), vol_adjusted, {'periods': p}
+    )
+
+
+# --- Cross-Sectional Operators (per date, across tickers) ---
+_CROSS_SECTIONAL = {
+    'rank': cs_rank,
+    'pct': cs_percentile,
+    'zscore': cs_zscore,
+    'demean': cs_demean,
+}
+
+
+@register(r"cs_(rank|pct|zscore|demean)_(.+)")
+def _cross_sectional(operator: str, feature: str) -> FeatureNode:
+    return FeatureNode(
+        f'cs_{operator}_{feature}', (feature,), _CROSS_SECTIONAL[operator], cross_sectional=True
+    )
+
+
+@register(r"cs_winsor_(\d+)_(.+)")
+def _cross_sectional_winsorize(percent: str, feature: str) -> FeatureNode:
+    # cs_winsor_5_<feature> clips each date to its 5th / 95th percentiles
+    return FeatureNode(
+        f'cs_winsor_{int(percent)}_{feature}', (feature,), cs_winsorize,
+        {'limit': int(percent) / 100}, cross_sectional=True
+    )
+
+
+@register(r"cs_group_demean_(.+)")
+def _cross_sectional_group_demean(feature: str) -> FeatureNode:
+    # The per-ticker group codes are filled in by `compute_features` from its `groups` mapping
+    return FeatureNode(
+        f'cs_group_demean_{feature}', (feature,), cs_group_demean, {'groups': None},
+        cross_sectional=True
+    )
+
+
+def resolve(name: str) -> FeatureNode:
+    """Builds the node for a feature name, or raises if no registered pattern matches it."""
+    for pattern, factory in _REGISTRY:
+        match = pattern.fullmatch(name)
+        if match:
+            return factory(*match.groups())
+    patterns = [pattern.pattern for pattern, _ in _REGISTRY]
+    raise ValueError(f"Unknown feature '{name}'. Registered patterns: {patterns}")
+
+
+# --- The Planner ---
+@dataclass
+class FeaturePlan:
+    """
+    Execution plan for a set of requested features.
+
+    Attributes:
+        order: Every required node, topologically sorted (inputs before consumers).
+        outputs: The requested feature names, in request order.
+        consumers: For each node, how many downstream nodes read it (used to free memory early).
+        lookback: Rows of history the deepest requested feature depends on.
+        cross_sectional: Some node mixes tickers within a date, so the plan needs the whole
+            universe on every date (it cannot run on independent ticker batches).
+    """
+    order: list[FeatureNode]
+    outputs: list[str]
+    consumers: dict[str, int]
+    lookback: int
+    cross_sectional: bool = False
+
+
+def plan_features(features: list[str] | None = None) -> FeaturePlan:
+    """
+    Resolves the requested features and all of their intermediates into a deduplicated DAG.
+    """
+    outputs = list(dict.fromkeys(features or DEFAULT_FEATURES))
+    nodes: dict[str, FeatureNode] = {}
+    order: list[FeatureNode] = []
+    lookbacks: dict[str, int] = {}
+
+    def visit(name: str, path: tuple[str, ...]):
+        if name in path:
+            raise ValueError(f"Cyclic feature dependency: {' -> '.join(path + (name,))}")
+        if name in nodes:
+            return
+        node = resolve(name)
+        for dependency in node.inputs:
+            visit(dependency, path + (name,))
+        nodes[name] = node
+        order.append(node)
+        lookbacks[name] = node.window + max((lookbacks[dep] for dep in node.inputs), default=0)
+
+    for name in outputs:
+        visit(name, ())
+
+    consumers = {node.name: 0 for node in order}
+    for node in order:
+        for dependency in node.inputs:
+            consumers[dependency] += 1
+
+    return FeaturePlan(
+        order=order,
+        outputs=outputs,
+        consumers=consumers,
+        lookback=max(lookbacks[name] for name in outputs),
+        cross_sectional=any(node.cross_sectional for node in order),
+    )
+
+
+def compute_features(
+        df: pd.DataFrame,
+        features: list[str] | None = None,
+        groups: dict[str, str] | None = None
+) -> pd.DataFrame:
+    """
+    Executes a feature plan on a long frame sorted by (Ticker, Date), adding one column per feature.
+
+    Each intermediate is computed once and released as soon as its last consumer has run.
+    The T+1 timing shift is applied here, once, to every requested feature.
+
+    Args:
+        groups: Ticker -> group (e.g. sector) mapping read by `cs_group_demean_*` features.
+            Tickers missing from it get NaN for those features.
+    """
+    plan = plan_features(features)
+    needs_groups = [node.name for node in plan.order if 'groups' in node.params]
+    if needs_groups and not groups:
+        raise ValueError(f"Features {needs_groups} need a ticker -> group mapping (groups=...).")
+
+    # Pivot once: the raw Close matrix is the DAG's only source node
+    with span("features.to_wide"):
+        close, row_position, ticker_code = to_wide(df, 'Close')
+    matrices: dict[str, np.ndarray] = {'close': close}
+    del close
+
+    if plan.cross_sectional:
+        # Calendar coordinates of every long row, to line tickers up by date
+        date_code, calendar = pd.factorize(df['Date'], sort=True)
+        layout = (row_position, ticker_code, date_code, len(calendar))
+    if needs_groups:
+        tickers = pd.unique(df['Ticker'])  # Column order of `to_wide`
+        group_codes, _ = pd.factorize(pd.Series(tickers).map(groups))  # -1 for unmapped
+
+    columns: dict[str, np.ndarray] = {}
+    remaining = dict(plan.consumers)
+    for node in plan.order:
+        if node.name != 'close':
+            inputs = [matrices[dep] for dep in node.inputs]
+            params = dict(node.params)
+            if 'groups' in params:
+                params['groups'] = group_codes
+            with span(f"feature.{node.name}"), np.errstate(divide='ignore', invalid='ignore'):
+                if node.cross_sectional:
+                    calendar_inputs = [to_calendar(matrix, *layout) for matrix in inputs]
+                    result = node.func(*calendar_inputs, **params)
+                    matrices[node.name] = from_calendar(result, *layout[:3], inputs[0].shape)
+                else:
+                    matrices[node.name] = node.func(*inputs, **params)
+
+        # THE STRICT TIMING SHIFT (No-Leakage Guarantee)
+        # What was calculated at the Close of Day T is now only available on Day T+1.
+        if node.name in plan.outputs:
+            with span("features.shift_to_long"):
+                shifted = shift_rows(matrices[node.name], 1)
+                columns[node.name] = to_long(shifted, row_position, ticker_code)
+
+        # Release inputs that no later node needs
+        for dep in node.inputs:
+            remaining[dep] -= 1
+            if remaining[dep] == 0:
+                del matrices[dep]
+        if remaining[node.name] == 0:
+            del matrices[node.name]
+
+    # Attach the requested columns in request order
+    for name in plan.outputs:
+        df[name] = columns.pop(name)
+    return df
@@ -0,0 +1,129 @@
+import shutil
+from pathlib import Path
+
+import pyarrow.dataset as ds
+from rich.console import Console
+
+from alpha_platform.data.store import (
+    LEGACY_FILE,
+    MANIFEST_FILE,
+    PARTITIONING,
+    dataset_root,
+    read_manifest,
+)
+from alpha_platform.features.builder import build_features
+from alpha_platform.features.registry import plan_features
+
+console = Console()
+
+# Rough multiplier over the raw float64 payload for pandas copies made while building a batch
+_WORKING_SET_FACTOR = 3
+
+
+def open_raw_dataset(raw_dir: str | Path) -> ds.Dataset:
+    """
+    Opens the raw data lazily as an Arrow dataset: the partitioned store if present,
+    otherwise the legacy monolithic Parquet file. Nothing is read until a batch is requested.
+    """
+    root = dataset_root(raw_dir)
+    if (root / MANIFEST_FILE).exists():
+        return ds.dataset(root, format="parquet", partitioning=PARTITIONING)
+
+    legacy_path = Path(raw_dir) / LEGACY_FILE
+    if legacy_path.exists():
+        return ds.dataset(legacy_path, format="parquet")
+
+    raise FileNotFoundError(f"No raw data found in {raw_dir}. Run 'alpha download' first.")
+
+
+def _ticker_row_counts(raw_dir: str | Path, dataset: ds.Dataset) -> dict[str, int]:
+    """Row count per ticker: from the manifest when available, else by scanning one column."""
+    manifest = read_manifest(dataset_root(raw_dir))
+    if manifest:
+        return {ticker: entry['rows'] for ticker, entry in manifest.items()}
+
+    counts = dataset.to_table(columns=['Ticker']).column('Ticker').value_counts()
+    return {item['values'].as_py(): item['counts'].as_py() for item in counts}
+
+
+def plan_batches(
+        row_counts: dict[str, int],
+        bytes_per_row: int,
+        memory_budget_bytes: int
+) -> list[list[str]]:
+    """
+    Greedily packs tickers (in sorted order) into batches whose estimated working set
+    fits the budget.
+    A ticker that alone exceeds the budget gets a batch of its own.
+    """
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_bytes = 0
+    for ticker in sorted(row_counts):
+        ticker_bytes = row_counts[ticker] * bytes_per_row
+        if current and current_bytes + ticker_bytes > memory_budget_bytes:
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(ticker)
+        current_bytes += ticker_bytes
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_features_streaming(
+        raw_dir: str | Path,
+        out_path: str | Path,
+        features: list[str] | None = None,
+        memory_budget_mb: float = 512.0
+) -> int:
+    """
+    Builds features out-of-core, one batch of tickers at a time, with the same leakage-safe logic
+    as `build_features`. All features are per-ticker time series, so batches are independent.
+
+    Each batch is written as its own Parquet file inside the `out_path` directory, a dataset that
+    `pd.read_parquet(out_path)` loads like a single file. Peak memory is bounded by
+    `memory_budget_mb`, not by the size of the universe.
+
+    Returns:
+        The number of feature rows written.
+    """
+    if plan_features(features).cross_sectional:
+        raise ValueError(
+            "Cross-sectional features need every ticker of a date together and cannot be built "
+            "in ticker batches. Build them without streaming."
+        )
+    dataset = open_raw_dataset(raw_dir)
+    columns = [name for name in dataset.schema.names if name != 'year']
+
+    # Estimated bytes per raw row while building: raw columns + every DAG node, as float64
+    n_nodes = len(plan_features(features).order)
+    bytes_per_row = 8 * (len(columns) + n_nodes) * _WORKING_SET_FACTOR
+    batches = plan_batches(
+        _ticker_row_counts(raw_dir, dataset), bytes_per_row, int(memory_budget_mb * 1024 ** 2)
+    )
+
+    # Write into a staging directory and swap it in at the end: readers never see a partial build
+    out_path = Path(out_path)
+    staging = out_path.with_name(f".{out_path.name}.staging")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    n_tickers = sum(map(len, batches))
+    console.print(f"Streaming features for {n_tickers} tickers in {len(batches)} batch(es)...")
+    total_rows = 0
+    for i, tickers in enumerate(batches):
+        table = dataset.to_table(columns=columns, filter=ds.field('Ticker').isin(tickers))
+        batch_df = build_features(table.to_pandas(), features)
+        batch_df.to_parquet(staging / f"part-{i:05d}.parquet", index=False)
+        total_rows += len(batch_df)
+        del table, batch_df
+
+    if out_path.is_dir():
+        shutil.rmtree(out_path)
+    elif out_path.exists():
+        out_path.unlink()
+    staging.rename(out_path)
+
+    return total_rows
@@ -0,0 +1,295 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+
+from alpha_platform.features.registry import DEFAULT_FEATURES
+from alpha_platform.profiling import span
+
+console = Console()
+
+MODELS = ("ridge", "tree")
+
+
+@dataclass(frozen=True)
+class Fold:
+    """
+    One walk-forward split, as positions on the sorted trading calendar.
+
+    The model trains on rows whose label became known on a date in [train_start, train_end)
+    and predicts the rows dated in [test_start, test_end). With train_end == test_start,
+    every training label was realized strictly before the first test day.
+    """
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+def make_folds(
+        n_dates: int,
+        train_days: int = 504,
+        test_days: int = 63,
+        expanding: bool = True
+) -> list[Fold]:
+    """
+    Consecutive, non-overlapping test blocks of `test_days`, each preceded by a training window
+    of `train_days` (rolling) or all history so far (expanding).
+    """
+    if train_days <= 0 or test_days <= 0:
+        raise ValueError("train_days and test_days must be positive.")
+    folds = []
+    for test_start in range(train_days, n_dates, test_days):
+        train_start = 0 if expanding else test_start - train_days
+        test_end = min(test_start + test_days, n_dates)
+        folds.append(Fold(train_start, test_start, test_start, test_end))
+    return folds
+
+
+@dataclass
+class Design:
+    """
+    The design matrix shared by every fold, built once from the features frame.
+
+    Rows are sorted by (Date, Ticker). Folds select rows by calendar position instead of
+    rebuilding matrices.
+
+    Attributes:
+        X: (rows x (1 + features)) with a leading intercept column of ones.
+        y: Forward log return over `horizon` rows of the same ticker (NaN at the end of history).
+        date_pos: Calendar position of each row's feature date.
+        label_pos: Calendar position of the date its label is realized (-1 if never).
+        valid: Rows with finite features and label (usable for training).
+        calendar: The sorted trading calendar the positions refer to.
+        dates, tickers: Date and ticker of each row.
+        features: Names of the feature columns of X (after the intercept).
+    """
+    X: np.ndarray
+    y: np.ndarray
+    date_pos: np.ndarray
+    label_pos: np.ndarray
+    valid: np.ndarray
+    calendar: pd.DatetimeIndex
+    dates: np.ndarray
+    tickers: np.ndarray
+    features: list[str]
+
+
+def build_design(df: pd.DataFrame, features: list[str] | None = None, horizon: int = 1) -> Design:
+    """
+    Builds X and the forward-return label from a features frame (which must include Close).
+
+    Features at date t already only use data up to t-1 (the T+1 shift in `build_features`).
+    The label is log(Close[t+h] / Close[t]), the return a weight set on day t earns in the
+    backtest engine, and it is only known at the close of the h-th next row of that ticker.
+    """
+    features = list(features or DEFAULT_FEATURES)
+    missing = [col for col in ['Close', *features] if col not in df.columns]
+    if missing:
+        raise ValueError(f"Features frame is missing columns {missing}.")
+    if horizon < 1:
+        raise ValueError("horizon must be at least 1 row.")
+
+    # 1. Label and label date per ticker, on each ticker's own calendar
+    df = df.sort_values(['Ticker', 'Date'])
+    log_close = np.log(df['Close'].to_numpy(dtype=np.float64))
+    by_ticker = df.groupby('Ticker', sort=False)
+    label = pd.Series(log_close, index=df.index).groupby(df['Ticker'], sort=False).shift(-horizon)
+    label_date = by_ticker['Date'].shift(-horizon)
+
+    # 2. Date-major order: each day's rows are contiguous, so fold test blocks are slices
+    order = np.lexsort((df['Ticker'].to_numpy(), df['Date'].to_numpy()))
+    calendar = pd.DatetimeIndex(np.sort(df['Date'].unique()))
+    dates = df['Date'].to_numpy()[order]
+
+    X = np.empty((len(df), 1 + len(features)))
+    X[:, 0] = 1.0
+    X[:, 1:] = df[features].to_numpy(dtype=np.float64)[order]
+    y = (label.to_numpy() - log_close)[order]
+
+    label_pos = calendar.get_indexer(label_date.to_numpy()[order])
+    valid = np.isfinite(X).all(axis=1) & np.isfinite(y)
+
+    return Design(
+        X=X, y=y,
+        date_pos=calendar.get_indexer(dates),
+        label_pos=label_pos,
+        valid=valid,
+        calendar=calendar,
+        dates=dates,
+        tickers=df['Ticker'].to_numpy()[order],
+        features=features,
+    )
+
+
+# --- Incremental Linear Model ---
+def sufficient_statistics(design: Design) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cumulative X'X and X'y over label dates: entry d holds the sums over every valid row
+    whose label was realized before calendar position d.
+
+    The statistics of any training window [a, b) are `cum[b] - cum[a]`, so growing or rolling
+    a window only adds (and drops) the new days' contributions instead of refitting.
+    """
+    n_dates, p = len(design.calendar), design.X.shape[1]
+    rows = design.valid
+    X, y, pos = design.X[rows], design.y[rows], design.label_pos[rows]
+
+    # Per-day sums via bincount, one entry of the (symmetric) Gram matrix at a time
+    gram = np.zeros((n_dates, p, p))
+    for i in range(p):
+        for j in range(i, p):
+            gram[:, i, j] = gram[:, j, i] = np.bincount(pos, X[:, i] * X[:, j], minlength=n_dates)
+    xty = np.stack([np.bincount(pos, X[:, i] * y, minlength=n_dates) for i in range(p)], axis=1)
+
+    def cumulative(values: np.ndarray) -> np.ndarray:
+        out = np.zeros((n_dates + 1,) + values.shape[1:])
+        np.cumsum(values, axis=0, out=out[1:])
+        return out
+
+    return cumulative(gram), cumulative(xty)
+
+
+def solve_ridge(gram: np.ndarray, xty: np.ndarray, alpha: float = 1.0) -> np.ndarray:
+    """
+    Ridge coefficients (intercept first, in raw feature units) from sufficient statistics.
+
+    Equivalent to fitting on standardized features with an unpenalized intercept and penalty
+    `alpha * n`, so `alpha` does not depend on the window length.
+    """
+    n = gram[0, 0]
+    mean = gram[0, 1:] / n
+    y_mean = xty[0] / n
+
+    # Centered (co)variances of the features and their covariance with y
+    cov = gram[1:, 1:] / n - np.outer(mean, mean)
+    cov_xy = xty[1:] / n - mean * y_mean
+    scale = np.sqrt(np.clip(np.diag(cov), 1e-24, None))
+
+    corr = cov / np.outer(scale, scale)
+    beta_std = np.linalg.solve(corr + alpha * np.eye(len(scale)), cov_xy / scale)
+    beta = beta_std / scale
+    return np.concatenate([[y_mean - mean @ beta], beta])
+
+
+def _make_tree_model(**params):
+    from sklearn.ensemble import HistGradientBoostingRegressor
+
+    defaults = {'max_iter': 100, 'max_depth': 3, 'learning_rate': 0.05, 'random_state': 0}
+    return HistGradientBoostingRegressor(**{**defaults, **params})
+
+
+@dataclass
+class WalkForwardResult:
+    """
+    Attributes:
+        predictions: Long frame (Date, Ticker, fold, prediction) covering every test block.
+        folds: The folds, in calendar order.
+        coefficients: Per-fold ridge coefficients (empty for tree models).
+    """
+    predictions: pd.DataFrame
+    folds: list[Fold]
+    coefficients: pd.DataFrame
+
+
+def run_walk_forward(
+        df: pd.DataFrame,
+        features: list[str] | None = None,
+        model: str = "ridge",
+        horizon: int = 1,
+        train_days: int = 504,
+        test_days: int = 63,
+        expanding: bool = True,
+        alpha: float = 1.0,
+        min_train_rows: int = 100,
+        workers: int | None = None,
+        **model_params
+) -> WalkForwardResult:
+    """
+    Walk-forward training and out-of-sample prediction of forward returns.
+
+    The design matrix is built once and shared by every fold. 'ridge' solves each fold from
+    cumulative X'X / X'y (no refit over the full window); 'tree' fits a gradient-boosted tree
+    ensemble per fold. Folds are independent and run on a thread pool (NumPy and scikit-learn
+    release the GIL while fitting, and threads share the design matrix without copying it).
+    """
+    if model not in MODELS:
+        raise ValueError(f"Unknown model '{model}'. Expected one of {MODELS}.")
+
+    with span("walkforward.design"):
+        design = build_design(df, features, horizon)
+    folds = make_folds(len(design.calendar), train_days, test_days, expanding)
+    if not folds:
+        raise ValueError(f"Not enough history for a {train_days}-day training window.")
+
+    if model == "ridge":
+        with span("walkforward.sufficient_statistics"):
+            cum_gram, cum_xty = sufficient_statistics(design)
+
+    # Fold test blocks are contiguous row slices of the date-major design
+    block_bounds = np.searchsorted(design.date_pos, np.arange(len(design.calendar) + 1))
+
+    def run_fold(fold: Fold) -> tuple[np.ndarray, np.ndarray | None]:
+        test = slice(block_bounds[fold.test_start], block_bounds[fold.test_end])
+        X_test = design.X[test]
+        predictions = np.full(len(X_test), np.nan)
+        usable = np.isfinite(X_test).all(axis=1)
+
+        if model == "ridge":
+            # Window statistics = difference of two cumulative sums, whatever the window length
+            gram = cum_gram[fold.train_end] - cum_gram[fold.train_start]
+            xty = cum_xty[fold.train_end] - cum_xty[fold.train_start]
+            if gram[0, 0] < min_train_rows:
+                return predictions, None
+            coef = solve_ridge(gram, xty, alpha)
+            predictions[usable] = X_test[usable] @ coef
+            return predictions, coef
+
+        labels = design.label_pos
+        train = design.valid & (labels >= fold.train_start) & (labels < fold.train_end)
+        if train.sum() < min_train_rows:
+            return predictions, None
+        estimator = _make_tree_model(**model_params).fit(design.X[train, 1:], design.y[train])
+        predictions[usable] = estimator.predict(X_test[usable, 1:])
+        return predictions, None
+
+    window = "expanding" if expanding else "rolling"
+    console.print(f"Walk-forward: {len(folds)} {window} folds ({model})...")
+    with (
+        span("walkforward.folds", folds=len(folds)),
+        ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor,
+    ):
+        outputs = list(executor.map(run_fold, folds))
+
+    # Assemble predictions in fold (calendar) order
+    frames, coefficients = [], []
+    for i, (fold, (predictions, coef)) in enumerate(zip(folds, outputs)):
+        test = slice(block_bounds[fold.test_start], block_bounds[fold.test_end])
+        frames.append(pd.DataFrame({
+            'Date': design.dates[test],
+            'Ticker': design.tickers[test],
+            'fold': i,
+            'prediction': predictions,
+        }))
+        if coef is not None:
+            coefficients.append(pd.Series(coef, index=['intercept', *design.features], name=i))
+
+    return WalkForwardResult(
+        predictions=pd.concat(frames, ignore_index=True),
+        folds=folds,
+        coefficients=pd.DataFrame(coefficients).rename_axis('fold'),
+    )
+
+
+def predictions_to_weights(predictions: pd.DataFrame, threshold: float = 0.0) -> pd.DataFrame:
+    """
+    Turns predictions into a (Dates x Tickers) weight matrix for `run_wide_backtest`:
+    1/N across the tickers whose predicted forward return exceeds `threshold`, cash otherwise.
+    Days outside every test block (the first training window) hold cash.
+    """
+    predicted = predictions.pivot(index='Date', columns='Ticker', values='prediction')
+    is_long = predicted > threshold
+    return is_long.div(is_long.sum(axis=1), axis=0).fillna(0.0)
@@ -0,0 +1,464 @@
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+import pandas as pd
+from rich.console import Console
+
+from alpha_platform.backtest.engine import ENGINES, prepare_prices, run_wide_backtest
+from alpha_platform.backtest.metrics import DEFAULT_WINDOW, panel_from_frames, summarize, timeseries
+from alpha_platform.backtest.rebalance import RebalancePolicy
+from alpha_platform.data.ingestion import ingest_universe, load_config
+from alpha_platform.data.matrix_store import MatrixStore, matrix_store_path, write_matrix_store
+from alpha_platform.data.store import LEGACY_FILE, dataset_root, load_raw_data
+from alpha_platform.features.builder import build_features
+from alpha_platform.portfolio.construction import PortfolioPolicy, construct_portfolio
+from alpha_platform.profiling import span
+from alpha_platform.signals.baselines import STRATEGY_FEATURES, WIDE_STRATEGIES
+from alpha_platform.signals.wide import WideFeatures, pivot_features
+
+console = Console()
+
+STAMP_SUFFIX = ".stamp.json"
+DEFAULT_RAW_DIR = "data/raw"
+DEFAULT_FEATURES_PATH = "data/features/universe_features.parquet"
+DEFAULT_REPORTS_DIR = "data/reports"
+
+# Modules whose source code is part of each stage kind's fingerprint
+STAGE_CODE = {
+    'download': [
+        'alpha_platform.data.ingestion', 'alpha_platform.data.providers',
+        'alpha_platform.data.store',
+    ],
+    'features': [
+        'alpha_platform.features.builder', 'alpha_platform.features.registry',
+        'alpha_platform.features.kernels', 'alpha_platform.features.cross_sectional',
+        'alpha_platform.data.store', 'alpha_platform.data.matrix_store',
+    ],
+    'backtest': [
+        'alpha_platform.signals.baselines', 'alpha_platform.signals.wide',
+        'alpha_platform.backtest.engine', 'alpha_platform.backtest.rebalance',
+        'alpha_platform.portfolio.construction', 'alpha_platform.portfolio.risk',
+    ],
+    'report': ['alpha_platform.backtest.metrics'],
+}
+
+BACKTEST_DEFAULTS = {
+    'costs': 5.0, 'capital': 100_000.0, 'engine': 'numpy',
+    'band': 0.0, 'band_type': 'absolute', 'rebalance': 'daily',
+}
+PORTFOLIO_KEYS = tuple(field.name for field in fields(PortfolioPolicy))
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One node of the pipeline DAG.
+
+    Attributes:
+        name: Unique name ('download', 'features', 'backtest.<name>', 'report').
+        kind: Runner in STAGE_RUNNERS; also selects the modules of its code version.
+        params: Everything the stage reads from the config (paths included).
+        outputs: Artifacts it writes. The first one carries the stamp.
+        deps: Stages that must finish first and whose fingerprints chain into this one.
+        inputs: Files whose content the stage depends on, hashed when the stage is ready
+            (directories by the size and mtime of every file in them).
+        after: Stages that must finish first without entering the fingerprint; the stage is
+            keyed on the content they produce (its `inputs`) instead.
+    """
+    name: str
+    kind: str
+    params: dict
+    outputs: tuple[Path, ...]
+    deps: tuple[str, ...] = ()
+    inputs: tuple[Path, ...] = ()
+    after: tuple[str, ...] = ()
+
+
+# --- Fingerprints & Stamps ---
+def code_version(kind: str) -> str:
+    """Hash of the source files behind a stage kind, so editing them reruns its stages."""
+    digest = hashlib.sha256()
+    for module in STAGE_CODE[kind]:
+        digest.update(Path(importlib.util.find_spec(module).origin).read_bytes())
+    return digest.hexdigest()
+
+
+def _file_hash(path: Path) -> str | None:
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+
+
+def _input_signature(path: Path):
+    """Content hash of an input file; (name, size, mtime) of every file under an input directory."""
+    return _signature(path) if path.is_dir() else _file_hash(path)
+
+
+def fingerprint(stage: Stage, upstream: dict[str, str]) -> str:
+    """
+    Fingerprint of a stage: its kind, params, code version, external inputs and the
+    fingerprints of its dependencies. Chaining them means a change anywhere upstream
+    reaches every stage downstream of it, and nothing else.
+    """
+    payload = json.dumps({
+        'kind': stage.kind,
+        'params': stage.params,
+        'code': code_version(stage.kind),
+        'deps': {dep: upstream[dep] for dep in stage.deps},
+        'inputs': {str(path): _input_signature(path) for path in stage.inputs},
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def stamp_path(output: Path) -> Path:
+    """The stamp sits next to the artifact: `<artifact>.stamp.json`."""
+    return output.with_name(output.name + STAMP_SUFFIX)
+
+
+def _signature(path: Path) -> list[list]:
+    """(relative name, size, mtime) of a file or of every file under a directory."""
+    if not path.exists():
+        return []
+    files = sorted(file for file in path.rglob("*") if file.is_file()) if path.is_dir() else [path]
+    return [
+        [str(file.relative_to(path.parent)), file.stat().st_size, file.stat().st_mtime_ns]
+        for file in files
+    ]
+
+
+def _output_signatures(stage: Stage) -> dict[str, list]:
+    return {str(path): _signature(path) for path in stage.outputs}
+
+
+def is_current(stage: Stage, stage_fingerprint: str) -> bool:
+    """True if the stage's artifacts were written for this fingerprint and not touched since."""
+    path = stamp_path(stage.outputs[0])
+    if not path.exists():
+        return False
+    with open(path, "r") as file:
+        stamp = json.load(file)
+    return (stamp.get('fingerprint') == stage_fingerprint
+            and stamp.get('outputs') == _output_signatures(stage))
+
+
+def write_stamp(stage: Stage, stage_fingerprint: str):
+    path = stamp_path(stage.outputs[0])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w") as file:
+        json.dump({
+            'stage': stage.name,
+            'fingerprint': stage_fingerprint,
+            'params': stage.params,
+            'outputs': _output_signatures(stage),
+        }, file, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+# --- Plan ---
+def _section(value) -> dict:
+    """A config section, given inline or as the path of a YAML file (e.g. configs/universe.yaml)."""
+    if value is None:
+        return {}
+    if isinstance(value, (str, Path)):
+        return load_config(value) or {}
+    if isinstance(value, dict):
+        return dict(value)
+    raise ValueError(f"Expected a mapping or a YAML path, got {value!r}.")
+
+
+def _policies(spec: dict) -> tuple[RebalancePolicy | None, PortfolioPolicy]:
+    """Rebalance and portfolio policies of a backtest spec (raises ValueError when invalid)."""
+    rebalance = None
+    if spec['band'] > 0 or spec['rebalance'] != 'daily':
+        rebalance = RebalancePolicy(
+            band=spec['band'], band_type=spec['band_type'], frequency=spec['rebalance']
+        )
+    portfolio = PortfolioPolicy(**{key: spec[key] for key in PORTFOLIO_KEYS if key in spec})
+    return rebalance, portfolio
+
+
+def backtest_spec(name: str, spec: dict | None = None) -> dict:
+    """
+    A complete, validated backtest spec: the `alpha backtest` options (BACKTEST_DEFAULTS,
+    'strategy' defaulting to `name`, and the PortfolioPolicy fields). Raises ValueError.
+    Shared by the pipeline's backtest stages and the `alpha serve` backtest requests.
+    """
+    spec = {**BACKTEST_DEFAULTS, 'strategy': name, **(spec or {})}
+    unknown = set(spec) - set(BACKTEST_DEFAULTS) - set(PORTFOLIO_KEYS) - {'strategy'}
+    if unknown:
+        raise ValueError(f"Unknown backtest options for '{name}': {sorted(unknown)}.")
+    if spec['strategy'] not in WIDE_STRATEGIES:
+        raise ValueError(
+            f"Unknown strategy '{spec['strategy']}' in backtest '{name}'. "
+            f"Expected one of {list(WIDE_STRATEGIES)}."
+        )
+    if spec['engine'] not in ENGINES:
+        raise ValueError(f"Unknown engine '{spec['engine']}'. Expected one of {ENGINES}.")
+    rebalance, _ = _policies(spec)
+    if rebalance is not None and spec['engine'] != 'numpy':
+        raise ValueError(f"Backtest '{name}': rebalance policies need the 'numpy' engine.")
+    return spec
+
+
+def simulate(
+        features: WideFeatures,
+        prices: pd.DataFrame,
+        spec: dict,
+        target_weights: pd.DataFrame | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """
+    Strategy weights -> portfolio construction -> engine for one validated spec, on
+    already-pivoted (Dates x Tickers) matrices. The one backtest path of the pipeline,
+    `alpha backtest` and `alpha serve`.
+
+    Args:
+        target_weights: Raw strategy weights computed beforehand (e.g. served from the
+            artifact cache); `features` is not used then.
+
+    Returns:
+        (results, diagnostics): the engine's results and the portfolio-construction
+        diagnostics (None when no vol target or exposure limit is set).
+    """
+    if target_weights is None:
+        with span("backtest.signals"):
+            target_weights = WIDE_STRATEGIES[spec['strategy']](features)
+    rebalance, portfolio = _policies(spec)
+    diagnostics = None
+    if portfolio.is_active:
+        target_weights, diagnostics = construct_portfolio(target_weights, prices, portfolio)
+    with span("backtest.run"):
+        results = run_wide_backtest(
+            prices, target_weights, initial_capital=spec['capital'], cost_bps=spec['costs'],
+            engine=spec['engine'], rebalance=rebalance
+        )
+    return results, diagnostics
+
+
+def daily_reference(spec: dict) -> dict:
+    """The spec without band or calendar: trading every asset back to target every day."""
+    return {**spec, 'band': 0.0, 'rebalance': 'daily'}
+
+
+def build_plan(config: dict) -> list[Stage]:
+    """
+    Turns a pipeline config into the stage DAG:
+
+        download -> features -> backtest.<name> (one per backtest, independent) -> report
+
+    Sections: `universe` (optional; without it the raw dataset is used as it is),
+    `features`, `backtests` ({name: params}), `report` and `paths` (raw / features / reports).
+    Every backtest and policy is validated here, before anything runs.
+    """
+    paths = config.get('paths') or {}
+    universe = _section(config.get('universe'))
+    feature_config = _section(config.get('features'))
+    raw_dir = Path(universe.get('output_dir') or paths.get('raw', DEFAULT_RAW_DIR))
+    features_path = Path(paths.get('features', DEFAULT_FEATURES_PATH))
+    reports_dir = Path(paths.get('reports', DEFAULT_REPORTS_DIR))
+    stages = []
+
+    # 1. Download
+    if universe:
+        params = {'universe': {**universe, 'output_dir': str(raw_dir)}}
+        if not universe.get('end_date'):
+            # An open-ended range grows every day: refresh at most once per calendar day
+            params['as_of'] = str(pd.Timestamp.today().date())
+        stages.append(Stage('download', 'download', params, (dataset_root(raw_dir),)))
+
+    # 2. Features, keyed on the raw files (partitions and manifest) rather than the download
+    # fingerprint: a daily refresh that fetched nothing new writes no file, so everything
+    # downstream stays as is, while a rewritten partition (e.g. revised prices) reruns it
+    feature_list = feature_config.get('features')
+    stages.append(Stage(
+        'features', 'features',
+        {
+            'raw_dir': str(raw_dir),
+            'features': feature_list,
+            'groups': feature_config.get('groups'),
+            'path': str(features_path),
+            'matrix_dtype': feature_config.get('matrix_dtype', 'float64'),
+        },
+        (features_path, matrix_store_path(features_path)),
+        inputs=(dataset_root(raw_dir), raw_dir / LEGACY_FILE),
+        after=('download',) if universe else (),
+    ))
+
+    # 3. Backtests
+    backtests = config.get('backtests') or {}
+    results = {}
+    for name, spec in backtests.items():
+        spec = backtest_spec(name, spec)
+        needed = STRATEGY_FEATURES[spec['strategy']]
+        if feature_list is not None and not set(needed) <= set(feature_list):
+            raise ValueError(
+                f"Backtest '{name}' needs features {needed}; add them to the features section."
+            )
+
+        out_path = reports_dir / f"backtest_results_{name}.parquet"
+        results[name] = [str(out_path), spec['costs']]
+        stages.append(Stage(
+            f"backtest.{name}", 'backtest',
+            {**spec, 'features_path': str(features_path), 'path': str(out_path)},
+            (out_path,), deps=('features',)
+        ))
+
+    # 4. Report
+    report = config.get('report')
+    if report is not None and report is not False and results:
+        report = {} if report is True else dict(report)
+        benchmark = report.get('benchmark')
+        if benchmark is not None and benchmark not in results:
+            raise ValueError(f"Report benchmark '{benchmark}' is not one of the backtests.")
+        stages.append(Stage(
+            'report', 'report',
+            {
+                'results': results,
+                'benchmark': benchmark,
+                'window': report.get('window', DEFAULT_WINDOW),
+                'reports_dir': str(reports_dir),
+            },
+            (reports_dir / "report_summary.parquet", reports_dir / "report_timeseries.parquet"),
+            deps=tuple(f"backtest.{name}" for name in results),
+        ))
+    return stages
+
+
+# --- Stage Runners ---
+def _run_download(params: dict):
+    ingest_universe(params['universe'])
+
+
+def _run_features(params: dict):
+    # No ArtifactCache here: the stamp already decides whether this stage runs at all
+    raw = load_raw_data(params['raw_dir'])
+    features_df = build_features(raw, features=params['features'], groups=params['groups'])
+
+    out_path = Path(params['path'])
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if out_path.is_dir():
+        shutil.rmtree(out_path)
+    features_df.to_parquet(out_path, index=False)
+    write_matrix_store(
+        features_df, matrix_store_path(out_path), dtype=params['matrix_dtype'], source_path=out_path
+    )
+
+
+def _run_backtest(params: dict):
+    features_path = Path(params['features_path'])
+    needed = STRATEGY_FEATURES[params['strategy']]
+    store = MatrixStore(matrix_store_path(features_path))
+    if store.is_current(features_path):
+        features = store.features(needed)
+        prices = store.frame('Close').ffill()
+    else:
+        df = pd.read_parquet(features_path)
+        features = pivot_features(df, needed)
+        prices = prepare_prices(df)
+
+    results, _ = simulate(features, prices, params)
+    results.to_parquet(params['path'])
+
+
+def _run_report(params: dict):
+    frames = {name: pd.read_parquet(path) for name, (path, _) in params['results'].items()}
+    costs = {name: cost_bps for name, (_, cost_bps) in params['results'].items()}
+    panel = panel_from_frames(frames, cost_bps=costs)
+    summary = summarize(panel, benchmark=params['benchmark'])
+
+    reports_dir = Path(params['reports_dir'])
+    summary.reset_index().to_parquet(reports_dir / "report_summary.parquet", index=False)
+    timeseries(panel, params['window']).to_parquet(
+        reports_dir / "report_timeseries.parquet", index=False
+    )
+
+
+STAGE_RUNNERS = {
+    'download': _run_download,
+    'features': _run_features,
+    'backtest': _run_backtest,
+    'report': _run_report,
+}
+
+
+def _execute(stage: Stage) -> float:
+    start = time.perf_counter()
+    for output in stage.outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+    with span(f"pipeline.{stage.name}"):
+        STAGE_RUNNERS[stage.kind](stage.params)
+    return time.perf_counter() - start
+
+
+# --- Scheduler ---
+def run_pipeline(
+        stages: list[Stage],
+        workers: int | None = None,
+        force: bool = False,
+        dry_run: bool = False
+) -> dict[str, str]:
+    """
+    Runs the DAG. A stage starts as soon as its dependencies are done, so independent
+    branches (e.g. the backtests) run concurrently on a thread pool: the heavy lifting
+    (Parquet I/O, matrix kernels) releases the GIL.
+
+    A stage whose fingerprint matches its stamp, and whose outputs are unchanged since the
+    stamp was written, is skipped. The stamp is only written after the stage succeeded, so an
+    interrupted run resumes where it stopped.
+    With dry_run, stages keyed on another stage's output (`after`) are judged on the output
+    as it is now, i.e. before that stage would have run.
+
+    Returns:
+        {stage name: 'ran' | 'skipped' | 'stale'} ('stale' = would run, with dry_run).
+    """
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names in {names}.")
+    missing = {dep for stage in stages for dep in stage.deps + stage.after} - set(names)
+    if missing:
+        raise ValueError(f"Unknown dependencies: {sorted(missing)}.")
+
+    fingerprints: dict[str, str] = {}
+    status: dict[str, str] = {}
+    pending = list(stages)
+    running = {}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        while pending or running:
+            ready = [
+                stage for stage in pending
+                if all(dep in fingerprints for dep in stage.deps + stage.after)
+            ]
+            for stage in ready:
+                pending.remove(stage)
+                stage_fingerprint = fingerprint(stage, fingerprints)
+                if not force and is_current(stage, stage_fingerprint):
+                    console.print(f"[dim]✓ {stage.name} up to date[/dim]")
+                    status[stage.name] = 'skipped'
+                    fingerprints[stage.name] = stage_fingerprint
+                elif dry_run:
+                    console.print(f"[yellow]• {stage.name} would run[/yellow]")
+                    status[stage.name] = 'stale'
+                    fingerprints[stage.name] = stage_fingerprint
+                else:
+                    console.print(f"[cyan]▶ {stage.name}[/cyan]")
+                    running[pool.submit(_execute, stage)] = (stage, stage_fingerprint)
+
+            if not running:
+                if pending and not ready:
+                    raise ValueError(f"Dependency cycle between {[s.name for s in pending]}.")
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, stage_fingerprint = running.pop(future)
+                elapsed = future.result()  # Re-raises the stage's error
+                write_stamp(stage, stage_fingerprint)
+                console.print(f"[green]✓ {stage.name} done in {elapsed:.2f}s[/green]")
+                status[stage.name] = 'ran'
+                fingerprints[stage.name] = stage_fingerprint
+    return status
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from alpha_platform.backtest.engine import align_weights
+from alpha_platform.portfolio.risk import (
+    COVARIANCE_METHODS,
+    TRADING_DAYS,
+    asset_returns,
+    predicted_variance,
+)
+from alpha_platform.profiling import span
+
+BISECTION_STEPS = 60
+
+
+@dataclass(frozen=True)
+class PortfolioPolicy:
+    """
+    How raw strategy weights become the target weights handed to the engine.
+
+    Attributes:
+        target_vol: Annualized volatility to scale each day's portfolio to, using the
+            covariance of the returns before that day. None disables vol targeting.
+        max_leverage: Upper bound on the vol-targeting scale factor (quiet markets would
+            otherwise lever a portfolio up without limit).
+        cov_method: 'rolling' (sample covariance over `cov_window` days) or 'ewma'
+            (exponentially weighted with `halflife` days).
+        cov_window: Rolling window in trading days.
+        halflife: EWMA half-life in trading days.
+        min_periods: Days of history before vol targeting starts; weights are left unscaled
+            during the warm-up.
+        max_weight: Per-asset cap on |weight|. None = no cap.
+        max_gross: Cap on the sum of |weight| per day. None = no cap.
+    """
+    target_vol: float | None = None
+    max_leverage: float = 2.0
+    cov_method: str = "rolling"
+    cov_window: int = 63
+    halflife: float = 21.0
+    min_periods: int = 20
+    max_weight: float | None = None
+    max_gross: float | None = None
+
+    def __post_init__(self):
+        if self.target_vol is not None and self.target_vol <= 0:
+            raise ValueError(f"target_vol must be positive, got {self.target_vol}.")
+        if self.max_leverage <= 0:
+            raise ValueError(f"max_leverage must be positive, got {self.max_leverage}.")
+        if self.cov_method not in COVARIANCE_METHODS:
+            raise ValueError(
+                f"Unknown covariance method '{self.cov_method}'. "
+                f"Expected one of {COVARIANCE_METHODS}."
+            )
+        if self.cov_window < 2 or self.halflife <= 0:
+            raise ValueError("cov_window must be at least 2 and halflife positive.")
+        if self.max_weight is not None and self.max_weight <= 0:
+            raise ValueError(f"max_weight must be positive, got {self.max_weight}.")
+        if self.max_gross is not None and self.max_gross <= 0:
+            raise ValueError(f"max_gross must be positive, got {self.max_gross}.")
+
+    @property
+    def is_active(self) -> bool:
+        return any(v is not None for v in (self.target_vol, self.max_weight, self.max_gross))
+
+
+def project_weights(
+        weights: np.ndarray,
+        max_weight: float | None = None,
+        max_gross: float | None = None
+) -> np.ndarray:
+    """
+    Euclidean projection of every row onto {|w_i| <= max_weight, sum |w_i| <= max_gross}.
+
+    Per row the solution is sign(w) * clip(|w| - tau, 0, max_weight) with the smallest
+    tau >= 0 meeting the gross limit: rows already inside are only clipped to the cap, the
+    others lose the same amount from every position (small ones drop to zero). tau is found
+    for all rows at once by bisection, then made exact by solving the linear piece it lands on.
+    """
+    cap = np.inf if max_weight is None else max_weight
+    size = np.minimum(np.abs(weights), cap)
+    if max_gross is None:
+        return np.sign(weights) * size
+
+    over = size.sum(axis=1) > max_gross
+    if over.any():
+        magnitude = np.abs(weights[over])
+        lo = np.zeros(len(magnitude))
+        hi = magnitude.max(axis=1)
+        for _ in range(BISECTION_STEPS):
+            tau = (lo + hi) / 2
+            gross = np.clip(magnitude - tau[:, None], 0.0, cap).sum(axis=1)
+            too_big = gross > max_gross
+            lo = np.where(too_big, tau, lo)
+            hi = np.where(too_big, hi, tau)
+
+        # On the final piece: positions strictly between 0 and the cap move one-for-one with tau
+        tau = hi
+        shifted = magnitude - tau[:, None]
+        free = (shifted > 0) & (shifted < cap)
+        capped = (shifted >= cap).sum(axis=1) * (cap if np.isfinite(cap) else 0.0)
+        n_free = free.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            exact = ((magnitude * free).sum(axis=1) + capped - max_gross) / n_free
+        tau = np.where(n_free > 0, exact, tau)
+        size[over] = np.clip(magnitude - tau[:, None], 0.0, cap)
+
+    return np.sign(weights) * size
+
+
+def construct_portfolio(
+        target_weights: pd.DataFrame,
+        prices: pd.DataFrame,
+        policy: PortfolioPolicy
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    The portfolio-construction stage between the signals and the engine.
+
+    1. Aligns the strategy's (Dates x Tickers) weights with the price matrix.
+    2. Vol targeting: scales each day's weights by target_vol / predicted vol, capped at
+       max_leverage. The prediction for day t only uses returns up to t - 1, as the weights
+       set on day t are traded at t's close and earn the move from t to t + 1.
+    3. Projects each day onto the per-asset and gross exposure limits, so the limits hold
+       whatever the scaling did.
+
+    Returns:
+        (weights, diagnostics): the constrained weights aligned with `prices`, and a per-day
+        frame with predicted_vol (of the raw weights), scale and gross exposure.
+    """
+    with span("portfolio.construct"):
+        weights = align_weights(target_weights, prices)
+        raw = weights.to_numpy(dtype=np.float64, copy=True)
+        scale = np.ones(len(raw))
+        predicted_vol = np.full(len(raw), np.nan)
+
+        # 1. Vol targeting
+        if policy.target_vol is not None:
+            variance = predicted_variance(
+                raw, asset_returns(prices), method=policy.cov_method, window=policy.cov_window,
+                halflife=policy.halflife, min_periods=policy.min_periods
+            )
+            predicted_vol = np.sqrt(variance * TRADING_DAYS)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scale = np.minimum(policy.target_vol / predicted_vol, policy.max_leverage)
+            scale = np.where(np.isnan(predicted_vol), 1.0, scale)
+
+        # 2. Exposure limits
+        constrained = project_weights(raw * scale[:, None], policy.max_weight, policy.max_gross)
+
+    diagnostics = pd.DataFrame({
+        'predicted_vol': predicted_vol,
+        'scale': scale,
+        'gross_exposure': np.abs(constrained).sum(axis=1),
+    }, index=weights.index)
+    return pd.DataFrame(constrained, index=weights.index, columns=weights.columns), diagnostics
@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+
+from alpha_platform.profiling import span
+
+COVARIANCE_METHODS = ("rolling", "ewma")
+TRADING_DAYS = 252
+
+
+def asset_returns(prices: pd.DataFrame) -> np.ndarray:
+    """
+    Daily simple returns of a forward-filled (Dates x Tickers) price matrix as float64.
+    Days without a return (first day, not yet listed) are 0.0, so they add no risk.
+    """
+    returns = prices.pct_change(fill_method=None).to_numpy(dtype=np.float64)
+    return np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def _decay(halflife: float) -> float:
+    return 0.5 ** (1.0 / halflife)
+
+
+def predicted_variance(
+        weights: np.ndarray,
+        returns: np.ndarray,
+        method: str = "rolling",
+        window: int = 63,
+        halflife: float = 21.0,
+        min_periods: int = 20,
+        block_size: int = 64
+) -> np.ndarray:
+    """
+    Daily predicted variance w_t' C_t w_t of each day's weights, where C_t is the covariance of
+    the asset returns strictly before day t (the weights set on day t never see day t's return).
+
+    The covariance is never recomputed from scratch. The estimator keeps the running
+    cross-product matrix sum(r r') (plus sum(r) for the rolling mean) and updates it as days
+    enter and leave: 'rolling' adds each entering day and subtracts the day leaving a
+    `window`-day window; 'ewma' decays the state by lambda per day (zero-mean, RiskMetrics
+    style, normalized by the total weight so early estimates are not biased low).
+
+    Days are processed in blocks: one (block x N) @ (N x N) product evaluates every day's
+    quadratic form against the state at the start of the block, corrected by the rank-one
+    terms of the days entered / left within the block; the state then absorbs the whole block
+    with one rank-k update. Each day costs O(N^2) at matrix-multiply speed instead of the
+    O(W N^2) of a full re-estimate.
+
+    Args:
+        weights: (Dates x N) weight matrix.
+        returns: (Dates x N) daily asset returns without NaN (see `asset_returns`).
+        min_periods: Days of history required before a prediction (NaN before).
+
+    Returns:
+        (Dates,) daily variances (not annualized), NaN during the warm-up.
+    """
+    if method not in COVARIANCE_METHODS:
+        raise ValueError(
+            f"Unknown covariance method '{method}'. Expected one of {COVARIANCE_METHODS}."
+        )
+    if weights.shape != returns.shape:
+        raise ValueError(
+            f"Weights {weights.shape} and returns {returns.shape} must have the same shape."
+        )
+    n_dates, n_assets = returns.shape
+
+    cross = np.zeros((n_assets, n_assets))  # sum of r r' over the state's days
+    total = np.zeros(n_assets)              # sum of r (rolling only)
+    mass = 0.0                              # days in the window / total EWMA weight
+    lam = _decay(halflife)
+
+    variance = np.full(n_dates, np.nan)
+    with span("portfolio.predicted_variance", method=method, assets=n_assets):
+        for start in range(0, n_dates, block_size):
+            stop = min(start + block_size, n_dates)
+            w = weights[start:stop]
+            entering = returns[start:stop]
+            k = np.arange(stop - start)
+
+            # Quadratic forms against the state at the start of the block
+            base = np.einsum('jn,jn->j', w @ cross, w)
+            # in_proj[s, j] = r_(start+s) . w_(start+j); day j has seen entering days s < j
+            in_proj = entering @ w.T
+            seen = k[:, None] < k[None, :]
+
+            if method == "rolling":
+                # Days leaving the window while the block runs: start - window + s, for s < j
+                leave_rows = np.arange(start - window, stop - window)
+                leaving = returns[np.clip(leave_rows, 0, None)] * (leave_rows >= 0)[:, None]
+                out_proj = leaving @ w.T
+
+                sq = base + (seen * in_proj ** 2).sum(axis=0) - (seen * out_proj ** 2).sum(axis=0)
+                mean_proj = (total @ w.T + (seen * in_proj).sum(axis=0)
+                             - (seen * out_proj).sum(axis=0))
+                count = np.minimum(start + k, window).astype(np.float64)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    block_var = (sq - mean_proj ** 2 / count) / (count - 1)
+
+                cross += entering.T @ entering - leaving.T @ leaving
+                total += entering.sum(axis=0) - leaving.sum(axis=0)
+            else:
+                # Day j sees the state decayed j times plus entering day s weighted lam^(j-1-s)
+                age = np.where(seen, k[None, :] - 1 - k[:, None], 0)
+                decay = np.where(seen, (1 - lam) * lam ** age, 0.0)
+                sq = lam ** k * base + (decay * in_proj ** 2).sum(axis=0)
+                weight = lam ** k * mass + decay.sum(axis=0)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    block_var = sq / weight
+
+                recency = (1 - lam) * lam ** (len(k) - 1 - k)
+                cross = lam ** len(k) * cross + entering.T @ (recency[:, None] * entering)
+                mass = lam ** len(k) * mass + recency.sum()
+                count = (start + k).astype(np.float64)
+
+            block_var[count < max(min_periods, 2)] = np.nan
+            variance[start:stop] = np.clip(block_var, 0.0, None)
+
+    return variance
+
+
+def covariance_at(
+        returns: np.ndarray,
+        t: int,
+        method: str = "rolling",
+        window: int = 63,
+        halflife: float = 21.0
+) -> np.ndarray:
+    """
+    The covariance estimate available on day t, computed directly from the returns before t.
+    The from-scratch reference `predicted_variance` is tested against (and handy for inspection).
+    """
+    if method not in COVARIANCE_METHODS:
+        raise ValueError(
+            f"Unknown covariance method '{method}'. Expected one of {COVARIANCE_METHODS}."
+        )
+    if method == "rolling":
+        history = returns[max(t - window, 0):t]
+        return np.cov(history, rowvar=False, ddof=1)
+    lam = _decay(halflife)
+    history = returns[:t]
+    weights = (1 - lam) * lam ** np.arange(t - 1, -1, -1)
+    return (history.T * weights) @ history / weights.sum()
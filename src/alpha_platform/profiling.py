@@ -0,0 +1,230 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+# The profiler `span` reports to; None (the default) turns every span into a no-op
+_ACTIVE: "Profiler | None" = None
+
+
+@dataclass
+class SpanRecord:
+    """
+    One finished span.
+
+    Attributes:
+        name: Stage name, e.g. 'features.build' or 'engine.loop'.
+        start: Seconds since the profiler started.
+        duration: Wall time in seconds.
+        thread: Identifier of the thread that ran it (worker threads get their own trace lane).
+        depth: Nesting level within its thread (0 = top-level stage).
+        peak_mb: Peak traced allocation above the span's starting point
+            (None without memory tracing, or for spans off the profiling thread).
+        args: Extra labels, e.g. the ticker being fetched.
+    """
+    name: str
+    start: float
+    duration: float
+    thread: int
+    depth: int
+    peak_mb: float | None = None
+    args: dict = field(default_factory=dict)
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, profiler: "Profiler", name: str, args: dict):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        stack = self.profiler._stack()
+        self.depth = len(stack)
+        self.peak = 0
+        # tracemalloc has one process-wide peak: only the profiling thread may read and reset it
+        self.trace_memory = (
+            self.profiler.trace_memory and threading.get_ident() == self.profiler.owner
+        )
+        if self.trace_memory:
+            # Fold the allocation peak reached so far into the parent, then measure ours from here
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            self.base = current
+            tracemalloc.reset_peak()
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        stack = self.profiler._stack()
+        stack.pop()
+
+        peak_mb = None
+        if self.trace_memory:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, self.peak)
+            tracemalloc.reset_peak()
+            peak_mb = max(self.peak - self.base, 0) / 1024 ** 2
+
+        self.profiler._record(SpanRecord(
+            name=self.name,
+            start=self.start - self.profiler.origin,
+            duration=end - self.start,
+            thread=threading.get_ident(),
+            depth=self.depth,
+            peak_mb=peak_mb,
+            args=self.args,
+        ))
+        return False
+
+
+def span(name: str, **args):
+    """
+    Context manager timing a named stage for the active profiler.
+
+    With no profiler active this returns a shared no-op object, so instrumented code pays one
+    global lookup per span. Keep spans at stage granularity (not inside per-row/per-day loops).
+    """
+    if _ACTIVE is None:
+        return _NULL_SPAN
+    return _Span(_ACTIVE, name, args)
+
+
+class Profiler:
+    """
+    Collects the spans opened while it is active (used as a context manager).
+
+    Args:
+        trace_memory: Also record each span's peak allocation via tracemalloc. Tracing makes
+            allocation-heavy stages noticeably slower, so read timings from a run without it.
+            tracemalloc tracks a single peak for the whole process, so only spans on the thread
+            that entered the profiler get a peak (which includes the allocations of any worker
+            threads running meanwhile); spans on other threads report none.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.records: list[SpanRecord] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.origin = time.perf_counter()
+        self.owner = threading.get_ident()
+
+    def _stack(self) -> list[_Span]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _record(self, record: SpanRecord):
+        with self._lock:
+            self.records.append(record)
+
+    def __enter__(self):
+        global _ACTIVE
+        if _ACTIVE is not None:
+            raise RuntimeError("Another profiler is already active.")
+        if self.trace_memory:
+            tracemalloc.start()
+        self.origin = time.perf_counter()
+        self.owner = threading.get_ident()
+        _ACTIVE = self
+        return self
+
+    def __exit__(self, *exc):
+        global _ACTIVE
+        _ACTIVE = None
+        if self.trace_memory:
+            tracemalloc.stop()
+        return False
+
+    # --- Reporting ---
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per span name, in order of first appearance: calls, total / mean / max seconds,
+        share of the profiled wall time and the largest peak allocation.
+        Spans running concurrently on worker threads can add up to more than 100% of wall time.
+        """
+        columns = ['name', 'calls', 'total_s', 'mean_s', 'max_s', 'pct_wall', 'peak_mb']
+        if not self.records:
+            return pd.DataFrame(columns=columns)
+
+        df = pd.DataFrame([vars(record) for record in self.records]).sort_values('start')
+        summary = df.groupby('name', sort=False).agg(
+            calls=('duration', 'size'),
+            total_s=('duration', 'sum'),
+            mean_s=('duration', 'mean'),
+            max_s=('duration', 'max'),
+            peak_mb=('peak_mb', 'max'),
+        ).reset_index()
+
+        # Wall time covered by the top-level spans (nested spans would double count)
+        top = df[df['depth'] == 0]
+        wall = (top['start'] + top['duration']).max() - top['start'].min()
+        summary['pct_wall'] = 100 * summary['total_s'] / wall if wall > 0 else 0.0
+        return summary[columns]
+
+    def print_summary(self, title: str = "Profile"):
+        """Prints the summary as a table on the rich console."""
+        table = Table(title=title)
+        table.add_column("Stage", overflow="fold")
+        for header in ("Calls", "Total (s)", "Mean (s)", "Max (s)", "% Wall", "Peak MB"):
+            table.add_column(header, justify="right")
+        for row in self.summary().itertuples(index=False):
+            table.add_row(
+                row.name, str(row.calls), f"{row.total_s:.4f}", f"{row.mean_s:.4f}",
+                f"{row.max_s:.4f}", f"{row.pct_wall:.1f}",
+                "-" if pd.isna(row.peak_mb) else f"{row.peak_mb:.1f}",
+            )
+        console.print(table)
+
+    def to_chrome_trace(self) -> dict:
+        """
+        The spans in Chrome trace-event format: open the JSON in chrome://tracing or Perfetto.
+        """
+        pid = os.getpid()
+        events = []
+        for record in sorted(self.records, key=lambda r: r.start):
+            args = dict(record.args)
+            if record.peak_mb is not None:
+                args['peak_mb'] = round(record.peak_mb, 3)
+            events.append({
+                'name': record.name,
+                'cat': record.name.split('.')[0],
+                'ph': 'X',
+                'ts': record.start * 1e6,
+                'dur': record.duration * 1e6,
+                'pid': pid,
+                'tid': record.thread,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_trace(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file, default=str)
+        return path
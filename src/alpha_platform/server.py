@@ -0,0 +1,331 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+from rich.console import Console
+
+from alpha_platform.backtest.metrics import (
+    DEFAULT_WINDOW,
+    find_results,
+    load_panel,
+    panel_from_frames,
+    rank_summary,
+    summarize,
+    timeseries,
+)
+from alpha_platform.backtest.rebalance import rebalance_report
+from alpha_platform.backtest.sweep import run_sweep_matrices, summarize_sweep
+from alpha_platform.client import DEFAULT_HOST, DEFAULT_PORT, server_url
+from alpha_platform.data.matrix_store import (
+    INDEX_FILE,
+    MatrixStore,
+    matrix_store_path,
+    source_signature,
+)
+from alpha_platform.pipeline import (
+    DEFAULT_FEATURES_PATH,
+    DEFAULT_REPORTS_DIR,
+    backtest_spec,
+    daily_reference,
+    simulate,
+)
+from alpha_platform.signals.baselines import WIDE_STRATEGIES
+from alpha_platform.signals.wide import WideFeatures, pivot_features
+
+console = Console()
+
+MAX_CACHED_PANELS = 16
+
+
+def _write_parquet(frame: pd.DataFrame, path: Path, **kwargs):
+    """
+    Writes via a temp file and os.replace: concurrent requests saving the same result never
+    interleave, and readers see either the old or the new file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    frame.to_parquet(tmp_path, **kwargs)
+    os.replace(tmp_path, path)
+
+
+class ResearchSession:
+    """
+    The resident state of `alpha serve`: every feature column as an in-memory
+    (Dates x Tickers) matrix plus the forward-filled price matrix, loaded and pivoted once.
+
+    Each request checks the features file's signature (name, size, mtime) and reloads only
+    when it changed on disk, so a server left running picks up a new `alpha features` run.
+    Loaded results panels for reports are cached the same way.
+    """
+
+    def __init__(
+            self,
+            features_path: str | Path = DEFAULT_FEATURES_PATH,
+            reports_dir: str | Path = DEFAULT_REPORTS_DIR
+    ):
+        self.features_path = Path(features_path)
+        self.reports_dir = Path(reports_dir)
+        self.matrices: WideFeatures = {}
+        self.prices: pd.DataFrame | None = None
+        self.requests = 0
+        self._signature = None
+        self._panels: dict = {}
+        self._lock = threading.Lock()
+
+    # --- Resident Data ---
+    def ensure_loaded(self) -> tuple[WideFeatures, pd.DataFrame]:
+        """
+        Loads the matrices if missing or stale and returns a (matrices, prices) snapshot taken
+        under the lock, so a concurrent reload cannot pair new matrices with old prices.
+        """
+        if not self.features_path.exists():
+            raise FileNotFoundError(
+                f"Features not found at {self.features_path}. Run 'alpha features' first."
+            )
+        signature = source_signature(self.features_path)
+        with self._lock:
+            if signature == self._signature:
+                return self.matrices, self.prices
+            start = time.perf_counter()
+            store_dir = matrix_store_path(self.features_path)
+            store = MatrixStore(store_dir) if (store_dir / INDEX_FILE).exists() else None
+            if store is not None and store.is_current(self.features_path):
+                # Copy out of the memory map so the matrices stay resident
+                matrices = {col: store.frame(col).copy() for col in store.columns}
+            else:
+                df = pd.read_parquet(self.features_path)
+                numeric = [
+                    col for col in df.columns
+                    if col not in ('Date', 'Ticker') and pd.api.types.is_numeric_dtype(df[col])
+                ]
+                matrices = pivot_features(df, numeric)
+
+            self.matrices = matrices
+            self.prices = matrices['Close'].ffill()
+            self._signature = signature
+            console.print(
+                f"Loaded {len(matrices)} matrices ({self.prices.shape[0]} dates x "
+                f"{self.prices.shape[1]} tickers) in {time.perf_counter() - start:.2f}s"
+            )
+            return self.matrices, self.prices
+
+    def _panel(self, paths: list[Path], cost_bps: float):
+        key = (cost_bps, tuple((str(path), json.dumps(source_signature(path))) for path in paths))
+        with self._lock:
+            panel = self._panels.get(key)
+        if panel is None:
+            panel = load_panel(paths, cost_bps=cost_bps)
+            with self._lock:
+                if len(self._panels) >= MAX_CACHED_PANELS:
+                    self._panels.clear()
+                self._panels[key] = panel
+        return panel
+
+    # --- Requests ---
+    def health(self, payload: dict | None = None) -> dict:
+        with self._lock:
+            prices, requests = self.prices, self.requests
+        return {
+            'status': 'ok',
+            'features': str(self.features_path),
+            'loaded': prices is not None,
+            'dates': prices.shape[0] if prices is not None else 0,
+            'tickers': prices.shape[1] if prices is not None else 0,
+            'requests': requests,
+        }
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def reload(self, payload: dict | None = None) -> dict:
+        with self._lock:
+            self._signature = None
+            self._panels.clear()
+        self.ensure_loaded()
+        return self.health()
+
+    def backtest(self, payload: dict) -> dict:
+        """`alpha backtest` on the resident matrices. Takes the pipeline's backtest options."""
+        payload = dict(payload)
+        save = payload.pop('save', True)
+        spec = backtest_spec(payload.get('strategy', 'trend'), payload)
+        matrices, prices = self.ensure_loaded()
+
+        results, diagnostics = simulate(matrices, prices, spec)
+        summary = summarize(panel_from_frames({'run': results}, cost_bps=spec['costs']))
+        reply = {'metrics': summary.iloc[0].to_dict(), 'days': len(results)}
+        if diagnostics is not None:
+            reply['portfolio'] = {
+                'predicted_vol': diagnostics['predicted_vol'].median(),
+                'scale': diagnostics['scale'].median(),
+                'gross_exposure': diagnostics['gross_exposure'].max(),
+            }
+        if 'rebalanced' in results.columns:
+            # Same comparison as the CLI: trading every asset back to target every day
+            reference, _ = simulate(matrices, prices, daily_reference(spec))
+            reply['rebalance'] = rebalance_report(results, reference)
+        if save:
+            out_path = self.reports_dir / f"backtest_results_{spec['strategy']}.parquet"
+            _write_parquet(results, out_path)
+            reply['saved'] = str(out_path)
+        return reply
+
+    def sweep(self, payload: dict) -> dict:
+        """`alpha sweep` on the resident matrices (no load, no pivot)."""
+        strategies = payload.get('strategies', ['equal_weight', 'trend'])
+        unknown = [name for name in strategies if name not in WIDE_STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown strategies {unknown}.")
+        matrices, _ = self.ensure_loaded()
+
+        results = run_sweep_matrices(
+            matrices, strategies, [float(c) for c in payload.get('costs', [0, 5, 10, 20])],
+            [float(c) for c in payload.get('capital', [100_000.0])]
+        )
+        summary = summarize_sweep(results)
+        reply = {'scenarios': len(summary), 'table': summary.to_string(index=False)}
+        if payload.get('save', True):
+            out_path = self.reports_dir / "sweep_results.parquet"
+            _write_parquet(results, out_path, index=False)
+            reply['saved'] = str(out_path)
+        return reply
+
+    def report(self, payload: dict) -> dict:
+        """`alpha report` with the loaded results panels cached between requests."""
+        paths = [Path(path) for path in payload.get('paths') or []]
+        paths = paths or find_results(self.reports_dir)
+        if not paths:
+            raise FileNotFoundError(
+                "No results found. Run 'alpha backtest' or 'alpha sweep' first."
+            )
+        benchmark = payload.get('benchmark')
+        sort = payload.get('sort', 'sharpe')
+
+        panel = self._panel(paths, float(payload.get('costs', 5.0)))
+        summary = summarize(panel, benchmark=benchmark)
+        shown = rank_summary(summary, sort, int(payload.get('top', 20)), benchmark)
+        reply = {
+            'runs': len(summary),
+            'table': shown.to_string(float_format=lambda value: f"{value:.4f}"),
+        }
+        if payload.get('save', True):
+            window = int(payload.get('window') or DEFAULT_WINDOW)
+            _write_parquet(
+                summary.reset_index(), self.reports_dir / "report_summary.parquet", index=False
+            )
+            _write_parquet(
+                timeseries(panel, window), self.reports_dir / "report_timeseries.parquet",
+                index=False
+            )
+            reply['saved'] = str(self.reports_dir)
+        return reply
+
+
+ROUTES = {
+    'health': ResearchSession.health,
+    'reload': ResearchSession.reload,
+    'backtest': ResearchSession.backtest,
+    'sweep': ResearchSession.sweep,
+    'report': ResearchSession.report,
+}
+
+
+def _to_json(value):
+    """numpy scalars, timestamps and paths in replies."""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """JSON over HTTP: GET /health, POST /<command> with the command's options as the body."""
+
+    server: "ResearchServer"
+
+    def _reply(self, status: int, body: dict):
+        data = json.dumps(body, default=_to_json).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.strip('/') != 'health':
+            self._reply(404, {'error': f"Unknown endpoint '{self.path}'."})
+            return
+        self._reply(200, self.server.session.health())
+
+    def do_POST(self):
+        command = self.path.strip('/')
+        if command == 'shutdown':
+            self._reply(200, {'status': 'stopping'})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        if command not in ROUTES:
+            self._reply(
+                404, {'error': f"Unknown command '{command}'. Expected one of {list(ROUTES)}."}
+            )
+            return
+
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            reply = ROUTES[command](self.server.session, payload)
+        except (FileNotFoundError, ValueError, TypeError) as exc:
+            self._reply(400, {'error': str(exc)})
+            return
+        except Exception as exc:  # noqa: BLE001  Keep serving: report the failure instead
+            self._reply(500, {'error': f"{type(exc).__name__}: {exc}"})
+            return
+        self.server.session.record_request()
+        reply['seconds'] = time.perf_counter() - start
+        self._reply(200, reply)
+
+    def log_message(self, format, *args):
+        console.print(f"[dim]{self.address_string()} {format % args}[/dim]")
+
+
+class ResearchServer(ThreadingHTTPServer):
+    """A threaded HTTP server around one shared ResearchSession."""
+
+    daemon_threads = True
+
+    def __init__(
+            self,
+            session: ResearchSession,
+            host: str = DEFAULT_HOST,
+            port: int = DEFAULT_PORT
+    ):
+        super().__init__((host, port), _Handler)
+        self.session = session
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return server_url(host, port)
+
+
+def serve(
+        features_path: str | Path = DEFAULT_FEATURES_PATH,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        preload: bool = True
+):
+    """Runs the research server until interrupted (Ctrl+C) or sent POST /shutdown."""
+    session = ResearchSession(features_path)
+    if preload:
+        session.ensure_loaded()
+    server = ResearchServer(session, host, port)
+    console.print(f"[bold green]Alpha research server listening on {server.url}[/bold green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        console.print("Server stopped.")
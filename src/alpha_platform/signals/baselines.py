@@ -1,46 +1,82 @@
 import pandas as pd
-import numpy as np
 
+from alpha_platform.signals.wide import WideFeatures, attach_target_weights, pivot_features
 
-def equal_weight_strategy(df: pd.DataFrame) -> pd.DataFrame:
+# --- Wide Signal API ---
+# Strategies receive (Dates x Tickers) feature matrices and return a (Dates x Tickers) weight
+# matrix that the backtest engine consumes directly, with no long-format round trip.
+
+def equal_weight_wide(features: WideFeatures) -> pd.DataFrame:
     """
     Baseline Strategy: Invests equally across all assets that have enough data.
     """
-    out = df.copy()
-
     # Eligible if the 200-day SMA is available (avoids trading on Day 1)
-    out['is_eligible'] = out['sma_ratio_20_200'].notna()
+    is_eligible = features['sma_ratio_20_200'].notna()
 
     # Count how many assets are eligible per day across the universe
-    eligible_count = out.groupby('Date')['is_eligible'].transform('sum')
+    eligible_count = is_eligible.sum(axis=1)
 
-    # Assign 1/N weight to eligible assets
-    out['target_weight'] = np.where(
-        out['is_eligible'] & (eligible_count > 0),
-        1.0 / eligible_count,
-        0.0
-    )
-    return out
+    # Assign 1/N weight to eligible assets (0 on days where nothing is eligible)
+    return is_eligible.div(eligible_count, axis=0).fillna(0.0)
 
 
-def trend_following_strategy(df: pd.DataFrame) -> pd.DataFrame:
+def trend_following_wide(features: WideFeatures, threshold: float = 1.0) -> pd.DataFrame:
     """
-    Active Strategy: Only invests in assets exhibiting positive momentum (SMA ratio > 1.0).
+    Active Strategy: Only invests in assets exhibiting positive momentum (SMA ratio > threshold).
     Moves to cash during downtrends.
     """
-    out = df.copy()
-
     # The mathematical rule: Is the fast moving average > slow moving average?
-    out['is_bullish'] = out['sma_ratio_20_200'] > 1.0
+    is_bullish = features['sma_ratio_20_200'] > threshold
 
     # Count how many assets are bullish today
-    bullish_count = out.groupby('Date')['is_bullish'].transform('sum')
+    bullish_count = is_bullish.sum(axis=1)
 
     # Assign 1/N weight ONLY to bullish assets.
     # If 0 assets are bullish, we hold 100% cash (weights sum to 0).
-    out['target_weight'] = np.where(
-        out['is_bullish'] & (bullish_count > 0),
-        1.0 / bullish_count,
-        0.0
-    )
-    return out
\ No newline at end of file
+    return is_bullish.div(bullish_count, axis=0).fillna(0.0)
+
+
+# Registry of wide strategies and the feature columns each one reads
+WIDE_STRATEGIES = {
+    "equal_weight": equal_weight_wide,
+    "trend": trend_following_wide,
+}
+STRATEGY_FEATURES = {
+    "equal_weight": ['sma_ratio_20_200'],
+    "trend": ['sma_ratio_20_200'],
+}
+
+
+def strategy_weights(df: pd.DataFrame, strategy: str, **params) -> pd.DataFrame:
+    """
+    Pivots only the features a registered strategy needs and returns its (Dates x Tickers) weights.
+    """
+    if strategy not in WIDE_STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}'. Expected one of {list(WIDE_STRATEGIES)}.")
+    features = pivot_features(df, STRATEGY_FEATURES[strategy])
+    return WIDE_STRATEGIES[strategy](features, **params)
+
+
+# --- Long-Format Adapters ---
+# Kept for callers that work on the long frame: they add a 'target_weight' column.
+
+def equal_weight_strategy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Baseline Strategy: Invests equally across all assets that have enough data.
+    """
+    return attach_target_weights(df, strategy_weights(df, "equal_weight"))
+
+
+def trend_following_strategy(df: pd.DataFrame, threshold: float = 1.0) -> pd.DataFrame:
+    """
+    Active Strategy: Only invests in assets exhibiting positive momentum (SMA ratio > threshold).
+    Moves to cash during downtrends.
+    """
+    return attach_target_weights(df, strategy_weights(df, "trend", threshold=threshold))
+
+
+# Registry of strategies selectable by name from the CLI and sweep API
+STRATEGIES = {
+    "equal_weight": equal_weight_strategy,
+    "trend": trend_following_strategy,
+}
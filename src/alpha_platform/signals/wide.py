@@ -0,0 +1,25 @@
+import pandas as pd
+
+# A strategy's inputs: feature name -> (Dates x Tickers) matrix, all sharing one index and columns
+WideFeatures = dict[str, pd.DataFrame]
+
+
+def pivot_features(df: pd.DataFrame, columns: list[str]) -> WideFeatures:
+    """
+    Pivots several long-format columns into aligned (Dates x Tickers) matrices with a single pivot.
+    Missing (Date, Ticker) cells are NaN; nothing is forward-filled here.
+    """
+    columns = list(dict.fromkeys(columns))
+    wide = df.pivot(index='Date', columns='Ticker', values=columns)
+    return {col: wide[col] for col in columns}
+
+
+def attach_target_weights(df: pd.DataFrame, weights: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adapter from the wide signal API back to the long format: returns a copy of `df`
+    with a 'target_weight' column looked up from the (Dates x Tickers) weight matrix.
+    """
+    out = df.copy()
+    keys = pd.MultiIndex.from_arrays([out['Date'], out['Ticker']])
+    out['target_weight'] = weights.stack().reindex(keys).fillna(0.0).to_numpy()
+    return out
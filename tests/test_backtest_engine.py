@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.backtest.engine import run_iterative_backtest
+
+
+def make_signal_frame(n_days: int = 60, seed: int = 7) -> pd.DataFrame:
+    """
+    Builds a long-format frame with prices and random target weights for three tickers.
+    Ticker CCC only starts trading halfway through to exercise missing prices.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2026-01-01", periods=n_days, freq="B")
+    frames = []
+    for ticker in ["AAA", "BBB", "CCC"]:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_days)))
+        weights = rng.uniform(0, 0.4, n_days)
+        frame = pd.DataFrame({"Date": dates, "Ticker": ticker, "Close": close, "target_weight": weights})
+        if ticker == "CCC":
+            frame = frame.iloc[n_days // 2:]
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_numpy_engine_is_bit_identical_to_reference_loop():
+    """
+    The array-backed kernel must reproduce the pandas reference loop exactly (no tolerance).
+    """
+    # 1. ARRANGE
+    df = make_signal_frame()
+
+    # 2. ACT
+    reference = run_iterative_backtest(df, initial_capital=100_000.0, cost_bps=7.5, engine="pandas")
+    fast = run_iterative_backtest(df, initial_capital=100_000.0, cost_bps=7.5, engine="numpy")
+
+    # 3. ASSERT
+    pd.testing.assert_frame_equal(fast, reference, check_exact=True)
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        run_iterative_backtest(make_signal_frame(), engine="fortran")
@@ -0,0 +1,53 @@
+import pandas as pd
+
+from alpha_platform.bench.suite import compare_reports, run_benchmarks
+from alpha_platform.bench.synthetic import make_synthetic_universe
+
+
+def test_synthetic_universe_is_deterministic_and_ragged():
+    """
+    Same arguments, same frame; missingness drops rows so tickers have different calendars.
+    """
+    # 1. ARRANGE & ACT
+    a = make_synthetic_universe(20, 100, missing_frac=0.1, seed=7)
+    b = make_synthetic_universe(20, 100, missing_frac=0.1, seed=7)
+
+    # 2. ASSERT
+    pd.testing.assert_frame_equal(a, b)
+    assert 0.85 * 2000 < len(a) < 0.95 * 2000
+    assert a.groupby('Ticker').size().nunique() > 1
+    assert (a['High'] >= a[['Open', 'Close']].max(axis=1)).all()
+    assert (a['Low'] <= a[['Open', 'Close']].min(axis=1)).all()
+
+
+def test_run_benchmarks_covers_every_stage():
+    report = run_benchmarks([3], n_days=250, repeats=1)
+
+    stages = [result['stage'] for result in report['results']]
+    assert stages == [
+        'build_features', 'strategy:equal_weight', 'strategy:trend',
+        'prepare_wide_matrices', 'run_iterative_backtest',
+    ]
+    assert all(result['seconds'] > 0 and result['peak_mb'] > 0 for result in report['results'])
+
+
+def test_compare_reports_flags_only_real_slowdowns():
+    """
+    A stage is a regression when it is slower than the threshold allows and not below the noise floor.
+    """
+    # 1. ARRANGE
+    def report(seconds: dict) -> dict:
+        return {'results': [
+            {'stage': stage, 'n_tickers': 10, 'n_days': 100, 'missing_frac': 0.0, 'seconds': s}
+            for stage, s in seconds.items()
+        ]}
+
+    baseline = report({'fast': 1.0, 'slow': 1.0, 'tiny': 0.001})
+    current = report({'fast': 1.1, 'slow': 2.0, 'tiny': 0.005, 'new': 3.0})
+
+    # 2. ACT
+    regressions = compare_reports(baseline, current, threshold=0.25)
+
+    # 3. ASSERT
+    assert [r['stage'] for r in regressions] == ['slow']
+    assert regressions[0]['ratio'] == 2.0
@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from alpha_platform.cache import ArtifactCache, make_key
+from alpha_platform.signals.baselines import trend_following_strategy
+
+
+def make_features(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2026-01-01", periods=50)
+    return pd.DataFrame({
+        "Date": np.tile(dates, 2),
+        "Ticker": np.repeat(["AAA", "BBB"], 50),
+        "Close": rng.uniform(10, 20, 100),
+        "sma_ratio_20_200": rng.normal(1.0, 0.05, 100),
+    })
+
+
+def test_repeat_call_is_served_from_cache(tmp_path):
+    """
+    Test that an unchanged (function, parameters, data) triple is computed once,
+    while a changed parameter or changed input data misses.
+    """
+    cache = ArtifactCache(tmp_path)
+    df = make_features()
+
+    first = cache.call(trend_following_strategy, df, threshold=1.0)
+    second = cache.call(trend_following_strategy, df, threshold=1.0)
+    pd.testing.assert_frame_equal(first, second)
+    assert cache.stats()["hits"] == 1
+
+    cache.call(trend_following_strategy, df, threshold=1.02)  # New parameter
+    cache.call(trend_following_strategy, make_features(seed=1), threshold=1.0)  # New data
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 3)
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    cache = ArtifactCache(tmp_path)
+    frames = [make_features(seed) for seed in range(3)]
+    for frame in frames:
+        cache.call(trend_following_strategy, frame)
+    entry_size = cache.stats()["bytes"] // 3
+
+    # Touch the oldest entry so the second one becomes least recently used
+    cache.call(trend_following_strategy, frames[0])
+    cache.max_bytes = entry_size * 2 + entry_size // 2
+    cache.evict()
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
+    cache.call(trend_following_strategy, frames[1])  # Was evicted -> miss
+    assert cache.stats()["misses"] == 4
+
+
+def test_key_changes_when_any_module_of_the_package_changes(tmp_path, monkeypatch):
+    # 1. ARRANGE: a package whose function delegates to a sibling module
+    package = tmp_path / "cachepkg"
+    package.mkdir()
+    (package / "kernels.py").write_text("def scale(x):\n    return x * 2\n")
+    (package / "builder.py").write_text(
+        "from cachepkg.kernels import scale\n\ndef build(df):\n    return scale(df)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from cachepkg.builder import build
+
+    # 2. ACT
+    before = make_key(build, "data", {})
+    (package / "kernels.py").write_text("def scale(x):\n    return x * 3\n")
+    after = make_key(build, "data", {})
+
+    # 3. ASSERT
+    assert before != after
+    assert make_key(build, "data", {}) == after
+
+
+def _record_hits(root, n: int):
+    cache = ArtifactCache(root)
+    for _ in range(n):
+        cache._record(hits=1)
+
+
+def test_concurrent_processes_do_not_lose_statistics(tmp_path):
+    # 1. ACT: four processes, each with two threads, update the same statistics file
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_record_hits, [tmp_path] * 4, [50] * 4))
+    threads = [threading.Thread(target=_record_hits, args=(tmp_path, 50)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 2. ASSERT
+    assert ArtifactCache(tmp_path).stats()["hits"] == 300
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.bench.synthetic import make_synthetic_universe
+from alpha_platform.features.builder import build_features
+from alpha_platform.features.cross_sectional import (
+    cs_group_demean,
+    cs_percentile,
+    cs_rank,
+    cs_winsorize,
+    cs_zscore,
+)
+from alpha_platform.features.incremental import update_features
+from alpha_platform.features.streaming import build_features_streaming
+
+
+@pytest.fixture(scope="module")
+def raw_df() -> pd.DataFrame:
+    # Dropped rows give tickers different calendars, so rows and dates do not line up
+    return make_synthetic_universe(12, 160, missing_frac=0.1, seed=11)
+
+
+def test_kernels_match_pandas_row_operations():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 6, (80, 15)).astype(float)  # Small integers force ties
+    values[rng.random(values.shape) < 0.25] = np.nan
+    values[5] = np.nan  # A date with no eligible ticker
+    frame = pd.DataFrame(values)
+    groups = np.arange(15) % 3
+    groups[4] = -1
+
+    group_means = frame.T.groupby(groups).transform('mean').T
+    expected_group = (frame - group_means).to_numpy(copy=True)
+    expected_group[:, 4] = np.nan
+
+    np.testing.assert_allclose(cs_rank(values), frame.rank(axis=1))
+    np.testing.assert_allclose(cs_percentile(values), frame.rank(axis=1, pct=True))
+    np.testing.assert_allclose(
+        cs_zscore(values), frame.sub(frame.mean(axis=1), axis=0).div(frame.std(axis=1), axis=0)
+    )
+    np.testing.assert_allclose(
+        cs_winsorize(values, 0.1),
+        frame.clip(frame.quantile(0.1, axis=1), frame.quantile(0.9, axis=1), axis=0)
+    )
+    np.testing.assert_allclose(cs_group_demean(values, groups), expected_group)
+
+
+def test_operators_compare_tickers_on_the_same_date(raw_df):
+    """
+    With gappy calendars, each cross-section must be taken per date (not per row position),
+    and the result shifted to the ticker's next row like every other feature.
+    """
+    # 1. ARRANGE: the reference ranks the unshifted feature by date, then applies the T+1 shift
+    features = build_features(raw_df, ['return_5d', 'cs_pct_return_5d']).reset_index(drop=True)
+    raw_return = features.groupby('Ticker')['return_5d'].shift(-1)  # undo the T+1 shift
+    same_day = features[['Date', 'Ticker']].assign(value=raw_return)
+    ranked = same_day.pivot(index='Date', columns='Ticker', values='value').rank(axis=1, pct=True)
+    ranked_long = ranked.stack().rename('pct').reset_index()
+    expected = features[['Date', 'Ticker']].merge(ranked_long, on=['Date', 'Ticker'], how='left')
+    expected = expected.groupby('Ticker')['pct'].shift(1)
+
+    # 2. ASSERT
+    actual = features['cs_pct_return_5d']
+    assert actual.notna().sum() > 0.5 * len(actual)
+    np.testing.assert_allclose(actual[:-1].dropna(), expected[:-1][actual[:-1].notna()])
+
+
+def test_cross_sectional_features_do_not_leak_across_dates(raw_df):
+    """
+    Shocking one ticker's close on one date may only move the cross-sectional features of
+    the dates that see that close after the T+1 shift, never any earlier or unrelated date.
+    """
+    # 1. ARRANGE
+    requested = ['cs_rank_return_1d', 'cs_zscore_voladj_return_20d', 'cs_winsor_10_return_1d']
+    baseline = build_features(raw_df, requested).reset_index(drop=True)
+    shocked_raw = raw_df.copy()
+    dates = np.sort(raw_df['Date'].unique())
+    shock_date = dates[100]
+    target = (shocked_raw['Ticker'] == 'T00003') & (shocked_raw['Date'] == shock_date)
+    shocked_raw.loc[target, 'Close'] *= 1.5
+
+    # 2. ACT
+    shocked = build_features(shocked_raw, requested).reset_index(drop=True)
+
+    # 3. ASSERT: nothing up to and including the shock date changes...
+    before = baseline['Date'] <= shock_date
+    pd.testing.assert_frame_equal(shocked.loc[before, requested], baseline.loc[before, requested])
+    # ...and the 1-day return operators only move on the two dates whose returns use that close
+    rank = 'cs_rank_return_1d'
+    changed = ~np.isclose(shocked[rank], baseline[rank], equal_nan=True)
+    assert changed.any()
+    assert (baseline.loc[changed, 'Date'] <= dates[103]).all()
+
+
+def test_group_demean_needs_groups_and_sums_to_zero_per_group(raw_df):
+    tickers = sorted(raw_df['Ticker'].unique())
+    groups = {ticker: "a" if i % 2 else "b" for i, ticker in enumerate(tickers)}
+
+    with pytest.raises(ValueError):
+        build_features(raw_df, ['cs_group_demean_return_5d'])
+    features = build_features(raw_df, ['return_5d', 'cs_group_demean_return_5d'], groups=groups)
+
+    # Within each (date, group), the demeaned values (of same-date rows) sum to zero
+    same_day = features.assign(
+        raw=features.groupby('Ticker')['cs_group_demean_return_5d'].shift(-1),
+        group=features['Ticker'].map(groups),
+    ).dropna(subset=['raw'])
+    sums = same_day.groupby(['Date', 'group'])['raw'].sum()
+    np.testing.assert_allclose(sums, 0.0, atol=1e-12)
+
+
+def test_incremental_update_ranks_new_rows_against_the_full_universe(raw_df):
+    requested = ['return_5d', 'cs_rank_return_5d']
+    full = build_features(raw_df, requested).reset_index(drop=True)
+    cutoff = np.sort(raw_df['Date'].unique())[-10]
+    existing = build_features(raw_df[raw_df['Date'] < cutoff], requested).reset_index(drop=True)
+
+    updated = update_features(raw_df, existing, requested)
+
+    pd.testing.assert_frame_equal(updated, full, check_dtype=False)
+
+
+def test_streaming_refuses_cross_sectional_features(tmp_path):
+    with pytest.raises(ValueError):
+        build_features_streaming(tmp_path, tmp_path / "out.parquet", ['cs_rank_return_5d'])
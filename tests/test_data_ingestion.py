@@ -1,9 +1,15 @@
-import pandas as pd
+import logging
 from unittest.mock import patch
-from alpha_platform.data.ingestion import download_and_clean_data
 
+import pandas as pd
+import pytest
+
+from alpha_platform.data.ingestion import download_and_clean_data, fetch_with_retry, ingest_universe
+from alpha_platform.data.providers import DataProvider, LocalDirectoryProvider, YahooProvider
+from alpha_platform.data.store import dataset_root, load_raw_data, read_manifest
 
-@patch("alpha_platform.data.ingestion.yf.download")
+
+@patch("alpha_platform.data.providers.yf.download")
 def test_download_and_clean_data_success(mock_download):
     """
     Test that the ingestion pipeline correctly formats raw yfinance data,
@@ -34,4 +40,133 @@ def test_download_and_clean_data_success(mock_download):
     assert set(result["Ticker"].unique()) == {"SPY", "QQQ"}
 
     # Verify yfinance was called exactly twice (once per ticker)
-    assert mock_download.call_count == 2
\ No newline at end of file
+    assert mock_download.call_count == 2
+
+def test_local_directory_provider_feeds_ingestion(tmp_path):
+    """
+    Test that a local Parquet/CSV directory can replace Yahoo without any network access.
+    """
+    # 1. ARRANGE: One Parquet file and one CSV file in a vendor-style directory
+    dates = pd.date_range(start="2024-01-01", periods=5)
+    frame = pd.DataFrame({"Date": dates, "Close": [1.0, 2.0, None, 4.0, 5.0], "Volume": [10] * 5})
+    frame.to_parquet(tmp_path / "AAA.parquet", index=False)
+    frame.to_csv(tmp_path / "BBB.csv", index=False)
+
+    # 2. ACT: The end date is exclusive, like yfinance
+    provider = LocalDirectoryProvider(tmp_path)
+    result = download_and_clean_data(["AAA", "BBB", "MISSING"], "2024-01-02", "2024-01-05", provider=provider)
+
+    # 3. ASSERT
+    assert list(result["Ticker"].unique()) == ["AAA", "BBB"]  # Deterministic order, missing skipped
+    assert len(result) == 6
+    assert result["Close"].tolist() == [2.0, 2.0, 4.0, 2.0, 2.0, 4.0]  # Gap forward-filled
+
+
+def test_fetch_with_retry_recovers_from_transient_errors():
+    """
+    Test that a failing request is retried and that persistent failures yield an empty frame.
+    """
+    class FlakyProvider(DataProvider):
+        def __init__(self, failures):
+            self.failures = failures
+            self.calls = 0
+
+        def fetch(self, ticker, start_date, end_date):
+            self.calls += 1
+            if self.calls <= self.failures:
+                raise ConnectionError("transient")
+            return pd.DataFrame({"Close": [1.0]}, index=pd.DatetimeIndex(["2024-01-01"], name="Date"))
+
+    flaky = FlakyProvider(failures=2)
+    assert not fetch_with_retry(flaky, "AAA", "2024-01-01", "2024-01-02", retries=3, backoff=0).empty
+    assert flaky.calls == 3
+
+    broken = FlakyProvider(failures=10)
+    assert fetch_with_retry(broken, "AAA", "2024-01-01", "2024-01-02", retries=2, backoff=0).empty
+    assert broken.calls == 3
+
+    class BuggyProvider(FlakyProvider):
+        def fetch(self, ticker, start_date, end_date):
+            self.calls += 1
+            raise KeyError("Close")
+
+    buggy = BuggyProvider(failures=0)
+    with pytest.raises(KeyError):
+        fetch_with_retry(buggy, "AAA", "2024-01-01", "2024-01-02", retries=3, backoff=0)
+    assert buggy.calls == 1  # Not retried, not hidden
+
+
+def test_yahoo_failures_raise_so_they_are_retried():
+    """
+    Test that a download yfinance only logged as failed is retried, while "no data" is not.
+    """
+    # 1. ARRANGE: yf.download logs errors and returns an empty frame instead of raising
+    def failing_download(ticker, **kwargs):
+        logging.getLogger("yfinance").error(f"['{ticker}']: ConnectionError('Read timed out')")
+        return pd.DataFrame()
+
+    def delisted_download(ticker, **kwargs):
+        logging.getLogger("yfinance").error(
+            f"['{ticker}']: possibly delisted; no price data found (1d 2024-01-01 -> 2024-01-02)"
+        )
+        return pd.DataFrame()
+
+    provider = YahooProvider()
+
+    # 2. ACT / ASSERT
+    with patch("alpha_platform.data.providers.yf.download", side_effect=failing_download) as mock:
+        with pytest.raises(ConnectionError, match="Read timed out"):
+            provider.fetch("AAA", "2024-01-01", "2024-01-02")
+        assert fetch_with_retry(provider, "AAA", "2024-01-01", "2024-01-02", backoff=0).empty
+        assert mock.call_count == 1 + 4  # One direct call, then the first try plus 3 retries
+
+    with patch("alpha_platform.data.providers.yf.download", side_effect=delisted_download) as mock:
+        assert fetch_with_retry(provider, "AAA", "2024-01-01", "2024-01-02", backoff=0).empty
+        assert mock.call_count == 1
+
+
+def test_full_refresh_keeps_the_stored_data_when_downloads_fail(tmp_path, monkeypatch):
+    """
+    Test that a full refresh only replaces the raw dataset once its replacement downloaded,
+    and that tickers whose refresh failed keep their previous data.
+    """
+    # 1. ARRANGE: ingest two tickers from a local vendor directory
+    dates = pd.date_range(start="2024-01-01", periods=30, freq="B")
+    for ticker in ["AAA", "BBB"]:
+        frame = pd.DataFrame({"Date": dates, "Close": 10.0, "Volume": 100.0})
+        frame.to_parquet(tmp_path / f"{ticker}.parquet")
+    config = {
+        "tickers": ["AAA", "BBB"], "start_date": "2024-01-01", "end_date": "2024-03-01",
+        "output_dir": str(tmp_path / "raw"), "retries": 0,
+        "provider": {"type": "local", "path": str(tmp_path)},
+    }
+    ingest_universe(config)
+    root = dataset_root(tmp_path / "raw")
+    before = read_manifest(root)
+
+    def broken_fetch(self, ticker, start_date, end_date):
+        raise ConnectionError("network down")
+
+    # 2. ACT / ASSERT: every download fails -> nothing is touched
+    monkeypatch.setattr(LocalDirectoryProvider, "fetch", broken_fetch)
+    ingest_universe(config, full_refresh=True)
+    assert read_manifest(root) == before
+    assert len(load_raw_data(tmp_path / "raw")) == 60
+
+    # Only AAA fails -> BBB is refreshed, AAA keeps its previous rows
+    monkeypatch.undo()
+    revised = pd.DataFrame({"Date": dates, "Close": 20.0, "Volume": 100.0})
+    revised.to_parquet(tmp_path / "BBB.parquet")
+    original_fetch = LocalDirectoryProvider.fetch
+
+    def flaky_fetch(self, ticker, start_date, end_date):
+        if ticker == "AAA":
+            raise ConnectionError("network down")
+        return original_fetch(self, ticker, start_date, end_date)
+
+    monkeypatch.setattr(LocalDirectoryProvider, "fetch", flaky_fetch)
+    ingest_universe(config, full_refresh=True)
+    raw = load_raw_data(tmp_path / "raw")
+    assert raw.groupby("Ticker")["Close"].max().to_dict() == {"AAA": 10.0, "BBB": 20.0}
+    assert read_manifest(root) == before
+    assert not root.with_name(f"{root.name}.staging").exists()
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from alpha_platform.data.store import append_raw_data, read_manifest, read_raw_data
+
+
+def make_raw_frame(tickers: list[str], start: str, periods: int) -> pd.DataFrame:
+    dates = pd.bdate_range(start=start, periods=periods)
+    frames = [
+        pd.DataFrame({"Date": dates, "Close": np.arange(periods, dtype=float) + i, "Volume": 100.0, "Ticker": t})
+        for i, t in enumerate(tickers)
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_appending_a_tail_matches_a_single_full_write(tmp_path):
+    """
+    Test that history written in two increments is identical to writing it all at once,
+    and that the manifest tracks the last ingested date per ticker.
+    """
+    # 1. ARRANGE: 300 business days crossing a year boundary, split into history + tail
+    full = make_raw_frame(["AAA", "BBB"], "2023-06-01", 300)
+    cutoff = pd.Timestamp("2024-03-01")
+
+    # 2. ACT
+    append_raw_data(full[full["Date"] < cutoff], tmp_path / "incremental")
+    manifest = append_raw_data(full[full["Date"] >= cutoff], tmp_path / "incremental")
+    append_raw_data(full, tmp_path / "one_shot")
+
+    # 3. ASSERT
+    incremental = read_raw_data(tmp_path / "incremental")
+    one_shot = read_raw_data(tmp_path / "one_shot")
+    pd.testing.assert_frame_equal(incremental, one_shot)
+    assert len(incremental) == len(full)
+    assert manifest["AAA"]["last_date"] == str(full["Date"].max().date())
+    assert read_manifest(tmp_path / "incremental")["BBB"]["rows"] == 300
+
+
+def test_reappending_overlapping_rows_does_not_duplicate(tmp_path):
+    full = make_raw_frame(["AAA"], "2024-01-01", 20)
+    append_raw_data(full.iloc[:15], tmp_path)
+    append_raw_data(full.iloc[10:], tmp_path)
+
+    assert len(read_raw_data(tmp_path)) == 20
+
+
+def test_reader_loads_only_requested_slice(tmp_path):
+    append_raw_data(make_raw_frame(["AAA", "BBB", "CCC"], "2022-01-03", 600), tmp_path)
+
+    df = read_raw_data(tmp_path, tickers=["BBB"], start_date="2023-01-01", end_date="2023-01-31",
+                       columns=["Close"])
+
+    assert list(df.columns) == ["Date", "Close", "Ticker"]
+    assert set(df["Ticker"]) == {"BBB"}
+    assert df["Date"].min() >= pd.Timestamp("2023-01-01")
+    assert df["Date"].max() <= pd.Timestamp("2023-01-31")
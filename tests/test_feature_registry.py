@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.features.builder import build_features
+from alpha_platform.features.registry import plan_features
+
+
+def make_raw_frame(n_days: int = 120) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    dates = pd.bdate_range(start="2026-01-01", periods=n_days)
+    frames = []
+    for ticker in ["AAA", "BBB"]:
+        close = 30 * np.exp(np.cumsum(rng.normal(0, 0.01, n_days)))
+        frames.append(pd.DataFrame({"Date": dates, "Ticker": ticker, "Close": close}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_planner_shares_intermediates_and_tracks_lookback():
+    """
+    Shared intermediates (log prices, 1-day returns, SMAs) appear once in the DAG,
+    and the plan's lookback is the deepest window any requested feature needs.
+    """
+    plan = plan_features(["volatility_10d", "return_1d", "sma_ratio_5_50", "sma_ratio_5_20"])
+    names = [node.name for node in plan.order]
+
+    assert len(names) == len(set(names))
+    assert names.index("log_close") < names.index("return_1d") < names.index("volatility_10d")
+    assert names.count("sma_5") == 1
+    assert plan.consumers["return_1d"] == 1  # Read by volatility only; being an output is not a read
+    assert plan.lookback == 49  # The 50-day SMA reads 49 rows before the current one
+
+
+def test_only_requested_features_are_built_and_shifted():
+    """
+    Custom features are computed from the registry, in request order, with the T+1 shift applied.
+    """
+    raw_df = make_raw_frame()
+    features_df = build_features(raw_df, features=["sma_ratio_5_50", "return_3d"])
+
+    assert list(features_df.columns[-2:]) == ["sma_ratio_5_50", "return_3d"]
+    assert "volatility_20d" not in features_df.columns
+
+    a = features_df[features_df["Ticker"] == "AAA"].reset_index(drop=True)
+    close = a["Close"]
+    # The value on day T must come from closes up to T-1 only
+    assert np.isclose(a.loc[10, "return_3d"], np.log(close[9] / close[6]))
+    assert np.isclose(a.loc[60, "sma_ratio_5_50"], close[55:60].mean() / close[10:60].mean())
+    assert a["sma_ratio_5_50"].iloc[:50].isna().all()
+
+
+def test_unknown_feature_is_rejected():
+    with pytest.raises(ValueError):
+        plan_features(["not_a_feature"])
@@ -1,6 +1,10 @@
-import pandas as pd
 import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.bench.synthetic import make_synthetic_universe
 from alpha_platform.features.builder import build_features
+from alpha_platform.features.incremental import context_start_date, update_features
 
 
 def test_feature_shifting_prevents_leakage():
@@ -87,4 +91,78 @@ def test_cross_sectional_isolation():
     # Asset B went from 100 -> 50. The raw return is ln(0.5).
     # This return should appear on Day 3 for Asset B (if we had a Day 3).
     # But crucially, we must ensure Asset B's Day 2 feature isn't poisoned by Asset A's prices.
-    assert pd.isna(b_results.loc[1, 'return_1d']), "Cross-sectional leak! Asset A's data bled into Asset B."
\ No newline at end of file
+    assert pd.isna(b_results.loc[1, 'return_1d']), "Cross-sectional leak! Asset A's data bled into Asset B."
+
+def test_wide_engine_matches_groupby_reference():
+    """
+    Proves the vectorized matrix engine reproduces the per-ticker groupby implementation,
+    including tickers with different history lengths and missing prices.
+    """
+    rng = np.random.default_rng(42)
+    frames = []
+    for i, ticker in enumerate(["AAA", "BBB", "CCC"]):
+        n_days = 260 - 40 * i  # Unequal histories
+        dates = pd.bdate_range(start="2025-01-01", periods=n_days)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_days)))
+        close[rng.choice(n_days, size=3, replace=False)] = np.nan  # Sporadic missing prices
+        frames.append(pd.DataFrame({"Date": dates, "Ticker": ticker, "Close": close}))
+    raw_df = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=0)  # Unsorted input
+
+    reference = build_features(raw_df, engine="groupby")
+    fast = build_features(raw_df, engine="wide")
+
+    pd.testing.assert_frame_equal(fast, reference, check_exact=False, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.filterwarnings("ignore:divide by zero:RuntimeWarning")
+def test_a_non_finite_price_only_affects_the_windows_containing_it():
+    """
+    Proves a zero price (a +/-inf log return) does not wipe out a ticker's rolling features:
+    the wide engine recovers once the bad value leaves the window, like the groupby reference.
+    """
+    # 1. ARRANGE
+    raw_df = make_synthetic_universe(1, 300, seed=0)
+    raw_df.loc[50, 'Close'] = 0.0
+
+    # 2. ACT
+    reference = build_features(raw_df, engine="groupby")
+    fast = build_features(raw_df, engine="wide")
+
+    # 3. ASSERT
+    pd.testing.assert_frame_equal(fast, reference, check_exact=False, rtol=1e-9, atol=1e-12)
+    assert fast['volatility_20d'].notna().sum() == reference['volatility_20d'].notna().sum() > 200
+
+
+def test_incremental_update_matches_full_rebuild():
+    """
+    Proves that appending features for new raw rows reproduces a full rebuild,
+    including a ticker that first appears in the new data.
+    """
+    # 1. ARRANGE: 400 days of history for two tickers; a third ticker lists late
+    rng = np.random.default_rng(1)
+    frames = []
+    for ticker, n_days in [("AAA", 400), ("BBB", 400), ("CCC", 30)]:
+        dates = pd.bdate_range(end="2026-06-30", periods=n_days)
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.01, n_days)))
+        frames.append(pd.DataFrame({"Date": dates, "Ticker": ticker, "Close": close}))
+    raw_df = pd.concat(frames, ignore_index=True)
+
+    cutoff = pd.Timestamp("2026-06-01")
+    existing = build_features(raw_df[raw_df["Date"] < cutoff])
+
+    # 2. ACT: Only pass a recent slice of raw data (enough context, not the whole history)
+    recent_raw = raw_df[raw_df["Date"] >= context_start_date(existing)]
+    updated = update_features(recent_raw, existing)
+
+    # 3. ASSERT
+    full = build_features(raw_df).reset_index(drop=True)
+    pd.testing.assert_frame_equal(updated, full, check_exact=True)
+
+
+def test_incremental_update_rejects_truncated_context():
+    dates = pd.bdate_range(start="2026-01-01", periods=300)
+    raw_df = pd.DataFrame({"Date": dates, "Ticker": "AAA", "Close": np.linspace(10, 20, 300)})
+    existing = build_features(raw_df.iloc[:250])
+
+    with pytest.raises(ValueError):
+        update_features(raw_df.iloc[200:], existing)
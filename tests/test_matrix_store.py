@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.backtest.engine import run_iterative_backtest, run_wide_backtest
+from alpha_platform.data.matrix_store import MatrixStore, write_matrix_store
+from alpha_platform.signals.baselines import STRATEGIES, STRATEGY_FEATURES, WIDE_STRATEGIES
+
+
+def make_feature_frame(n_days: int = 40, seed: int = 5) -> pd.DataFrame:
+    """
+    Builds a long-format features frame where one ticker starts late (missing Date x Ticker cells).
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2026-01-01", periods=n_days, freq="B")
+    frames = []
+    for i, ticker in enumerate(["CCC", "AAA", "BBB"]):
+        close = 30 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+        sma_ratio = rng.normal(1.0, 0.05, n_days)
+        sma_ratio[:3] = np.nan
+        frame = pd.DataFrame({"Date": dates, "Ticker": ticker, "Close": close, "sma_ratio_20_200": sma_ratio})
+        frames.append(frame.iloc[5 * i:])
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_matrix_store_round_trip_matches_pivot(tmp_path):
+    """
+    Every stored matrix must equal the pivot of the long frame, exactly, and be memory-mapped.
+    """
+    # 1. ARRANGE
+    df = make_feature_frame()
+
+    # 2. ACT
+    store = MatrixStore(write_matrix_store(df, tmp_path / "matrices"))
+
+    # 3. ASSERT
+    assert store.columns == ["Close", "sma_ratio_20_200"]
+    assert isinstance(store.array("Close"), np.memmap)
+    for col in store.columns:
+        expected = df.pivot(index='Date', columns='Ticker', values=col)
+        pd.testing.assert_frame_equal(store.frame(col), expected, check_exact=True, check_freq=False)
+
+
+def test_matrix_store_from_parquet_matches_in_memory_build(tmp_path):
+    """
+    Building from the Parquet file (column by column) gives the same store as the in-memory frame.
+    """
+    # 1. ARRANGE
+    df = make_feature_frame()
+    parquet_path = tmp_path / "features.parquet"
+    df.to_parquet(parquet_path, index=False)
+
+    # 2. ACT
+    from_frame = MatrixStore(write_matrix_store(df, tmp_path / "a", source_path=parquet_path))
+    from_file = MatrixStore(write_matrix_store(parquet_path, tmp_path / "b"))
+
+    # 3. ASSERT
+    for col in from_frame.columns:
+        np.testing.assert_array_equal(from_file.array(col), from_frame.array(col))
+    assert from_file.is_current(parquet_path)
+
+    # Rewriting the features makes the store stale
+    df.iloc[:10].to_parquet(parquet_path, index=False)
+    assert not from_file.is_current(parquet_path)
+
+
+def test_float32_store_halves_the_footprint(tmp_path):
+    df = make_feature_frame()
+    full = MatrixStore(write_matrix_store(df, tmp_path / "f64"))
+    half = MatrixStore(write_matrix_store(df, tmp_path / "f32", dtype="float32"))
+
+    assert half.array("Close").nbytes * 2 == full.array("Close").nbytes
+    np.testing.assert_allclose(half.array("Close"), full.array("Close"), rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        write_matrix_store(df, tmp_path / "f16", dtype="float16")
+
+
+def test_backtest_from_matrix_store_equals_parquet_path(tmp_path):
+    """
+    Signals and the engine run on the memory-mapped matrices must reproduce the long path exactly.
+    """
+    # 1. ARRANGE
+    df = make_feature_frame()
+    store = MatrixStore(write_matrix_store(df, tmp_path / "matrices"))
+
+    for strategy in STRATEGIES:
+        # 2. ACT
+        weights = WIDE_STRATEGIES[strategy](store.features(STRATEGY_FEATURES[strategy]))
+        from_store = run_wide_backtest(store.frame("Close").ffill(), weights, cost_bps=5.0)
+        expected = run_iterative_backtest(STRATEGIES[strategy](df), cost_bps=5.0)
+
+        # 3. ASSERT
+        pd.testing.assert_frame_equal(from_store, expected, check_exact=True, check_freq=False)
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.backtest.engine import run_wide_backtest
+from alpha_platform.backtest.metrics import (
+    load_panel,
+    panel_from_frames,
+    panel_from_long,
+    summarize,
+)
+from alpha_platform.backtest.sweep import run_sweep
+from alpha_platform.bench.synthetic import make_synthetic_universe
+from alpha_platform.features.builder import build_features
+
+
+def make_results(equity: list[float], initial_capital: float = 100.0) -> pd.DataFrame:
+    dates = pd.bdate_range("2026-01-01", periods=len(equity), name="Date")
+    equity = pd.Series(equity, index=dates, dtype=float)
+    return pd.DataFrame({
+        'equity': equity,
+        'turnover': 0.0,
+        'net_ret': equity.pct_change().fillna(0.0),
+        'cumulative_net': equity / initial_capital,
+    })
+
+
+def test_drawdown_and_underwater_duration():
+    panel = panel_from_frames({'a': make_results([100, 110, 99, 104.5, 121, 120])})
+
+    np.testing.assert_allclose(panel.drawdown['a'], [0, 0, -0.1, -0.05, 0, -1 / 121])
+    np.testing.assert_array_equal(panel.underwater_days['a'], [0, 0, 1, 2, 0, 1])
+    summary = summarize(panel).loc['a']
+    assert summary['max_drawdown'] == pytest.approx(-0.1)
+    assert summary['max_underwater_days'] == 2
+    assert summary['total_return'] == pytest.approx(0.2)
+
+
+def test_cost_attribution_recovers_the_engine_costs():
+    """
+    Gross returns (net + costs) must add back exactly what the engine charged.
+    """
+    # 1. ARRANGE: two assets, weights flipping every day so every day trades
+    dates = pd.bdate_range("2026-01-01", periods=30, name="Date")
+    rng = np.random.default_rng(0)
+    prices = pd.DataFrame(
+        50 * np.exp(np.cumsum(rng.normal(0, 0.01, (30, 2)), axis=0)), dates, ['A', 'B']
+    )
+    flip = np.arange(30) % 2
+    weights = pd.DataFrame({'A': 0.3 + 0.4 * flip, 'B': 0.7 - 0.4 * flip}, index=dates)
+
+    # 2. ACT
+    results = run_wide_backtest(prices, weights, cost_bps=25.0)
+    panel = panel_from_frames({'run': results}, cost_bps=25.0)
+
+    # 3. ASSERT: day one trades the whole initial capital, so it costs 25 bps of it
+    assert panel.costs['run'].iloc[0] == pytest.approx(100_000.0 * 0.0025)
+    frictionless = prices.iloc[0] @ (weights.iloc[0] * 100_000.0 / prices.iloc[0])
+    assert results['equity'].iloc[0] + panel.costs['run'].iloc[0] == pytest.approx(frictionless)
+    np.testing.assert_allclose(
+        panel.gross_returns['run'] - panel.returns['run'], panel.cost_returns['run']
+    )
+    assert summarize(panel).loc['run', 'gross_sharpe'] > summarize(panel).loc['run', 'sharpe']
+
+
+def test_sweep_panel_matches_per_run_summaries(tmp_path):
+    """
+    The vectorized summary over a whole sweep must equal summarizing each run on its own.
+    """
+    # 1. ARRANGE
+    df = build_features(make_synthetic_universe(6, 260, seed=5), ['sma_ratio_20_200'])
+    sweep = run_sweep(df, ["equal_weight", "trend"], [0.0, 10.0], [10_000.0, 1_000_000.0])
+    sweep.to_parquet(tmp_path / "sweep_results.parquet", index=False)
+
+    # 2. ACT
+    panel = load_panel([tmp_path / "sweep_results.parquet"])
+    summary = summarize(panel, benchmark="sweep#0")
+
+    # 3. ASSERT
+    assert list(summary.index) == [f"sweep#{i}" for i in range(8)]
+    for scenario_id, run in sweep.groupby('scenario_id'):
+        single = panel_from_frames(
+            {'x': run.set_index('Date')}, cost_bps=run['cost_bps'].iloc[0]
+        )
+        expected = summarize(single).loc['x']
+        row = summary.loc[f"sweep#{scenario_id}"]
+        for column in ['total_return', 'sharpe', 'max_drawdown', 'total_costs', 'cost_drag']:
+            assert row[column] == pytest.approx(expected[column], abs=1e-12)
+    assert summary.loc['sweep#0', 'beta'] == pytest.approx(1.0)
+    assert summary.loc['sweep#0', 'tracking_error'] == pytest.approx(0.0)
+
+
+def test_runs_over_different_windows_share_one_panel():
+    full = make_results([100, 101, 102, 103, 104, 105])
+    grid = pd.concat([
+        make_results([100, 99, 98]).assign(run_id=0),
+        make_results([100, 101, 102]).set_axis(full.index[3:]).assign(run_id=1),
+    ]).rename_axis('Date').reset_index()
+
+    panel = panel_from_long(grid, prefix="grid#")
+    summary = summarize(panel)
+
+    assert summary['days'].tolist() == [3, 3]
+    assert summary.loc['grid#1', 'total_return'] == pytest.approx(0.02)
+    assert panel.equity['grid#1'].isna().sum() == 3
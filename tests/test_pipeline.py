@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from alpha_platform.bench.synthetic import make_synthetic_universe
+from alpha_platform.data.store import read_manifest
+from alpha_platform.pipeline import build_plan, run_pipeline, stamp_path
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch) -> dict:
+    """A pipeline over a local vendor directory (no network), run from inside tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    raw = make_synthetic_universe(4, 400, seed=2)
+    (tmp_path / "vendor").mkdir()
+    for ticker, frame in raw.groupby('Ticker'):
+        frame.drop(columns='Ticker').to_parquet(tmp_path / "vendor" / f"{ticker}.parquet")
+
+    return {
+        'universe': {
+            'tickers': sorted(raw['Ticker'].unique()),
+            'start_date': "2015-01-01",
+            'end_date': "2017-01-01",
+            'provider': {'type': 'local', 'path': "vendor"},
+        },
+        'features': {'features': ['return_1d', 'sma_ratio_20_200']},
+        'backtests': {'equal_weight': {'costs': 5}, 'trend': {'costs': 5}},
+        'report': {'benchmark': 'equal_weight'},
+    }
+
+
+def test_rerun_skips_everything_and_a_config_change_reruns_only_its_branch(config):
+    # 1. ARRANGE / ACT: a first run, an identical rerun, then a change to one backtest
+    first = run_pipeline(build_plan(config))
+    trend = pd.read_parquet("data/reports/backtest_results_trend.parquet")
+    second = run_pipeline(build_plan(config))
+    config['backtests']['trend']['costs'] = 20
+    third = run_pipeline(build_plan(config))
+
+    # 2. ASSERT
+    assert set(first.values()) == {'ran'}
+    assert set(second.values()) == {'skipped'}
+    assert third == {
+        'download': 'skipped', 'features': 'skipped', 'backtest.equal_weight': 'skipped',
+        'backtest.trend': 'ran', 'report': 'ran',
+    }
+    rerun = pd.read_parquet("data/reports/backtest_results_trend.parquet")
+    assert rerun['equity'].iloc[-1] < trend['equity'].iloc[-1]  # Higher costs
+    summary = pd.read_parquet("data/reports/report_summary.parquet").set_index('run')
+    assert summary.loc['trend', 'cost_bps'] == 20
+
+
+def test_upstream_changes_and_touched_artifacts_invalidate_downstream(config):
+    run_pipeline(build_plan(config))
+
+    # A new feature changes the features fingerprint, so every backtest and the report rerun
+    config['features']['features'].append('volatility_20d')
+    status = run_pipeline(build_plan(config))
+    assert status.pop('download') == 'skipped'
+    assert set(status.values()) == {'ran'}
+    assert run_pipeline(build_plan(config), dry_run=True)['backtest.trend'] == 'skipped'
+
+    # An artifact overwritten outside the pipeline no longer matches its stamp
+    pd.DataFrame({'x': [1]}).to_parquet("data/reports/backtest_results_trend.parquet")
+    status = run_pipeline(build_plan(config), dry_run=True)
+    assert status['backtest.trend'] == 'stale' and status['features'] == 'skipped'
+    assert stamp_path(build_plan(config)[1].outputs[0]).exists()
+
+
+def test_a_refresh_that_fetched_nothing_new_skips_everything_downstream(config):
+    # 1. ARRANGE: a first run, then the next day's plan (the download is keyed on the date)
+    run_pipeline(build_plan(config))
+    plan = build_plan(config)
+    plan[0].params['as_of'] = "2099-01-01"
+
+    # 2. ACT
+    status = run_pipeline(plan)
+
+    # 3. ASSERT: the data is unchanged, so only the download reran
+    assert status.pop('download') == 'ran'
+    assert set(status.values()) == {'skipped'}
+
+
+def test_a_rewritten_raw_partition_reruns_features_even_with_the_same_manifest(config):
+    # 1. ARRANGE: revise one partition's prices in place; dates and row counts are unchanged
+    run_pipeline(build_plan(config))
+    manifest = read_manifest("data/raw/universe_daily")
+    partition = min(Path("data/raw/universe_daily").glob("Ticker=*/year=*/data.parquet"))
+    revised = pd.read_parquet(partition)
+    revised['Close'] *= 1.01
+    revised.to_parquet(partition, index=False)
+
+    # 2. ACT
+    status = run_pipeline(build_plan(config))
+
+    # 3. ASSERT
+    assert read_manifest("data/raw/universe_daily") == manifest
+    status.pop('download')  # Reruns too: its output was touched, but it fetches nothing new
+    assert set(status.values()) == {'ran'}
+
+
+def test_invalid_plans_fail_before_anything_runs(config):
+    with pytest.raises(ValueError):
+        build_plan({**config, 'backtests': {'x': {'strategy': 'unknown'}}})
+    with pytest.raises(ValueError):
+        build_plan({**config, 'backtests': {'trend': {'max_weight': -1}}})
+    with pytest.raises(ValueError):
+        build_plan({**config, 'features': {'features': ['return_1d']}})  # Strategies need SMAs
+    with pytest.raises(ValueError):
+        build_plan({**config, 'report': {'benchmark': 'missing'}})
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.portfolio.construction import (
+    PortfolioPolicy,
+    construct_portfolio,
+    project_weights,
+)
+from alpha_platform.portfolio.risk import covariance_at, predicted_variance
+
+
+def make_market(n_days: int = 400, n_assets: int = 6, seed: int = 3):
+    """Prices with different volatilities per asset and random long/short raw weights."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=n_days, name="Date")
+    tickers = [f"T{i}" for i in range(n_assets)]
+    vols = np.linspace(0.005, 0.03, n_assets)
+    returns = rng.normal(0.0002, vols, (n_days, n_assets))
+    prices = pd.DataFrame(100 * np.cumprod(1 + returns, axis=0), index=dates, columns=tickers)
+    weights = pd.DataFrame(rng.normal(0, 0.3, (n_days, n_assets)), index=dates, columns=tickers)
+    return prices, weights
+
+
+@pytest.mark.parametrize("method", ["rolling", "ewma"])
+def test_incremental_covariance_matches_a_full_re_estimate(method):
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0, 0.01, (230, 7))
+    weights = rng.normal(0, 0.3, (230, 7))
+
+    # Small blocks so the window rolls across several block boundaries
+    variance = predicted_variance(
+        weights, returns, method=method, window=40, halflife=10.0, min_periods=5, block_size=16
+    )
+
+    expected = [
+        weights[t] @ covariance_at(returns, t, method, 40, 10.0) @ weights[t] for t in range(5, 230)
+    ]
+    assert np.isnan(variance[:5]).all()
+    np.testing.assert_allclose(variance[5:], expected, rtol=1e-9)
+
+
+def test_prediction_for_a_day_never_uses_that_days_return():
+    rng = np.random.default_rng(1)
+    returns = rng.normal(0, 0.01, (120, 4))
+    weights = np.full((120, 4), 0.25)
+    shocked = returns.copy()
+    shocked[80] *= 50
+
+    baseline = predicted_variance(weights, returns, window=30)
+    moved = predicted_variance(weights, shocked, window=30)
+
+    np.testing.assert_array_equal(moved[:81], baseline[:81])
+    assert moved[81] > 10 * baseline[81]
+
+
+def test_projection_respects_caps_and_is_a_no_op_inside_the_limits():
+    rng = np.random.default_rng(2)
+    weights = rng.normal(0, 0.4, (500, 20))
+    inside = weights / np.abs(weights).sum(axis=1, keepdims=True) * 0.5
+
+    projected = project_weights(weights, max_weight=0.1, max_gross=1.0)
+
+    assert np.abs(projected).max() <= 0.1 + 1e-12
+    np.testing.assert_allclose(np.abs(projected).sum(axis=1), 1.0)
+    assert (np.sign(projected) * np.sign(weights) >= 0).all()  # No sign flips
+    np.testing.assert_allclose(project_weights(inside, max_weight=0.5, max_gross=1.0), inside)
+
+
+def test_vol_target_scales_weights_and_limits_hold():
+    """
+    Vol-targeted weights must have the target predicted volatility after the warm-up
+    (when no cap binds), and the exposure limits must hold on every day.
+    """
+    # 1. ARRANGE
+    prices, raw = make_market()
+    free = PortfolioPolicy(target_vol=0.15, max_leverage=100.0, cov_window=60)
+    capped = PortfolioPolicy(target_vol=0.15, max_leverage=3.0, max_weight=0.2, max_gross=1.0)
+
+    # 2. ACT
+    weights, diagnostics = construct_portfolio(raw, prices, free)
+    capped_weights, _ = construct_portfolio(raw, prices, capped)
+
+    # 3. ASSERT
+    warm = diagnostics['predicted_vol'].notna().to_numpy()
+    assert not warm[:free.min_periods].any() and warm[free.min_periods:].all()
+    np.testing.assert_allclose(weights[~warm], raw[~warm])  # Unscaled during the warm-up
+    rescaled = diagnostics['predicted_vol'] * diagnostics['scale']
+    np.testing.assert_allclose(rescaled[warm], 0.15)
+    assert np.abs(capped_weights.to_numpy()).max() <= 0.2 + 1e-12
+    assert capped_weights.abs().sum(axis=1).max() <= 1.0 + 1e-9
+
+
+def test_invalid_portfolio_policies_raise():
+    with pytest.raises(ValueError):
+        PortfolioPolicy(target_vol=-0.1)
+    with pytest.raises(ValueError):
+        PortfolioPolicy(cov_method="garch")
+    with pytest.raises(ValueError):
+        PortfolioPolicy(max_weight=0.0)
+    assert not PortfolioPolicy().is_active
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from alpha_platform import profiling
+from alpha_platform.profiling import Profiler, span
+
+
+def test_span_is_a_no_op_without_an_active_profiler():
+    with span("anything") as first, span("else") as second:
+        pass
+    assert first is second  # The shared null span: nothing is allocated or recorded
+
+
+def test_profiler_records_nested_spans_and_exports_a_chrome_trace():
+    """
+    Nested spans are recorded with their depth, summarized per name and exported as 'X' events.
+    """
+    # 1. ARRANGE & ACT
+    with Profiler(trace_memory=True) as profiler, span("stage.outer"):
+        for i in range(3):
+            with span("stage.inner", step=i):
+                buffer = bytearray(2 * 1024 ** 2)
+                del buffer
+
+    # 2. ASSERT
+    assert profiling._ACTIVE is None
+    summary = profiler.summary().set_index('name')
+    assert summary.loc['stage.outer', 'calls'] == 1
+    assert summary.loc['stage.inner', 'calls'] == 3
+    assert summary.loc['stage.outer', 'pct_wall'] == pytest.approx(100.0)
+    assert summary.loc['stage.inner', 'peak_mb'] >= 2.0
+    assert summary.loc['stage.outer', 'peak_mb'] >= summary.loc['stage.inner', 'peak_mb']
+
+    events = profiler.to_chrome_trace()['traceEvents']
+    assert [event['name'] for event in events] == ['stage.outer'] + ['stage.inner'] * 3
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+    assert events[2]['args']['step'] == 1
+
+
+def test_only_one_profiler_can_be_active():
+    with Profiler(), pytest.raises(RuntimeError), Profiler():
+        pass
+
+
+def test_memory_is_only_attributed_on_the_profiling_thread():
+    # A worker's span cannot own the process-wide tracemalloc peak, so it reports none
+    def work():
+        with span("worker"):
+            buffer = bytearray(2 * 1024 ** 2)
+            del buffer
+
+    with Profiler(trace_memory=True) as profiler, span("main"):
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+    peaks = {record.name: record.peak_mb for record in profiler.records}
+    assert peaks['worker'] is None
+    assert peaks['main'] >= 2.0  # Includes the worker's allocations
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.backtest.engine import run_wide_backtest
+from alpha_platform.backtest.rebalance import RebalancePolicy, rebalance_report, rebalance_schedule
+
+
+def make_matrices(n_days: int = 120, n_assets: int = 5, seed: int = 2):
+    """
+    Random-walk prices and slowly changing equal weights on a subset of assets.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2026-01-01", periods=n_days, name="Date")
+    tickers = pd.Index([f"T{i}" for i in range(n_assets)], name="Ticker")
+    prices = pd.DataFrame(
+        20 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_days, n_assets)), axis=0)), dates, tickers
+    )
+    held = pd.DataFrame(rng.random((n_days, n_assets)) > 0.3, dates, tickers)
+    held = held.rolling(10, min_periods=1).max().astype(bool)  # membership changes slowly
+    weights = held.div(held.sum(axis=1), axis=0).fillna(0.0)
+    return prices, weights
+
+
+def test_zero_band_daily_policy_matches_the_reference_loop():
+    prices, weights = make_matrices()
+
+    reference = run_wide_backtest(prices, weights, cost_bps=10.0)
+    banded = run_wide_backtest(prices, weights, cost_bps=10.0, rebalance=RebalancePolicy())
+
+    np.testing.assert_allclose(banded['equity'], reference['equity'], rtol=1e-12)
+    np.testing.assert_allclose(banded['turnover'], reference['turnover'], rtol=1e-9, atol=1e-15)
+
+
+def test_monthly_rebalancing_only_trades_on_schedule_and_marks_drift_to_market():
+    """
+    Off-schedule days must not trade, and their equity must be cash + held shares at market.
+    """
+    # 1. ARRANGE
+    prices, weights = make_matrices()
+    schedule = rebalance_schedule(prices.index, "monthly")
+
+    # 2. ACT
+    policy = RebalancePolicy(frequency="monthly")
+    results = run_wide_backtest(prices, weights, cost_bps=0.0, rebalance=policy)
+
+    # 3. ASSERT
+    assert schedule.sum() == prices.index.to_period("M").nunique()
+    assert not results['rebalanced'].to_numpy()[~schedule].any()
+    assert (results['turnover'].to_numpy()[~schedule] == 0).all()
+
+    # Until the second rebalance, equity is the day-one holdings valued at each day's prices
+    second = np.flatnonzero(schedule)[1]
+    start_prices = prices.iloc[0].to_numpy()
+    shares = weights.iloc[0].to_numpy() * 100_000.0 / start_prices
+    cash = 100_000.0 - shares @ start_prices
+    expected = cash + prices.iloc[:second].to_numpy() @ shares
+    np.testing.assert_allclose(results['equity'].iloc[:second], expected, rtol=1e-12)
+
+
+def test_bands_cut_turnover_but_still_open_small_positions():
+    # 1. ARRANGE: a band wider than every individual target weight
+    prices, weights = make_matrices(n_assets=8)
+    policy = RebalancePolicy(band=0.5)
+
+    # 2. ACT
+    reference = run_wide_backtest(prices, weights)
+    banded = run_wide_backtest(prices, weights, rebalance=policy)
+    report = rebalance_report(banded, reference)
+
+    # 3. ASSERT
+    assert 0 < report['turnover_saved'] < 1
+    assert report['rebalance_days'] < report['total_days']
+    # Every asset that ever gets a target weight is opened despite the wide band
+    assert banded['rebalanced'].iloc[0]
+    assert banded['turnover'].iloc[0] == pytest.approx(reference['turnover'].iloc[0])
+
+
+def test_invalid_policies_are_rejected():
+    prices, weights = make_matrices(n_days=10)
+    with pytest.raises(ValueError):
+        RebalancePolicy(band=-0.1)
+    with pytest.raises(ValueError):
+        RebalancePolicy(frequency="hourly")
+    with pytest.raises(ValueError):
+        run_wide_backtest(prices, weights, engine="pandas", rebalance=RebalancePolicy(band=0.1))
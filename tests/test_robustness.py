@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_platform.backtest.robustness import (
+    bootstrap,
+    path_metrics,
+    permutation_test,
+    portfolio_returns,
+    resample_indices,
+)
+
+
+def make_returns(n_days: int = 750, edge: float = 0.0, seed: int = 1) -> pd.DataFrame:
+    """
+    Daily returns of a baseline and of a strategy earning the baseline plus noise plus `edge`.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=n_days, name="Date")
+    baseline = rng.normal(0.0003, 0.01, n_days)
+    strategy = baseline + rng.normal(edge, 0.004, n_days)
+    return pd.DataFrame({'equal_weight': baseline, 'trend': strategy}, index=dates)
+
+
+def test_resampled_paths_are_made_of_wrapped_blocks():
+    rng = np.random.default_rng(0)
+
+    fixed = resample_indices(100, 50, 10, "block", rng)
+    stationary = resample_indices(1000, 200, 20, "stationary", rng)
+
+    # Fixed blocks: every 10th day starts a new block, the others continue the previous day
+    continues = fixed[:, 1:] == (fixed[:, :-1] + 1) % 100
+    assert continues[:, np.arange(1, 100) % 10 != 0].all()
+    # Stationary blocks: geometric lengths averaging the requested block length
+    breaks = (stationary[:, 1:] != (stationary[:, :-1] + 1) % 1000).mean()
+    assert 1 / breaks == pytest.approx(20, rel=0.1)
+    assert stationary.min() >= 0 and stationary.max() < 1000
+
+
+def test_bootstrap_is_reproducible_for_any_chunking():
+    returns = make_returns(n_days=200)
+
+    small = bootstrap(returns, n_samples=250, seed=7, chunk_size=100)
+    large = bootstrap(returns, n_samples=250, seed=7, chunk_size=10_000)
+    other = bootstrap(returns, n_samples=250, seed=8)
+
+    pd.testing.assert_frame_equal(small.samples, large.samples)
+    assert len(small.samples) == 250 * 2
+    assert not np.allclose(small.samples['sharpe'], other.samples['sharpe'])
+
+
+def test_path_metrics_match_a_direct_computation():
+    returns = make_returns(n_days=300)['trend']
+
+    metrics = path_metrics(returns.to_numpy()[:, None])
+
+    wealth = (1 + returns).cumprod()
+    assert metrics['sharpe'][0] == pytest.approx(returns.mean() / returns.std() * np.sqrt(252))
+    assert metrics['max_drawdown'][0] == pytest.approx(
+        min((wealth / wealth.cummax().clip(lower=1.0) - 1).min(), 0.0)
+    )
+    assert metrics['annualized_return'][0] == pytest.approx(wealth.iloc[-1] ** (252 / 300) - 1)
+
+
+def test_p_values_separate_a_real_edge_from_noise():
+    """
+    A strategy with a large daily edge over the baseline must be significant in both tests;
+    a copy of the baseline must not.
+    """
+    # 1. ARRANGE
+    returns = make_returns(edge=0.001)
+    returns['copy'] = returns['equal_weight']
+
+    # 2. ACT
+    result = bootstrap(returns, n_samples=1000, seed=0)
+    comparison = result.compare('equal_weight').set_index(['strategy', 'metric'])['p_value']
+    permuted = permutation_test(returns, 'equal_weight', n_permutations=1000).set_index('strategy')
+
+    # 3. ASSERT
+    assert comparison[('trend', 'sharpe')] < 0.01
+    assert permuted.loc['trend', 'p_value'] < 0.01
+    assert comparison[('copy', 'sharpe')] > 0.5
+    assert permuted.loc['copy', 'p_value'] > 0.5
+
+    intervals = result.intervals(0.9).set_index(['strategy', 'metric'])
+    sharpe = intervals.loc[('trend', 'sharpe')]
+    assert sharpe['lower'] < sharpe['observed'] < sharpe['upper']
+
+
+def test_portfolio_returns_use_the_previous_days_weights():
+    dates = pd.bdate_range("2026-01-01", periods=3)
+    asset_returns = pd.DataFrame({'A': [0.0, 0.10, -0.05], 'B': [0.0, 0.02, 0.04]}, index=dates)
+    weights = pd.DataFrame({'A': [1.0, 0.5, 0.5], 'B': [0.0, 0.5, 0.5]}, index=dates)
+
+    net = portfolio_returns(asset_returns, weights, cost_bps=10.0)
+
+    np.testing.assert_allclose(net, [-0.001, 0.10 - 0.001, -0.025 + 0.02])
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from alpha_platform.backtest.engine import prepare_wide_matrices, run_wide_backtest
+from alpha_platform.backtest.scheduler import RunSpec, rolling_windows, run_specs
+from alpha_platform.signals.baselines import STRATEGIES
+
+
+def make_feature_frame(n_days: int = 90, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2026-01-01", periods=n_days, freq="B")
+    frames = []
+    for ticker in ["AAA", "BBB", "CCC"]:
+        close = 20 * np.exp(np.cumsum(rng.normal(0, 0.015, n_days)))
+        sma_ratio = rng.normal(1.0, 0.05, n_days)
+        frames.append(pd.DataFrame(
+            {"Date": dates, "Ticker": ticker, "Close": close, "sma_ratio_20_200": sma_ratio}
+        ))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_process_pool_matches_serial_backtests_in_spec_order():
+    """
+    Runs fanned out over worker processes must equal serial runs and come back in spec order.
+    """
+    # 1. ARRANGE: walk-forward windows x strategies x costs
+    df = make_feature_frame()
+    dates = pd.DatetimeIndex(sorted(df['Date'].unique()))
+    windows = rolling_windows(dates, window_days=30, step_days=30)
+    specs = [
+        RunSpec(strategy=name, cost_bps=cost, start_date=start, end_date=end)
+        for name in ["trend", "equal_weight"]
+        for cost in [2.0, 10.0]
+        for start, end in windows
+    ]
+
+    # 2. ACT
+    results = run_specs(df, specs, workers=2)
+
+    # 3. ASSERT
+    assert list(results['run_id'].unique()) == list(range(len(specs)))
+    for run_id, spec in enumerate(specs):
+        prices, weights = prepare_wide_matrices(STRATEGIES[spec.strategy](df))
+        window = slice(spec.start_date, spec.end_date)
+        expected = run_wide_backtest(
+            prices.loc[window], weights.loc[window], spec.initial_capital, spec.cost_bps
+        )
+        actual = results[results['run_id'] == run_id].set_index('Date')[expected.columns]
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True, check_names=False)
+
+
+def test_rolling_windows_cover_calendar_without_overlap():
+    dates = pd.date_range(start="2026-01-01", periods=10, freq="B")
+    windows = rolling_windows(dates, window_days=4)
+
+    assert windows == [
+        (str(dates[0].date()), str(dates[3].date())),
+        (str(dates[4].date()), str(dates[7].date())),
+    ]
@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from alpha_platform.bench.synthetic import make_synthetic_universe
+from alpha_platform.client import request
+from alpha_platform.features.builder import build_features
+from alpha_platform.server import ResearchServer, ResearchSession
+
+
+@pytest.fixture
+def server(tmp_path):
+    """A research server on a free port over a small synthetic features file."""
+    features_path = tmp_path / "features.parquet"
+    build_features(make_synthetic_universe(4, 400, seed=3)).to_parquet(features_path)
+    session = ResearchSession(features_path, reports_dir=tmp_path / "reports")
+    server = ResearchServer(session, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_the_resident_matrices(server):
+    # 1. ACT
+    before = request(server.url, 'health')
+    backtest = request(server.url, 'backtest', {'strategy': 'trend', 'costs': 5, 'band': 0.02})
+    sweep = request(server.url, 'sweep', {'costs': [0, 10]})
+    report = request(server.url, 'report', {'top': 3})
+    after = request(server.url, 'health')
+
+    # 2. ASSERT
+    assert not before['loaded'] and after['loaded']
+    assert after['requests'] == 3 and after['tickers'] == 4
+    assert backtest['days'] == after['dates']
+    assert 'rebalance' in backtest and backtest['saved'].endswith("backtest_results_trend.parquet")
+    assert sweep['scenarios'] == 4
+    assert report['runs'] == 5  # The backtest plus the four sweep scenarios
+
+
+def test_bad_requests_are_reported_and_the_server_keeps_serving(server):
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        request(server.url, 'backtest', {'strategy': 'nope'})
+    with pytest.raises(ValueError, match="No results found"):
+        request(server.url, 'report', {})
+    with pytest.raises(ValueError, match="Unknown command"):
+        request(server.url, 'train', {})
+    assert request(server.url, 'health')['status'] == 'ok'
+
+    with pytest.raises(ConnectionError):
+        request("http://127.0.0.1:9", 'health', timeout=5)
+
+
+def test_a_rewritten_features_file_is_picked_up_as_one_snapshot(server):
+    # 1. ARRANGE: warm the server, then replace the features with a shorter history
+    request(server.url, 'backtest', {'save': False})
+    session = server.session
+    build_features(make_synthetic_universe(3, 300, seed=4)).to_parquet(session.features_path)
+
+    # 2. ACT
+    matrices, prices = session.ensure_loaded()
+    reply = request(server.url, 'backtest', {'save': False})
+
+    # 3. ASSERT: the matrices and prices of a request always come from the same load
+    assert matrices['Close'].shape == prices.shape == (reply['days'], 3)
+    assert session.ensure_loaded()[1] is prices
+
+
+def test_concurrent_requests_are_counted_and_saved_atomically(server):
+    # 1. ACT: eight clients save the same strategy's results at once
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        replies = list(pool.map(lambda _: request(server.url, 'backtest', {}), range(8)))
+
+    # 2. ASSERT
+    assert request(server.url, 'health')['requests'] == 8
+    saved = Path(replies[0]['saved'])
+    assert len(pd.read_parquet(saved)) == replies[0]['days']
+    assert not list(saved.parent.glob("*.tmp"))
+
+
+def test_cli_startup_does_not_import_the_data_stack():
+    # The thin client path must not pay for pandas / yfinance before a command runs
+    code = (
+        "import sys, alpha_platform.cli; "
+        "print(sorted(m for m in ('pandas', 'numpy', 'yfinance') if m in sys.modules))"
+    )
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert out.stdout.strip() == "[]"
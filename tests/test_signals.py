@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from alpha_platform.backtest.engine import prepare_prices, run_iterative_backtest, run_wide_backtest
+from alpha_platform.signals.baselines import STRATEGIES, strategy_weights
+
+
+def make_feature_frame(n_days: int = 60, seed: int = 11) -> pd.DataFrame:
+    """
+    Builds a long-format features frame where one ticker starts late (missing Date x Ticker cells).
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2026-01-01", periods=n_days, freq="B")
+    frames = []
+    for i, ticker in enumerate(["AAA", "BBB", "CCC"]):
+        close = 20 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+        sma_ratio = rng.normal(1.0, 0.05, n_days)
+        sma_ratio[:5] = np.nan
+        frame = pd.DataFrame({"Date": dates, "Ticker": ticker, "Close": close, "sma_ratio_20_200": sma_ratio})
+        frames.append(frame.iloc[15 * i // 2:])
+    return pd.concat(frames, ignore_index=True)
+
+
+def reference_trend_weights(df: pd.DataFrame, threshold: float = 1.0) -> pd.Series:
+    """The original long-format rule: 1/N over the bullish tickers of each day."""
+    is_bullish = df['sma_ratio_20_200'] > threshold
+    bullish_count = is_bullish.groupby(df['Date']).transform('sum')
+    return pd.Series(np.where(is_bullish & (bullish_count > 0), 1.0 / bullish_count, 0.0))
+
+
+def test_long_adapter_matches_original_long_rule():
+    """
+    The long-format adapter over the wide API must reproduce the original per-row weights.
+    """
+    # 1. ARRANGE
+    df = make_feature_frame()
+
+    # 2. ACT
+    out = STRATEGIES["trend"](df)
+
+    # 3. ASSERT
+    np.testing.assert_array_equal(out['target_weight'].to_numpy(), reference_trend_weights(df).to_numpy())
+
+
+def test_wide_weights_backtest_equals_long_path():
+    """
+    Feeding wide weights straight into the engine must equal the long -> pivot path exactly.
+    """
+    # 1. ARRANGE
+    df = make_feature_frame()
+
+    for strategy in STRATEGIES:
+        # 2. ACT
+        weights = strategy_weights(df, strategy)
+        wide = run_wide_backtest(prepare_prices(df), weights, cost_bps=10.0)
+        long = run_iterative_backtest(STRATEGIES[strategy](df), cost_bps=10.0)
+
+        # 3. ASSERT
+        pd.testing.assert_frame_equal(wide, long, check_exact=True)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from alpha_platform.data.store import append_raw_data
+from alpha_platform.features.builder import build_features
+from alpha_platform.features.streaming import build_features_streaming, plan_batches
+
+
+def make_raw_frame(n_tickers: int = 7, n_days: int = 260) -> pd.DataFrame:
+    rng = np.random.default_rng(9)
+    dates = pd.bdate_range(start="2024-01-01", periods=n_days)
+    frames = []
+    for i in range(n_tickers):
+        close = 10 * np.exp(np.cumsum(rng.normal(0, 0.01, n_days)))
+        frames.append(pd.DataFrame({"Date": dates, "Ticker": f"T{i}", "Close": close, "Volume": 1.0}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_streaming_build_matches_in_memory_build(tmp_path):
+    """
+    Proves the batched out-of-core build produces the same features as build_features,
+    from both the partitioned raw store and a legacy monolithic file.
+    """
+    # 1. ARRANGE
+    raw_df = make_raw_frame()
+    append_raw_data(raw_df, tmp_path / "store" / "universe_daily")
+    (tmp_path / "legacy").mkdir()
+    raw_df.to_parquet(tmp_path / "legacy" / "universe_daily.parquet", index=False)
+    expected = build_features(raw_df).reset_index(drop=True)
+
+    for source in ["store", "legacy"]:
+        # 2. ACT: A tiny budget forces one or two tickers per batch
+        out_path = tmp_path / f"features_{source}.parquet"
+        n_rows = build_features_streaming(tmp_path / source, out_path, memory_budget_mb=0.05)
+
+        # 3. ASSERT
+        streamed = pd.read_parquet(out_path).sort_values(["Ticker", "Date"]).reset_index(drop=True)
+        assert n_rows == len(raw_df)
+        assert len(list(out_path.glob("part-*.parquet"))) > 1
+        pd.testing.assert_frame_equal(streamed[expected.columns], expected, check_dtype=False)
+
+
+def test_plan_batches_respects_budget():
+    row_counts = {"A": 100, "B": 100, "C": 300, "D": 50}
+    batches = plan_batches(row_counts, bytes_per_row=10, memory_budget_bytes=2500)
+
+    assert batches == [["A", "B"], ["C"], ["D"]]
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from alpha_platform.backtest.engine import run_iterative_backtest
+from alpha_platform.backtest.sweep import run_sweep, summarize_sweep
+from alpha_platform.signals.baselines import STRATEGIES
+
+
+def make_feature_frame(n_days: int = 80, seed: int = 3) -> pd.DataFrame:
+    """
+    Builds a long-format features frame with the columns the baseline strategies read.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2026-01-01", periods=n_days, freq="B")
+    frames = []
+    for ticker in ["AAA", "BBB", "CCC", "DDD"]:
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+        sma_ratio = rng.normal(1.0, 0.05, n_days)
+        sma_ratio[:10] = np.nan  # warm-up period: not yet eligible
+        frames.append(pd.DataFrame(
+            {"Date": dates, "Ticker": ticker, "Close": close, "sma_ratio_20_200": sma_ratio}
+        ))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_sweep_matches_individual_backtests_exactly():
+    """
+    Every scenario of the batched sweep must equal the corresponding single backtest.
+    """
+    # 1. ARRANGE
+    df = make_feature_frame()
+    costs = [0.0, 5.0, 25.0]
+    capitals = [10_000.0, 1_000_000.0]
+
+    # 2. ACT
+    results = run_sweep(df, ["equal_weight", "trend"], costs, capitals)
+
+    # 3. ASSERT
+    assert results['scenario_id'].nunique() == 2 * 3 * 2
+    for (strategy, cost, capital), scenario in results.groupby(['strategy', 'cost_bps', 'initial_capital']):
+        expected = run_iterative_backtest(STRATEGIES[strategy](df), initial_capital=capital, cost_bps=cost)
+        actual = scenario.set_index('Date')[expected.columns]
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True, check_names=False)
+
+
+def test_summarize_sweep_has_one_row_per_scenario():
+    results = run_sweep(make_feature_frame(), ["trend"], [1.0, 2.0, 3.0])
+    summary = summarize_sweep(results)
+
+    assert len(summary) == 3
+    # Higher costs can only hurt an otherwise identical strategy
+    assert summary['total_return'].is_monotonic_decreasing
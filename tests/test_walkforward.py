@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import Ridge
+
+from alpha_platform.bench.synthetic import make_synthetic_universe
+from alpha_platform.features.builder import build_features
+from alpha_platform.models.walkforward import (
+    build_design,
+    make_folds,
+    predictions_to_weights,
+    run_walk_forward,
+    solve_ridge,
+    sufficient_statistics,
+)
+
+FEATURES = ['return_1d', 'return_5d', 'volatility_20d', 'sma_ratio_20_50']
+
+
+@pytest.fixture(scope="module")
+def features_df() -> pd.DataFrame:
+    raw = make_synthetic_universe(12, 320, missing_frac=0.05, seed=4)
+    return build_features(raw, FEATURES)
+
+
+def test_make_folds_expanding_and_rolling():
+    expanding = make_folds(300, train_days=100, test_days=60)
+    rolling = make_folds(300, train_days=100, test_days=60, expanding=False)
+
+    assert [(f.test_start, f.test_end) for f in expanding] == [(100, 160), (160, 220), (220, 280), (280, 300)]
+    assert all(f.train_start == 0 and f.train_end == f.test_start for f in expanding)
+    assert all(f.train_end - f.train_start == 100 for f in rolling)
+
+
+def test_incremental_ridge_matches_direct_fit(features_df):
+    """
+    Coefficients solved from cumulative X'X / X'y must equal a from-scratch fit on the window.
+    """
+    # 1. ARRANGE
+    design = build_design(features_df, FEATURES)
+    cum_gram, cum_xty = sufficient_statistics(design)
+    start, end, alpha = 40, 200, 0.5
+
+    # 2. ACT
+    coef = solve_ridge(cum_gram[end] - cum_gram[start], cum_xty[end] - cum_xty[start], alpha)
+
+    # 3. ASSERT: standardized ridge with penalty alpha * n, mapped back to raw units
+    rows = design.valid & (design.label_pos >= start) & (design.label_pos < end)
+    X, y = design.X[rows, 1:], design.y[rows]
+    mean, scale = X.mean(axis=0), X.std(axis=0)
+    direct = Ridge(alpha=alpha * len(y)).fit((X - mean) / scale, y)
+    beta = direct.coef_ / scale
+    np.testing.assert_allclose(coef[1:], beta, rtol=1e-7)
+    np.testing.assert_allclose(coef[0], direct.intercept_ - mean @ beta, rtol=1e-7, atol=1e-12)
+
+
+def test_fold_training_never_sees_test_period_prices(features_df):
+    """
+    Changing prices from a fold's first test day onward must not change that fold's model:
+    every training label is realized strictly before the test block starts.
+    """
+    # 1. ARRANGE
+    params = {'features': FEATURES, 'horizon': 5, 'train_days': 120, 'test_days': 50, 'workers': 1}
+    baseline = run_walk_forward(features_df, **params)
+    fold = baseline.folds[1]
+    cutoff = build_design(features_df, FEATURES).calendar[fold.test_start]
+
+    shocked = features_df.copy()
+    future = shocked['Date'] >= cutoff
+    shocked.loc[future, 'Close'] *= np.exp(np.random.default_rng(0).normal(0, 0.5, future.sum()))
+
+    # 2. ACT
+    result = run_walk_forward(shocked, **params)
+
+    # 3. ASSERT
+    pd.testing.assert_series_equal(result.coefficients.loc[1], baseline.coefficients.loc[1])
+    assert not np.allclose(result.coefficients.loc[2], baseline.coefficients.loc[2])
+
+
+def test_parallel_folds_are_deterministic_and_feed_the_engine(features_df):
+    serial = run_walk_forward(features_df, FEATURES, train_days=120, test_days=50, workers=1)
+    parallel = run_walk_forward(features_df, FEATURES, train_days=120, test_days=50, workers=4)
+    pd.testing.assert_frame_equal(serial.predictions, parallel.predictions)
+
+    weights = predictions_to_weights(parallel.predictions)
+    assert weights.index.min() == parallel.predictions['Date'].min()
+    np.testing.assert_allclose(weights.sum(axis=1).where(lambda s: s > 0).dropna(), 1.0)